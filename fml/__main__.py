@@ -1,6 +1,26 @@
 from .runtime import LuaState
 import sys
 
-state = LuaState()
-state.loadlibs()
-state.loadfile(sys.argv[1])(sys.argv[2:])
+
+def compile_stats(filenames):
+    from .compile import compile, CompileStats
+    for filename in filenames:
+        with open(filename, 'rb') as f:
+            source = f.read()
+        stats = CompileStats()
+        compile(source, filename, stats=stats)
+        print(filename)
+        print(stats.format())
+
+
+def main(argv):
+    if argv[:1] == ['--compile-stats']:
+        compile_stats(argv[1:])
+        return
+    state = LuaState()
+    state.loadlibs()
+    state.loadfile(argv[0])(argv[1:])
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,59 @@
+"""Compile a large generated chunk and report where the time goes
+
+    $ python3 -m fml.bench.asm [lines]
+"""
+
+import sys
+from time import perf_counter
+from ..compile import LuaScanner, LuaDescentParser, ScopeVisitor, CodegenVisitor
+from ..compile.asm import Assembler
+
+
+def generate(lines):
+    chunk = []
+    for i in range(lines // 5):
+        chunk.append(
+            f"do\n"
+            f"  local x = {i}\n"
+            f"  if x < 50 then x = x + 1 else x = x - 1 end\n"
+            f"  while x > 100 do x = x - 1 end\n"
+            f"end\n")
+    return ''.join(chunk).encode()
+
+
+def main(lines=100000):
+    text = generate(lines)
+    filename = '<bench>'
+
+    build = Assembler.build
+    elapsed = 0.0
+    def timed_build(self, *args):
+        nonlocal elapsed
+        start = perf_counter()
+        try:
+            return build(self, *args)
+        finally:
+            elapsed += perf_counter() - start
+    Assembler.build = timed_build
+
+    try:
+        start = perf_counter()
+        node = LuaDescentParser(filename, text).parse(LuaScanner(filename).tokenize(text))
+        parsed = perf_counter()
+        ScopeVisitor(filename, text).visit(node, None)
+        scoped = perf_counter()
+        code = CodegenVisitor(filename).visit(node)
+        done = perf_counter()
+    finally:
+        Assembler.build = build
+
+    print(f"lines:    {lines}")
+    print(f"bytecode: {len(code.co_code)} bytes")
+    print(f"parse:    {parsed - start:.3f}s")
+    print(f"scope:    {scoped - parsed:.3f}s")
+    print(f"codegen:  {done - scoped - elapsed:.3f}s")
+    print(f"assemble: {elapsed:.3f}s")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""Run loops reading globals and report the time per iteration
+
+    $ python3 -m fml.bench.globals [iterations]
+
+Every write to the environment invalidates the cached lookups, so the
+last loop, which also assigns a global, shows the cost of a miss.
+"""
+
+import sys
+from time import perf_counter
+from ..runtime import LuaState
+
+
+LOOPS = [
+    ("read", b"""
+local n = ...
+local s = 0
+for i = 1, n do s = s + a * b - c end
+return s
+"""),
+    ("call", b"""
+local n = ...
+local s = 0
+for i = 1, n do s = s + f(i) end
+return s
+"""),
+    ("write", b"""
+local n = ...
+for i = 1, n do total = total + a end
+return total
+"""),
+]
+
+SETUP = b"a, b, c, total = 1, 2, 3, 0; function f(x) return x end"
+
+
+def measure(func, n, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        func(n)
+        elapsed = perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main(n=1000000):
+    state = LuaState()
+    state.loadlibs()
+    state.load(SETUP)()
+    for name, source in LOOPS:
+        elapsed = measure(state.load(source), n)
+        print(f"{name:6} {elapsed * 1e9 / n:7.1f} ns/iteration")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
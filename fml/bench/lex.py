@@ -0,0 +1,50 @@
+"""Tokenize a large generated table dump with both lexers and report MB/s
+
+    $ python3 -m fml.bench.lex [megabytes]
+"""
+
+import sys
+from time import perf_counter
+from ..compile import LuaLexer, LuaScanner
+
+
+def generate(size):
+    chunk = ["return {\n"]
+    total = 0
+    i = 0
+    while total < size:
+        line = (
+            f"  {{id = {i}, name = \"item{i}\", price = {i * 0.25}, "
+            f"tags = {{'a', 'b', [[c]]}}, enabled = {'true' if i % 2 else 'false'}}}, -- row {i}\n")
+        chunk.append(line)
+        total += len(line)
+        i += 1
+    chunk.append("}\n")
+    return ''.join(chunk)
+
+
+def measure(lexer, text, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        count = 0
+        for _ in lexer('<bench>').tokenize(text):
+            count += 1
+        elapsed = perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return count, best
+
+
+def main(megabytes=4):
+    text = generate(int(megabytes * 1024 * 1024))
+    size = len(text) / (1024 * 1024)
+    print(f"input:   {size:.1f} MB")
+    # LuaLexer is built on str patterns, LuaScanner reads the bytes of the chunk
+    for lexer, source in ((LuaLexer, text), (LuaScanner, text.encode())):
+        count, elapsed = measure(lexer, source)
+        print(f"{lexer.__name__ + ':':11}{count} tokens, {elapsed:.3f}s, {size / elapsed:.2f} MB/s")
+
+
+if __name__ == '__main__':
+    main(*map(float, sys.argv[1:]))
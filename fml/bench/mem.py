@@ -0,0 +1,45 @@
+"""Compile a large generated chunk and report the peak RSS of each phase
+
+    $ python3 -m fml.bench.mem [lines]
+
+The peak only grows, so each line shows the peak up to the end of that
+phase. Run it in a fresh process to compare representations.
+"""
+
+import sys
+from resource import getrusage, RUSAGE_SELF
+from ..compile import LuaScanner, LuaDescentParser, ScopeVisitor, CodegenVisitor
+
+
+def generate(lines):
+    chunk = []
+    for i in range(lines // 5):
+        chunk.append(
+            f"local function f{i}(a, b)\n"
+            f"  local x = {{id = {i}, name = 'item{i}', a, b}}\n"
+            f"  if a < b then return a + b * 2 else return #x end\n"
+            f"  while a > 100 do a = a - 1 end\n"
+            f"end\n")
+    return ''.join(chunk).encode()
+
+
+def peak():
+    # kilobytes on linux
+    return getrusage(RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(lines=100000):
+    text = generate(lines)
+    filename = '<bench>'
+    print(f"source:   {len(text) / (1024 * 1024):.1f} MB, {peak():.0f} MB")
+
+    node = LuaDescentParser(filename, text).parse(LuaScanner(filename).tokenize(text))
+    print(f"parse:    {peak():.0f} MB")
+    ScopeVisitor(filename, text).visit(node, None)
+    print(f"scope:    {peak():.0f} MB")
+    CodegenVisitor(filename).visit(node)
+    print(f"codegen:  {peak():.0f} MB")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -1,17 +1,54 @@
 from .parse import LuaLexer, LuaParser
-from .scope import ScopeVisitor, GotoVisitor
+from .scan import LuaScanner
+from .descent import LuaDescentParser
+from .scope import ScopeVisitor
+from .symbol import StreamSymbolTable
 from .codegen import CodegenVisitor
+from .stats import CompileStats, count_nodes
 
-def compile(text, filename):
+def compile(text, filename, optimize=True, parser=LuaDescentParser, stats=None, lazy=False):
     try:
-        lexer = LuaLexer(filename)
-        parser = LuaParser(filename, text)
+        lexer = LuaScanner(filename)
+        parser = parser(filename, text)
         scope = ScopeVisitor(filename, text)
-        goto = GotoVisitor(filename, text)
-        codegen = CodegenVisitor(filename)
-        node = parser.parse(lexer.tokenize(text))
-        scope.visit(node, None)
-        goto.visit(node)
-        return codegen.visit(node)
+        codegen = CodegenVisitor(filename, optimize, stats, lazy)
+        if stats is None:
+            node = parser.parse(lexer.tokenize(text))
+            scope.visit(node, None)
+            return codegen.visit(node)
+
+        # tokens are scanned ahead, to time the lexer on its own
+        with stats.phase('lex'):
+            tokens = list(lexer.tokenize(text))
+        with stats.phase('parse'):
+            node = parser.parse(tokens)
+        with stats.phase('scope'):
+            scope.visit(node, None)
+        with stats.phase('codegen'):
+            code = codegen.visit(node)
+        stats.tokens += len(tokens)
+        stats.nodes += count_nodes(node)
+        return code
+    except SyntaxError as e:
+        raise e.with_traceback(None)
+
+
+def compile_stream(text, filename, optimize=True, lazy=False):
+    """compile a chunk one top-level statement at a time
+
+    Each statement is scanned, parsed, checked and emitted before the
+    next one is read, so only the tree of the current statement is
+    kept. Locals of the chunk live in cells, as their captures are not
+    known in advance.
+    """
+    try:
+        lexer = LuaScanner(filename)
+        parser = LuaDescentParser(filename, text)
+        scope = ScopeVisitor(filename, text)
+        codegen = CodegenVisitor(filename, optimize, lazy=lazy)
+        symtable = scope.chunk_symtable(StreamSymbolTable)
+        nodes = parser.statements(lexer.tokenize(text))
+        nodes = scope.visit_stream(nodes, symtable)
+        return codegen.visit_stream(nodes, symtable)
     except SyntaxError as e:
         raise e.with_traceback(None)
@@ -4,8 +4,13 @@ from types import CodeType
 
 COMPILER_FLAGS = {f"CO_{v}":k for k, v in COMPILER_FLAG_NAMES.items()}
 
+EXTENDED_ARG = opmap["EXTENDED_ARG"]
+JUMP_ABSOLUTE = opmap["JUMP_ABSOLUTE"]
+RETURN_VALUE = opmap["RETURN_VALUE"]
+
 class Instruction:
     offset = 0
+    size = 0
 
     def __init__(self, opcode, arg):
         self.opcode = opcode
@@ -16,29 +21,42 @@ class Instruction:
 
 class Label:
     offset = 0
+    size = 0
     stacksize = None
 
 class LineNumber:
     offset = 0
+    size = 0
 
     def __init__(self, n):
         self.n = n
 
 
+def constant_key(c):
+    t = type(c)
+    if t is float:
+        # keep 0.0 and -0.0 apart, and let every nan share one slot
+        return (t, c.hex())
+    if t is tuple or t is frozenset:
+        return (t, t(constant_key(x) for x in c))
+    if t in (type(None), bool, int, str, bytes):
+        return (t, c)
+    return (t, id(c))
+
 def get_constants(insts):
     constants = []
+    slots = {}
     for inst in insts:
         if not isinstance(inst, Instruction):
             continue
         if inst.opcode not in hasconst:
             continue
-        for i, c in enumerate(constants):
-            if inst.arg is c:
-                inst.slot = i
-                break
-        else:
-            inst.slot = len(constants)
+        key = constant_key(inst.arg)
+        slot = slots.get(key)
+        if slot is None:
+            slot = slots[key] = len(constants)
             constants.append(inst.arg)
+        inst.slot = slot
 
     return tuple(constants)
 
@@ -49,62 +67,62 @@ def extended_length(n):
         count += 1
     return count
 
-def get_arg(inst, offset):
+def size_of_arg(arg):
+    return 2 * (extended_length(arg >> 8) + 1)
+
+def get_arg(inst):
     if inst.opcode in hasjabs:
         return inst.arg.offset
     elif inst.opcode in hasjrel:
-        arg = inst.arg.offset - offset
-        if arg < 0:
-            return 0
-        length = 2 * (extended_length(arg >> 8) + 1)
-        arg -= length
-        return 0 if arg < 0 else arg
+        return inst.arg.offset - inst.offset - inst.size
     elif inst.opcode in hasconst:
         return inst.slot
     else:
         return inst.arg
 
-def length_of_inst(inst, offset):
-    if not isinstance(inst, Instruction):
-        return 0
-    arg = get_arg(inst, offset)
-    return 2 * (extended_length(arg >> 8) + 1)
-
-def validate_offset(insts):
-    offset = 0
-    for inst in insts:
-        if inst.offset != offset:
-            return False
-        # assert validate_arg(inst)
-        offset += length_of_inst(inst, offset)
-    return True
-
-def assign_offset(insts):
-    offset = 0
-    for inst in insts:
-        inst.offset = offset
-        offset += length_of_inst(inst, offset)
-
-def extend_arg(insts):
+def resolve_offsets(insts):
+    # only jumps depend on offsets. they start short and grow when
+    # their target moves out of reach, which may push other targets
+    # further, so relax until no jump grows. sizes never shrink, so
+    # this ends after a pass or two.
+    jumps = []
     for inst in insts:
         if not isinstance(inst, Instruction):
             continue
-        arg = get_arg(inst, inst.offset)
-        length = length_of_inst(inst, inst.offset)//2
-        if length == 0:
-            continue
-        for i in range(length, 1, -1):
-            yield Instruction(opmap["EXTENDED_ARG"], (arg >> 8 * i) & 0xFF)
-        yield Instruction(inst.opcode, (arg & 0xFF))
-
-def resolve_offsets(insts):
-    while not validate_offset(insts):
-        assign_offset(insts)
+        if inst.opcode in hasjabs or inst.opcode in hasjrel:
+            inst.size = 2
+            jumps.append(inst)
+        else:
+            inst.size = size_of_arg(get_arg(inst))
+
+    while True:
+        offset = 0
+        for inst in insts:
+            inst.offset = offset
+            offset += inst.size
+
+        grown = False
+        for inst in jumps:
+            size = size_of_arg(get_arg(inst))
+            if size > inst.size:
+                inst.size = size
+                grown = True
+        if not grown:
+            break
 
 def assemble_code(insts):
-    return b''.join(
-        bytes([inst.opcode, inst.arg if inst.opcode >= HAVE_ARGUMENT else 0])
-        for inst in extend_arg(insts))
+    code = bytearray()
+    for inst in insts:
+        if not isinstance(inst, Instruction):
+            continue
+        arg = get_arg(inst) if inst.opcode >= HAVE_ARGUMENT else 0
+        # pad with EXTENDED_ARG 0 when a jump kept a larger size
+        for i in range(inst.size // 2 - 1, 0, -1):
+            code.append(EXTENDED_ARG)
+            code.append((arg >> 8 * i) & 0xFF)
+        code.append(inst.opcode)
+        code.append(arg & 0xFF)
+    return bytes(code)
 
 def iter_lnotab(insts, firstlineno):
     last = firstlineno
@@ -159,18 +177,23 @@ def assemble_lnotab(insts, firstlineno):
     return bytes(encode_lnotab(iter_lnotab(insts, firstlineno), firstlineno))
 
 _stack_effect = {
+    "FOR_ITER": (1, -1),
+    "JUMP_IF_FALSE_OR_POP": (-1, 0),
     "JUMP_IF_TRUE_OR_POP": (-1, 0),
     "POP_JUMP_IF_FALSE": (-1, -1),
     "POP_JUMP_IF_TRUE": (-1, -1)
 }
 
+_jump_effect = {opmap[name]: effect for name, effect in _stack_effect.items()}
+
 def resolve_stacksize(insts):
+    labels = {inst: i for i, inst in enumerate(insts) if isinstance(inst, Label)}
     max_stacksize = 0
     pending = [(0,0)]
 
     while pending:
-        (i, stacksize), *pending = pending
-        inst = insts[i]        
+        i, stacksize = pending.pop()
+        inst = insts[i]
         if isinstance(inst, Label):
             if inst.stacksize is None:
                 inst.stacksize = stacksize
@@ -188,43 +211,60 @@ def resolve_stacksize(insts):
                     inst.stacksize = stacksize
                 assert inst.stacksize == stacksize
             elif isinstance(inst, Instruction):
-                if inst.opcode == opmap["RETURN_VALUE"]:
+                opcode = inst.opcode
+                if opcode == RETURN_VALUE:
                     assert stacksize == 1
                     break
-                if inst.opcode == opmap["JUMP_ABSOLUTE"]:
-                    pending.append((insts.index(inst.arg), stacksize))
+                if opcode == JUMP_ABSOLUTE:
+                    pending.append((labels[inst.arg], stacksize))
                     break
 
-                if inst.opcode in hasconst:
-                    stacksize += stack_effect(inst.opcode, inst.slot)
-                elif inst.opcode < HAVE_ARGUMENT:
-                    stacksize += stack_effect(inst.opcode)
-                elif inst.opcode not in hasjrel and inst.opcode not in hasjabs:
-                    stacksize += stack_effect(inst.opcode, inst.arg)
-                else:
-                    notjump, jump = _stack_effect[opname[inst.opcode]]
+                if opcode in _jump_effect:
+                    notjump, jump = _jump_effect[opcode]
                     jump += stacksize
-                    pending.append((insts.index(inst.arg), jump))
+                    pending.append((labels[inst.arg], jump))
                     max_stacksize = max(jump, max_stacksize)
                     stacksize += notjump
+                elif opcode < HAVE_ARGUMENT:
+                    stacksize += stack_effect(opcode)
+                elif opcode in hasconst:
+                    stacksize += stack_effect(opcode, inst.slot)
+                else:
+                    stacksize += stack_effect(opcode, inst.arg)
+
+                if stacksize > max_stacksize:
+                    max_stacksize = stacksize
 
             i += 1
-            max_stacksize = max(stacksize, max_stacksize)
 
     return max_stacksize
 
 class Assembler:
 
-    def __init__(self):
+    def __init__(self, optimize=False, stats=None):
         self.insts = []
-
-    def build(self, argcount, names, varnames, filename, name, firstlineno, freevars, cellvars):
+        self.optimize = optimize
+        self.stats = stats
+
+    def build(self, *args, **kwargs):
+        if self.stats is None:
+            return self.assemble(*args, **kwargs)
+        with self.stats.phase('assemble'):
+            code = self.assemble(*args, **kwargs)
+        self.stats.add_code(code, self.insts)
+        return code
+
+    def assemble(self, argcount, names, varnames, filename, name, firstlineno, freevars, cellvars, kwonlyargcount=0):
         flags = self.CO_VARARGS | self.CO_OPTIMIZED | self.CO_NEWLOCALS
         if not freevars and not cellvars:
             flags |= self.CO_NOFREE
         elif freevars:
             flags |= self.CO_NESTED
 
+        if self.optimize:
+            from .peephole import optimize
+            self.insts = optimize(self.insts)
+
         constants = get_constants(self.insts)
         resolve_offsets(self.insts)
 
@@ -234,7 +274,7 @@ class Assembler:
 
         return CodeType(
             argcount,
-            0,
+            kwonlyargcount,
             len(varnames) + len(cellvars),
             stacksize,
             flags,
@@ -255,11 +295,11 @@ class Assembler:
     def set_lineno(self, node):
         self.emit(LineNumber(node.lineno))
 
-    def __getattribute__(self, name):
+    def __getattr__(self, name):
         if name in opmap:
             def emit(arg=0):
                 self.emit(Instruction(opmap[name], arg))
             return emit
         if name in COMPILER_FLAGS:
             return COMPILER_FLAGS[name]
-        return object.__getattribute__(self, name)
+        raise AttributeError(name)
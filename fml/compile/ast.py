@@ -2,17 +2,43 @@ from dataclasses import dataclass
 from typing import NamedTuple, List, Union
 
 class MatchDescriptor(dict):
+    """methods of a visitor by the type of node they handle
+
+    The dispatch function is bound once per visitor and cached on it.
+    A node type without a method of its own uses the method of its
+    nearest base class.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        # types looked up through their bases, not inherited by subclasses
+        self.resolved = set()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __missing__(self, type):
+        for base in type.__mro__[1:]:
+            if dict.__contains__(self, base):
+                func = self[type] = dict.__getitem__(self, base)
+                self.resolved.add(type)
+                return func
+        raise KeyError(type)
 
     def __get__(self, instance, owner):
-        def wrapper(node, *args, **kwargs):
-            return self[type(node)](instance, node, *args, **kwargs)
-        return wrapper
+        if instance is None:
+            return self
+        table = self
+        def dispatch(node, *args, **kwargs):
+            return table[type(node)](instance, node, *args, **kwargs)
+        instance.__dict__[self.name] = dispatch
+        return dispatch
 
 
 class VisitorMetaDict(dict):
     def __setitem__(self, name, value):
         if isinstance(value, MatchDescriptor):
-            value.update(self.get(name, {})) 
+            value.update(self.get(name, {}))
         super().__setitem__(name, value)
 
 class VisitorMeta(type):
@@ -29,14 +55,32 @@ class VisitorMeta(type):
 
     def __new__(self, name, bases, attrs):
         attrs.pop("_")
+        # methods of the base classes the class does not override
+        for attr, value in attrs.items():
+            if isinstance(value, MatchDescriptor):
+                for base in bases:
+                    inherited = getattr(base, attr, None)
+                    if isinstance(inherited, MatchDescriptor):
+                        for t, func in inherited.items():
+                            if t not in inherited.resolved:
+                                value.setdefault(t, func)
         return type.__new__(self, name, bases, attrs)
 
 class Visitor(metaclass=VisitorMeta):
     pass
 
 
+class NodeMeta(type):
+    """nodes have slots for their fields and for the attributes the
+    compiler passes set on them, listed in _extra"""
+
+    def __new__(self, name, bases, attrs):
+        attrs['__slots__'] = tuple(attrs.get('__annotations__', ())) + attrs.get('_extra', ())
+        return type.__new__(self, name, bases, attrs)
+
+
 @dataclass
-class Node:
+class Node(metaclass=NodeMeta):
     lineno: int
     index: int
 
@@ -70,7 +114,9 @@ class UnaryOp(Node):
 
 @dataclass
 class Name(Var):
-    id: str
+    id: bytes
+
+    _extra = ('_env', '_version', '_global', '_class', '_luatable', 'symbol')
 
 @dataclass
 class Parameters(Node):
@@ -81,6 +127,8 @@ class Parameters(Node):
 class File(Node):
     body: List[Statement]
 
+    _extra = ('symtable',)
+
 @dataclass
 class Assign(Statement):
     value: List[Expression]
@@ -97,11 +145,15 @@ class CallStatement(Statement):
 
 @dataclass
 class Label(Statement):
-    name: str
+    name: bytes
+
+    _extra = ('_nlocals', '_label')
 
 @dataclass
 class Goto(Statement):
-    target: str
+    target: bytes
+
+    _extra = ('_nlocals', '_label')
 
 @dataclass
 class Block(Statement):
@@ -131,24 +183,32 @@ class For(Statement):
     target: Name
     body: Statement
 
+    _extra = ('_forprep', '_loopvar')
+
 @dataclass
 class ForEach(Statement):
     iter: List[Expression]
     target: List[Name]
     body: List[Statement]
 
+    _extra = ('_loopvar',)
+
 @dataclass
 class Function(Statement):
     name: FuncName
     pars: Parameters
     body: List[Statement]
 
+    _extra = ('symtable',)
+
 @dataclass
 class FunctionLocal(Statement):
     name: FuncName
     pars: Parameters
     body: List[Statement]
 
+    _extra = ('symtable',)
+
 @dataclass
 class AssignLocal(Statement):
     value: List[Expression]
@@ -167,16 +227,22 @@ class Subscript(Var):
     value: Expression
     slice: Expression
 
+    _extra = ('_shape', '_values', '_index', '_class', '_luatable')
+
 @dataclass
 class Attribute(FuncName):
     value: Expression
     attr: Name
 
+    _extra = ('_shape', '_values', '_index', '_class', '_luatable')
+
 @dataclass
 class Method(FuncName):
     value: Expression
     method: Name
 
+    _extra = ('_shape', '_values', '_index', '_class', '_luatable')
+
 @dataclass
 class NIL(Expression):
     pass
@@ -191,15 +257,15 @@ class TRUE(Expression):
 
 @dataclass
 class Number(Expression):
-    n: str
+    n: bytes
 
 @dataclass
 class String(Expression):
-    s: str
+    s: bytes
 
 @dataclass
 class ELLIPSIS(Expression):
-    pass
+    _extra = ('symbol',)
 
 @dataclass
 class Field(Node):
@@ -210,18 +276,26 @@ class Field(Node):
 class Table(Expression):
     fields: List[Union[Field, Expression]]
 
+    _extra = ('_luatable',)
+
 @dataclass
 class Lambda(Expression):
     pars: Parameters
     body: List[Statement]
 
+    _extra = ('symtable',)
+
 @dataclass
 class BinOp(Expression):
     op: str
     left: Expression
     right: Expression
 
+    _extra = ('_op', '_class', '_number', '_int', '_wrap')
+
 @dataclass
 class UnaryOp(Expression):
     op: str
     operand: Expression
+
+    _extra = ('_op',)
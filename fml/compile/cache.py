@@ -0,0 +1,103 @@
+import os
+import marshal
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+from tempfile import NamedTemporaryFile
+from collections import OrderedDict
+
+
+def compiler_version():
+    # bytecode depends on the python version, on every compiler module and
+    # on lib/base.py, whose builtins and table layout it is generated against
+    digest = sha256(MAGIC_NUMBER)
+    dirname = os.path.dirname(__file__)
+    paths = [
+        os.path.join(dirname, name)
+        for name in sorted(os.listdir(dirname))
+        if name.endswith('.py')]
+    paths.append(os.path.join(dirname, os.pardir, 'lib', 'base.py'))
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+VERSION = compiler_version()
+
+
+class CodeCache:
+    """marshalled code objects of compiled chunks, one file per
+    (compiler version, filename, source)
+
+    A readonly cache never writes, so it can point at a directory
+    populated ahead of time.
+    """
+
+    suffix = '.fmlc'
+
+    def __init__(self, directory, readonly=False):
+        self.directory = directory
+        self.readonly = readonly
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, source, filename):
+        digest = sha256(VERSION)
+        for part in (filename, source):
+            digest.update(len(part).to_bytes(8, 'little'))
+            digest.update(part)
+        return os.path.join(self.directory, digest.hexdigest() + self.suffix)
+
+    def get(self, source, filename):
+        try:
+            with open(self.path(source, filename), 'rb') as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            code = None
+        if code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def put(self, source, filename, code):
+        if self.readonly:
+            return
+        data = marshal.dumps(code)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temporary file first, so concurrent readers
+            # never see a partial file
+            with NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False) as f:
+                f.write(data)
+            os.replace(f.name, self.path(source, filename))
+        except OSError:
+            pass
+
+
+class ChunkCache:
+    """least recently used code objects of loaded chunks, keyed on
+    (chunk, chunkname, mode)"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.codes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        code = self.codes.get(key)
+        if code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.codes.move_to_end(key)
+        return code
+
+    def put(self, key, code):
+        if self.maxsize <= 0:
+            return
+        self.codes[key] = code
+        while len(self.codes) > self.maxsize:
+            self.codes.popitem(last=False)
+            self.evictions += 1
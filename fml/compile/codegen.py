@@ -1,6 +1,8 @@
 from . import ast
-from .symbol import Local, Global, Free
+from .symbol import Symbol, Local, Global, Free
 from .asm import Assembler, Label
+from .lazy import Prototype
+from .scope import INLINE_OPS, INTEGER_OPS, LOGICAL_OPS
 from enum import Enum, auto
 
 class Context(Enum):
@@ -10,6 +12,25 @@ class Context(Enum):
 Load = Context.Load
 Store = Context.Store
 
+INLINE_BINARY = {
+    '+': 'BINARY_ADD',
+    '-': 'BINARY_SUBTRACT',
+    '*': 'BINARY_MULTIPLY'}
+
+INLINE_COMPARE = {
+    '<': 0, '<=': 1, '==': 2, '~=': 3, '>': 4, '>=': 5}
+
+# constants and their truth value
+CONSTANTS = {
+    ast.NIL: False, ast.FALSE: False,
+    ast.TRUE: True, ast.Number: True, ast.String: True}
+
+# expressions producing multiple values
+MULTI = (ast.ELLIPSIS, ast.Call)
+
+# constructors with more fields are built incrementally to keep the stack small
+MAX_BUILD_FIELDS = 16
+
 
 class CodegenVisitor(ast.Visitor):
 
@@ -25,24 +46,29 @@ class CodegenVisitor(ast.Visitor):
 
         getattr(asm, f'{context}_{scope}')(symbol.slot)
 
+    def visit_first(self, asm):
+        # TOS = (TOS or (None,))[0]
+        label = Label()
+        asm.JUMP_IF_TRUE_OR_POP(label)
+        asm.LOAD_CONST((None,))
+        asm.emit(label)
+        asm.LOAD_CONST(0)
+        asm.BINARY_SUBSCR()
+
     def visit_exp(self, node, asm):
         self.visit(node, asm, context=Load)
-        if type(node) in (ast.ELLIPSIS, ast.Call):
-            # TOS = TOS or (None,)
-            label = Label()
-            asm.JUMP_IF_TRUE_OR_POP(label)
-            asm.LOAD_CONST(None)
-            asm.BUILD_TUPLE(1)
-            asm.emit(label)
-            # TOS = TOS[0]
-            asm.LOAD_CONST(0)
-            asm.BINARY_SUBSCR()
+        if type(node) in MULTI:
+            self.visit_first(asm)
 
     def visit_explist(self, explist, asm):
-        if not explist or type(explist[-1]) not in (ast.ELLIPSIS, ast.Call):
+        if not explist:
+            asm.LOAD_CONST(())
+        elif type(explist[-1]) not in MULTI:
             for subnode in explist:
                 self.visit_exp(subnode, asm)
             asm.BUILD_TUPLE(len(explist))
+        elif len(explist) == 1:
+            self.visit(explist[0], asm, context=Load)
         else:
             for subnode in explist[:-1]:
                 self.visit_exp(subnode, asm)
@@ -50,116 +76,169 @@ class CodegenVisitor(ast.Visitor):
             self.visit(explist[-1], asm, context=Load)
             asm.BUILD_TUPLE_UNPACK(2)
 
-    def visit_assign(self, target, asm):
-        asm.LOAD_CONST(None)
-        asm.BUILD_TUPLE(1)
-        asm.LOAD_CONST(len(target))
-        asm.BINARY_MULTIPLY()
-        asm.BUILD_TUPLE_UNPACK(2)
-        for subnode in target:
-            asm.UNPACK_EX(1)
-            self.visit(subnode, asm, context=Store)
-        asm.POP_TOP()
+    def visit_store(self, target, asm):
+        if isinstance(target, Symbol):
+            self.visit_symbol(target, asm, context=Store)
+        else:
+            self.visit(target, asm, context=Store)
 
-    def visit_forloop(self, loopvar, target, body, asm):
-        f, s, var = loopvar
-        # local f, s, var = explist
-        asm.LOAD_CONST(None)
-        asm.BUILD_TUPLE(1)
-        asm.LOAD_CONST(3)
-        asm.BINARY_MULTIPLY()
-        asm.BUILD_TUPLE_UNPACK(2)
-        for symbol in loopvar:
-            asm.UNPACK_EX(1)
-            self.visit_symbol(symbol, asm, context=Store)
+    def visit_unpack(self, target, asm):
+        # target_1, ···, target_n = TOS + (None,) * n
+        asm.LOAD_CONST((None,) * len(target))
+        asm.BINARY_ADD()
+        asm.UNPACK_EX(len(target))
+        for subnode in target:
+            self.visit_store(subnode, asm)
         asm.POP_TOP()
 
-        # while true
-        l_before, l_after = Label(), Label()
-        asm.emit(l_before)
-        # local var_1, ···, var_n = f(s,var)
-        for symbol in loopvar:
-            self.visit_symbol(symbol, asm, context=Load)
-        asm.CALL_FUNCTION(2)
-        self.visit_assign(target, asm)
-
-        # if var_1 == nil then break
-        self.visit(target[0], asm, context=Load)
-        asm.LOAD_CONST(None)
-        asm.COMPARE_OP(8)
-        asm.POP_JUMP_IF_TRUE(l_after)
-
-        # var = var_1
-        self.visit(target[0], asm, context=Load)
-        self.visit_symbol(var, asm, context=Store)
-        self.visit(body, asm, break_target=l_after)
-        asm.JUMP_ABSOLUTE(l_before)
-        asm.emit(l_after)
+    def visit_assign(self, value, target, asm):
+        n = len(value)
+        if n and type(value[-1]) in MULTI and n < len(target):
+            for subnode in value[:-1]:
+                self.visit_exp(subnode, asm)
+            self.visit(value[-1], asm, context=Load)
+            self.visit_unpack(target[n-1:], asm)
+            for subnode in reversed(target[:n-1]):
+                self.visit_store(subnode, asm)
+            return
 
-    def visit_function(self, node, name, asm):
-        argcount = len(node.pars.value)
-        names, varnames, freenames, cellnames, freevars = node.symtable.get_slots()
+        # counts are known, no tuple is built
+        for subnode in value[:len(target)]:
+            self.visit_exp(subnode, asm)
+        for subnode in value[len(target):]:
+            self.visit(subnode, asm, context=Load)
+            asm.POP_TOP()
+        for _ in range(len(target) - n):
+            asm.LOAD_CONST(None)
+        for subnode in reversed(target):
+            self.visit_store(subnode, asm)
 
-        sub = Assembler()
+    def function_code(self, node, name, slots):
+        names, varnames, freenames, cellnames, _ = slots
+        sub = Assembler(self.optimize, self.stats)
         self.visit(node.body, sub, break_target=None)
-        sub.LOAD_CONST(None)
-        sub.BUILD_TUPLE(1)
+        sub.LOAD_CONST(())
         sub.RETURN_VALUE()
 
-        code = sub.build(
-            argcount,
+        return sub.build(
+            len(node.pars.value),
             names, varnames,
             self.filename, name,
             node.lineno, freenames, cellnames)
 
+    def visit_function(self, node, name, asm):
+        argcount = len(node.pars.value)
+        slots = node.symtable.get_slots()
+        freevars = slots[4]
+        if self.lazy:
+            prototype = Prototype(self, node, name, slots)
+            code = prototype.stub(self.filename, argcount, slots[2])
+        else:
+            code = self.function_code(node, name, slots)
+
+        # missing arguments are nil
+        flags = 0
+        if argcount:
+            asm.LOAD_CONST((None,) * argcount)
+            flags |= 1
         if freevars:
             for freevar in freevars:
                 asm.LOAD_CLOSURE(freevar.parent.slot)
             asm.BUILD_TUPLE(len(freevars))
-            asm.LOAD_CONST(code)
-            asm.LOAD_CONST(name)
-            asm.MAKE_FUNCTION(8)
-        else:
-            asm.LOAD_CONST(code)
-            asm.LOAD_CONST(name)
-            asm.MAKE_FUNCTION(0)
+            flags |= 8
+        asm.LOAD_CONST(code)
+        asm.LOAD_CONST(name)
+        asm.MAKE_FUNCTION(flags)
+        if self.lazy:
+            asm.LOAD_CONST(prototype.bind)
+            asm.ROT_TWO()
+            asm.CALL_FUNCTION(1)
 
     @_(list)
     def visit(self, node, asm, break_target):
         for subnode in node:
             self.visit(subnode, asm, break_target=break_target)
 
-    def to_boolean(self, asm):
-        l1, l2 = Label(), Label()
-        # if TOS is None: TOS = False
+    def number(self, node):
+        from ..lib.base import tonumber
+        return tonumber(None, node.n)
+
+    def is_boolean(self, node):
+        t = type(node)
+        if t is ast.TRUE or t is ast.FALSE:
+            return True
+        if t is ast.UnaryOp:
+            return node.op == 'not'
+        if t is ast.BinOp:
+            if node.op in INLINE_COMPARE:
+                return True
+            if node.op in ('and', 'or'):
+                return self.is_boolean(node.left) and self.is_boolean(node.right)
+        return False
+
+    def visit_falsy(self, asm):
+        # TOS = TOS is None or TOS is False
+        label = Label()
         asm.DUP_TOP()
         asm.LOAD_CONST(None)
         asm.COMPARE_OP(8)
-        asm.POP_JUMP_IF_FALSE(l1)
+        asm.POP_JUMP_IF_FALSE(label)
         asm.POP_TOP()
         asm.LOAD_CONST(False)
-        asm.emit(l1)
-        # if TOS is not False: TOS = True
-        asm.DUP_TOP()
+        asm.emit(label)
         asm.LOAD_CONST(False)
         asm.COMPARE_OP(8)
-        asm.POP_JUMP_IF_TRUE(l2)
-        asm.POP_TOP()
-        asm.LOAD_CONST(True)
-        asm.emit(l2)
 
-    @_(ast.File)
-    def visit(self, node):
-        names, varnames, freenames, cellnames, _ = node.symtable.get_slots()
-        asm = Assembler()
-        self.visit(node.body, asm, break_target=None)
+    def visit_test(self, node, asm, label, jump_if):
+        # jump to label if the truth value of node is jump_if
+        t = type(node)
+        if t is ast.UnaryOp and node.op == 'not':
+            self.visit_test(node.operand, asm, label, not jump_if)
+        elif t is ast.BinOp and node.op in ('and', 'or'):
+            if (node.op == 'or') == jump_if:
+                self.visit_test(node.left, asm, label, jump_if)
+                self.visit_test(node.right, asm, label, jump_if)
+            else:
+                l_skip = Label()
+                self.visit_test(node.left, asm, l_skip, not jump_if)
+                self.visit_test(node.right, asm, label, jump_if)
+                asm.emit(l_skip)
+        elif t in CONSTANTS:
+            if CONSTANTS[t] == jump_if:
+                asm.JUMP_ABSOLUTE(label)
+        else:
+            self.visit_exp(node, asm)
+            if not self.is_boolean(node):
+                self.visit_falsy(asm)
+                jump_if = not jump_if
+            if jump_if:
+                asm.POP_JUMP_IF_TRUE(label)
+            else:
+                asm.POP_JUMP_IF_FALSE(label)
+
+    def build_chunk(self, asm, slots, lineno):
+        names, varnames, freenames, cellnames, _ = slots
         asm.LOAD_CONST(True)
         asm.BUILD_TUPLE(1)
         asm.RETURN_VALUE()
         return asm.build(
             0, names, varnames,
             self.filename, 'main chunk',
-            node.lineno, freenames, cellnames)
+            lineno, freenames, cellnames)
+
+    def visit_stream(self, nodes, symtable):
+        # a StreamSymbolTable gives out slots while the chunk is visited
+        asm = Assembler(self.optimize, self.stats)
+        for node in nodes:
+            self.visit(node, asm, break_target=None)
+        return self.build_chunk(asm, symtable.get_slots(), 1)
+
+    @_(ast.File)
+    def visit(self, node):
+        slots = node.symtable.get_slots()
+        asm = Assembler(self.optimize, self.stats)
+        self.visit(node.body, asm, break_target=None)
+        return self.build_chunk(asm, slots, node.lineno)
 
     @_(ast.Function)
     def visit(self, node, asm, break_target):
@@ -169,12 +248,12 @@ class CodegenVisitor(ast.Visitor):
         elif isinstance(name, ast.Method):
             name = name.method
 
-        self.visit_function(node, node.name.id, node)
+        self.visit_function(node, name.id.decode(), asm)
         self.visit(node.name, asm, context=Store)
 
     @_(ast.FunctionLocal)
     def visit(self, node, asm, break_target):
-        self.visit_function(node, node.name.id, node)
+        self.visit_function(node, node.name.id.decode(), asm)
         self.visit(node.name, asm, context=Store)
 
     @_(ast.Lambda)
@@ -187,10 +266,8 @@ class CodegenVisitor(ast.Visitor):
 
     @_(ast.If)
     def visit(self, node, asm, break_target):
-        self.visit(node.test, asm)
-        self.to_boolean(asm)
         l_before, l_after = Label(), Label()
-        asm.POP_JUMP_IF_FALSE(l_before)
+        self.visit_test(node.test, asm, l_before, False)
         self.visit(node.body, asm, break_target=break_target)
         asm.JUMP_ABSOLUTE(l_after)
         asm.emit(l_before)
@@ -201,9 +278,7 @@ class CodegenVisitor(ast.Visitor):
     def visit(self, node, asm, break_target):
         l_before, l_after = Label(), Label()
         asm.emit(l_before)
-        self.visit(node.test, asm)
-        self.to_boolean(asm)
-        asm.POP_JUMP_IF_FALSE(l_after)
+        self.visit_test(node.test, asm, l_after, False)
         self.visit(node.body, asm, break_target=l_after)
         asm.JUMP_ABSOLUTE(l_before)
         asm.emit(l_after)
@@ -213,24 +288,62 @@ class CodegenVisitor(ast.Visitor):
         l_before, l_after = Label(), Label()
         asm.emit(l_before)
         self.visit(node.body, asm, break_target=l_after)
-        self.visit(node.test, asm)
-        self.to_boolean(asm)
-        asm.POP_JUMP_IF_FALSE(l_before)
+        self.visit_test(node.test, asm, l_before, False)
         asm.emit(l_after)
 
     @_(ast.For)
     def visit(self, node, asm, break_target):
+        f, s, var = node._loopvar
+        # f = forprep(start, stop, step)
         self.visit_symbol(node._forprep, asm, context=Load)
         self.visit_exp(node.start, asm)
         self.visit_exp(node.stop, asm)
         self.visit_exp(node.step, asm)
         asm.CALL_FUNCTION(3)
-        self.visit_forloop(node._loopvar, [node.target], node.body, asm)
+        self.visit_symbol(f, asm, context=Store)
+
+        # for target in f
+        l_before, l_after = Label(), Label()
+        asm.emit(l_before)
+        self.visit_symbol(f, asm, context=Load)
+        asm.FOR_ITER(l_after)
+        self.visit(node.target, asm, context=Store)
+        asm.POP_TOP()
+        self.visit(node.body, asm, break_target=l_after)
+        asm.JUMP_ABSOLUTE(l_before)
+        asm.emit(l_after)
 
     @_(ast.ForEach)
     def visit(self, node, asm, break_target):
-        self.visit_explist(node.iter, asm)
-        self.visit_forloop(node._loopvar, node.target, node.body, asm)
+        f, s, var = node._loopvar
+        # local f, s, var = explist
+        self.visit_assign(node.iter, node._loopvar, asm)
+
+        # while true
+        l_before, l_after = Label(), Label()
+        asm.emit(l_before)
+        # local var_1, ···, var_n = f(s,var)
+        for symbol in node._loopvar:
+            self.visit_symbol(symbol, asm, context=Load)
+        asm.CALL_FUNCTION(2)
+        if len(node.target) == 1:
+            self.visit_first(asm)
+            self.visit(node.target[0], asm, context=Store)
+        else:
+            self.visit_unpack(node.target, asm)
+
+        # if var_1 == nil then break
+        self.visit(node.target[0], asm, context=Load)
+        asm.LOAD_CONST(None)
+        asm.COMPARE_OP(8)
+        asm.POP_JUMP_IF_TRUE(l_after)
+
+        # var = var_1
+        self.visit(node.target[0], asm, context=Load)
+        self.visit_symbol(var, asm, context=Store)
+        self.visit(node.body, asm, break_target=l_after)
+        asm.JUMP_ABSOLUTE(l_before)
+        asm.emit(l_after)
 
     @_(ast.Goto)
     def visit(self, node, asm, break_target):
@@ -242,13 +355,11 @@ class CodegenVisitor(ast.Visitor):
 
     @_(ast.Assign)
     def visit(self, node, asm, break_target):
-        self.visit_explist(node.value, asm)
-        self.visit_assign(node.target, asm)
+        self.visit_assign(node.value, node.target, asm)
 
     @_(ast.AssignLocal)
     def visit(self, node, asm, break_target):
-        self.visit_explist(node.value, asm)
-        self.visit_assign(node.target, asm)
+        self.visit_assign(node.value, node.target, asm)
 
     @_(ast.Return)
     def visit(self, node, asm, break_target):
@@ -266,23 +377,302 @@ class CodegenVisitor(ast.Visitor):
 
     @_(ast.Call)
     def visit(self, node, asm, context=None):
-        self.visit_exp(node.func, asm)
+        func = node.func
         extra_args = 0
-        if isinstance(node.func, ast.Method):
+        if isinstance(func, ast.Method):
+            # the receiver is looked up once and passed as the first argument
+            self.visit_exp(func.value, asm)
+            asm.DUP_TOP()
+            self.visit_cached_field(func, func.method.id, asm)
+            asm.ROT_TWO()
             extra_args = 1
-        # FIXME for extra_arg
-        self.visit_explist(node.args.value, asm)
-        asm.CALL_FUNCTION_EX(0)
+        else:
+            self.visit_exp(func, asm)
+        args = node.args.value
+        if args and type(args[-1]) in MULTI:
+            if extra_args:
+                asm.BUILD_TUPLE(1)
+            self.visit_explist(args, asm)
+            if extra_args:
+                asm.BUILD_TUPLE_UNPACK(2)
+            asm.CALL_FUNCTION_EX(0)
+        else:
+            for subnode in args:
+                self.visit_exp(subnode, asm)
+            asm.CALL_FUNCTION(len(args) + extra_args)
+
+    def visit_isnumber(self, node, asm):
+        # TOS = type(TOS) in (int, float)
+        asm.LOAD_ATTR(node._class.slot)
+        self.visit_symbol(node._number, asm, context=Load)
+        asm.COMPARE_OP(6)
+
+    def visit_isint(self, node, asm):
+        # TOS = type(TOS) is int
+        asm.LOAD_ATTR(node._class.slot)
+        self.visit_symbol(node._int, asm, context=Load)
+        asm.COMPARE_OP(8)
+
+    def bounds(self, node):
+        # (upper, lower), the bounds an integer result of node can cross,
+        # or None when the result is never an integer
+        if node.op not in INTEGER_OPS:
+            return None
+        if type(node.right) is ast.Number:
+            c = self.number(node.right)
+            if node.op == '-':
+                c = -c
+        elif type(node.left) is ast.Number and node.op != '-':
+            c = self.number(node.left)
+        else:
+            return (True, True)
+        if type(c) is not int:
+            return None
+        if node.op == '*':
+            return (False, False) if c in (0, 1) else (True, True)
+        return (c > 0, c < 0)
+
+    def visit_wrap(self, node, asm, l_after, upper, lower, isint=True):
+        # TOS = wrap(TOS) if TOS is an integer that crossed a bound
+        from ..lib.base import MAXINTEGER, MININTEGER
+        if not upper and not lower:
+            return
+        if not isint:
+            asm.DUP_TOP()
+            self.visit_isint(node, asm)
+            asm.POP_JUMP_IF_FALSE(l_after)
+        l_wrap = Label()
+        if upper:
+            asm.DUP_TOP()
+            asm.LOAD_CONST(MAXINTEGER)
+            asm.COMPARE_OP(1)
+            if lower:
+                asm.POP_JUMP_IF_FALSE(l_wrap)
+            else:
+                asm.POP_JUMP_IF_TRUE(l_after)
+        if lower:
+            asm.DUP_TOP()
+            asm.LOAD_CONST(MININTEGER)
+            asm.COMPARE_OP(5)
+            asm.POP_JUMP_IF_TRUE(l_after)
+        asm.emit(l_wrap)
+        self.visit_symbol(node._wrap, asm, context=Load)
+        asm.ROT_TWO()
+        asm.CALL_FUNCTION(1)
+
+    def visit_inline(self, node, asm):
+        op = node.op
+        if op in INLINE_BINARY:
+            getattr(asm, INLINE_BINARY[op])()
+        else:
+            asm.COMPARE_OP(INLINE_COMPARE[op])
 
     @_(ast.BinOp)
     def visit(self, node, asm, context=None):
-        self.visit_symbol(node._op, asm, context=Load)
+        if node.op in LOGICAL_OPS:
+            # a and b: keep a if it is false, a or b: keep a if it is true
+            l_after = Label()
+            self.visit_exp(node.left, asm)
+            if self.is_boolean(node.left):
+                if node.op == 'and':
+                    asm.JUMP_IF_FALSE_OR_POP(l_after)
+                else:
+                    asm.JUMP_IF_TRUE_OR_POP(l_after)
+            else:
+                asm.DUP_TOP()
+                self.visit_falsy(asm)
+                if node.op == 'and':
+                    asm.POP_JUMP_IF_TRUE(l_after)
+                else:
+                    asm.POP_JUMP_IF_FALSE(l_after)
+                asm.POP_TOP()
+            self.visit_exp(node.right, asm)
+            asm.emit(l_after)
+            return
+
+        if node.op not in INLINE_OPS:
+            self.visit_symbol(node._op, asm, context=Load)
+            self.visit_exp(node.left, asm)
+            self.visit_exp(node.right, asm)
+            asm.CALL_FUNCTION(2)
+            return
+
+        left = type(node.left) is not ast.Number
+        right = type(node.right) is not ast.Number
+        if not left and not right:
+            from ..lib.base import BUILTINS
+            asm.set_lineno(node)
+            asm.LOAD_CONST(BUILTINS[f".b{node.op}"](self.number(node.left), self.number(node.right)))
+            return
+
+        if not self.generic:
+            leaves = self.int_leaves(node, [])
+            if leaves is not None:
+                self.visit_tree(node, leaves, asm, integer=True)
+                return
+            leaves = self.float_leaves(node, [])
+            if leaves is not None:
+                self.visit_tree(node, leaves, asm, integer=False)
+                return
+
+        # integers use the native operator and wrap around when they
+        # overflow, other numbers use it as is, everything else the event
+        bounds = self.bounds(node)
+        l_after = Label()
         self.visit_exp(node.left, asm)
-        self.visit_exp(node.right, asm)
+        if right:
+            self.visit_exp(node.right, asm)
+        if bounds is not None and not self.generic:
+            self.visit_guarded(node, asm, self.visit_isint, l_after, bounds)
+            bounds = None
+        # the fallback of a tree has a local that is not an integer, so it
+        # checks for numbers and then whether the result is an integer
+        self.visit_guarded(node, asm, self.visit_isnumber, l_after, bounds, isint=False)
+        if not right:
+            self.visit_exp(node.right, asm)
+        self.visit_symbol(node._op, asm, context=Load)
+        asm.ROT_THREE()
         asm.CALL_FUNCTION(2)
+        asm.emit(l_after)
+
+    def int_leaves(self, node, leaves):
+        # the locals of a tree of + - * whose leaves are locals and integer
+        # constants, or None when node is not such a tree
+        t = type(node)
+        if t is ast.BinOp and node.op in INTEGER_OPS:
+            if self.int_leaves(node.left, leaves) is None:
+                return None
+            return self.int_leaves(node.right, leaves)
+        if t is ast.UnaryOp and node.op == '-':
+            node = node.operand
+            t = type(node)
+        if t is ast.Number:
+            return leaves if type(self.number(node)) is int else None
+        if t is ast.Name and not node._env:
+            if all(leaf.symbol is not node.symbol for leaf in leaves):
+                leaves.append(node)
+            return leaves
+        return None
+
+    def float_leaves(self, node, leaves):
+        # the locals of a tree of + - * in which every operator has a float
+        # operand, so with numbers at the leaves no operator sees two
+        # integers, or None when node is not such a tree
+        if type(node) is not ast.BinOp or node.op not in INTEGER_OPS:
+            return None
+        floats = False
+        for subnode in (node.left, node.right):
+            t = type(subnode)
+            if t is ast.BinOp:
+                if self.float_leaves(subnode, leaves) is None:
+                    return None
+                floats = True
+                continue
+            if t is ast.UnaryOp and subnode.op == '-':
+                subnode = subnode.operand
+                t = type(subnode)
+            if t is ast.Number:
+                floats = floats or type(self.number(subnode)) is float
+            elif t is ast.Name and not subnode._env:
+                if all(leaf.symbol is not subnode.symbol for leaf in leaves):
+                    leaves.append(subnode)
+            else:
+                return None
+        return leaves if floats else None
+
+    def visit_tree(self, node, leaves, asm, integer):
+        # the locals are checked once and the tree runs on the native
+        # operators. when they are all integers the result wraps once at
+        # the root, which is the same modulo 2**64 as wrapping every
+        # operation. when they are numbers, integer results of an integer
+        # tree wrap after each operation. anything else goes through every
+        # operator on its own
+        l_number, l_generic, l_after = Label(), Label(), Label()
+        if not leaves:
+            self.visit_native(node, asm, wrap=False)
+            if integer:
+                self.visit_wrap(node, asm, l_after, True, True)
+            asm.emit(l_after)
+            return
+
+        if integer:
+            self.visit_leaves(leaves, node, asm, self.visit_isint, l_number)
+            self.visit_native(node, asm, wrap=False)
+            self.visit_wrap(node, asm, l_after, True, True)
+            asm.JUMP_ABSOLUTE(l_after)
+            asm.emit(l_number)
+        self.visit_leaves(leaves, node, asm, self.visit_isnumber, l_generic)
+        self.visit_native(node, asm, wrap=integer)
+        asm.JUMP_ABSOLUTE(l_after)
+        asm.emit(l_generic)
+        self.generic = True
+        self.visit(node, asm, context=Load)
+        self.generic = False
+        asm.emit(l_after)
+
+    def visit_leaves(self, leaves, node, asm, check, l_fail):
+        for leaf in leaves:
+            self.visit_exp(leaf, asm)
+            check(node, asm)
+            asm.POP_JUMP_IF_FALSE(l_fail)
+
+    def visit_native(self, node, asm, wrap):
+        if type(node) is not ast.BinOp:
+            self.visit_exp(node, asm)
+            return
+        self.visit_native(node.left, asm, wrap)
+        self.visit_native(node.right, asm, wrap)
+        self.visit_inline(node, asm)
+        bounds = self.bounds(node)
+        if wrap and bounds is not None:
+            l_done = Label()
+            self.visit_wrap(node, asm, l_done, *bounds, isint=False)
+            asm.emit(l_done)
+
+    def visit_guarded(self, node, asm, check, l_after, bounds=None, isint=True):
+        # falls through with the operands on the stack when check fails.
+        # a constant right operand is only pushed once the check passed
+        left = type(node.left) is not ast.Number
+        right = type(node.right) is not ast.Number
+        l_fail = Label()
+        if left and right:
+            l_pop = Label()
+            asm.DUP_TOP_TWO()
+            check(node, asm)
+            asm.POP_JUMP_IF_FALSE(l_pop)
+            check(node, asm)
+            asm.POP_JUMP_IF_FALSE(l_fail)
+        else:
+            asm.DUP_TOP()
+            check(node, asm)
+            asm.POP_JUMP_IF_FALSE(l_fail)
+            if not right:
+                self.visit_exp(node.right, asm)
+        self.visit_inline(node, asm)
+        if bounds is not None:
+            self.visit_wrap(node, asm, l_after, *bounds, isint=isint)
+        asm.JUMP_ABSOLUTE(l_after)
+        if left and right:
+            asm.emit(l_pop)
+            asm.POP_TOP()
+        asm.emit(l_fail)
 
     @_(ast.UnaryOp)
     def visit(self, node, asm, context=None):
+        if node.op in LOGICAL_OPS:
+            self.visit_exp(node.operand, asm)
+            if self.is_boolean(node.operand):
+                asm.UNARY_NOT()
+            else:
+                self.visit_falsy(asm)
+            return
+
+        if node.op == '-' and type(node.operand) is ast.Number:
+            from ..lib.base import unm_event
+            asm.set_lineno(node)
+            asm.LOAD_CONST(unm_event(self.number(node.operand)))
+            return
+
         self.visit_symbol(node._op, asm, context=Load)
         self.visit_exp(node.operand, asm)
         asm.CALL_FUNCTION(1)
@@ -293,8 +683,106 @@ class CodegenVisitor(ast.Visitor):
         if not node._env:
             self.visit_symbol(node.symbol, asm, context)
             return
+        if context is Load:
+            self.visit_cached_global(node, asm)
+            return
         self.visit_symbol(node.symbol, asm, context=Load)
         asm.LOAD_CONST(node.id)
+        asm.STORE_SUBSCR()
+
+    def visit_cached_global(self, node, asm):
+        # each site keeps [version, value] of its last lookup, the table
+        # version is unique across all tables and changes on every write to
+        # the hash part, so a hit skips the subscript entirely. a miss goes
+        # to .global which fills the site
+        site = [None, None]
+        l_hit, l_slow = Label(), Label()
+        # an _ENV that is not a table goes to the index event
+        self.visit_symbol(node.symbol, asm, context=Load)
+        asm.LOAD_ATTR(node._class.slot)
+        self.visit_symbol(node._luatable, asm, context=Load)
+        asm.COMPARE_OP(8)
+        asm.POP_JUMP_IF_FALSE(l_slow)
+        asm.LOAD_CONST(site)
+        asm.UNPACK_SEQUENCE(2)
+        self.visit_symbol(node.symbol, asm, context=Load)
+        asm.LOAD_ATTR(node._version.slot)
+        asm.COMPARE_OP(8)
+        asm.POP_JUMP_IF_TRUE(l_hit)
+        asm.POP_TOP()
+        asm.emit(l_slow)
+        self.visit_symbol(node._global, asm, context=Load)
+        self.visit_symbol(node.symbol, asm, context=Load)
+        asm.LOAD_CONST(node.id)
+        asm.LOAD_CONST(site)
+        asm.CALL_FUNCTION(3)
+        asm.emit(l_hit)
+
+    def visit_index(self, node, key, asm, context):
+        # TOS[key] with a constant key
+        if context is Load:
+            self.visit_cached_field(node, key, asm)
+        elif context is Store:
+            asm.LOAD_CONST(key)
+            asm.STORE_SUBSCR()
+
+    def visit_cached_field(self, node, key, asm):
+        # each site keeps [index, shape] of the table it last found the
+        # key in, a table of the same shape has the value at the same index
+        # of its values. tables without a shape are cached under None with
+        # the key as index, as their values are the hash. no table has the
+        # shape False. on a miss .index also remembers where a key absent
+        # from a shape was found along its __index tables
+        site = [None, False]
+        l_hit, l_end, l_slow = Label(), Label(), Label()
+        # anything but a table goes to the index event
+        asm.DUP_TOP()
+        asm.LOAD_ATTR(node._class.slot)
+        self.visit_symbol(node._luatable, asm, context=Load)
+        asm.COMPARE_OP(8)
+        asm.POP_JUMP_IF_FALSE(l_slow)
+        asm.DUP_TOP()
+        asm.LOAD_ATTR(node._shape.slot)
+        asm.LOAD_CONST(site)
+        asm.UNPACK_SEQUENCE(2)
+        asm.ROT_THREE()
+        # cached shape -> shape -> index -> table
+        asm.COMPARE_OP(8)
+        asm.POP_JUMP_IF_TRUE(l_hit)
+        asm.POP_TOP()
+        asm.emit(l_slow)
+        self.visit_symbol(node._index, asm, context=Load)
+        asm.ROT_TWO()
+        asm.LOAD_CONST(key)
+        asm.LOAD_CONST(site)
+        asm.LOAD_CONST([False, None, None])
+        asm.CALL_FUNCTION(4)
+        asm.JUMP_ABSOLUTE(l_end)
+        asm.emit(l_hit)
+        asm.ROT_TWO()
+        asm.LOAD_ATTR(node._values.slot)
+        asm.ROT_TWO()
+        asm.BINARY_SUBSCR()
+        asm.emit(l_end)
+
+    @_(ast.Attribute)
+    def visit(self, node, asm, context):
+        self.visit_exp(node.value, asm)
+        self.visit_index(node, node.attr.id, asm, context)
+
+    @_(ast.Method)
+    def visit(self, node, asm, context):
+        # only stored to by function statements, calls are in visit_call
+        self.visit_exp(node.value, asm)
+        self.visit_index(node, node.method.id, asm, context)
+
+    @_(ast.Subscript)
+    def visit(self, node, asm, context):
+        self.visit_exp(node.value, asm)
+        if isinstance(node.slice, ast.String):
+            self.visit_index(node, node.slice.s, asm, context)
+            return
+        self.visit_exp(node.slice, asm)
         if context is Load:
             asm.BINARY_SUBSCR()
         elif context is Store:
@@ -319,8 +807,7 @@ class CodegenVisitor(ast.Visitor):
     @_(ast.Number)
     def visit(self, node, asm, context):
         asm.set_lineno(node)
-        from ..lib.base import tonumber
-        asm.LOAD_CONST(tonumber(None, node.n.encode()))
+        asm.LOAD_CONST(self.number(node))
 
     @_(ast.String)
     def visit(self, node, asm, context):
@@ -328,61 +815,82 @@ class CodegenVisitor(ast.Visitor):
         asm.LOAD_CONST(node.s)
 
     def visit_fields(self, fields, asm):
-        next = 1
+        # pairs -> list, keys of any type stay apart in (key, value) pairs
         for field in fields:
             if isinstance(field, ast.Field):
-                self.visit_exp(node.key, asm)
-                self.visit_exp(node.value, asm)
-                asm.ROT_TWO()
+                self.visit_exp(field.key, asm)
+                self.visit_exp(field.value, asm)
+                asm.BUILD_TUPLE(2)
+                asm.LIST_APPEND(1)
             else:
-                self.visit_exp(field, asm, context=Load)
-                asm.LOAD_CONST(next)
-                next += 1
-        asm.BUILD_MAP(len(fields))
-        return next
+                self.visit_exp(field, asm)
+                asm.LIST_APPEND(2)
 
     @_(ast.Table)
     def visit(self, node, asm, context):
         self.visit_symbol(node._luatable, asm, context=Load)
-        if not node.fields or type(node.fields[-1]) not in (ast.Call, ast.ELLIPSIS):
-            next = self.visit_fields(node.fields, asm)
-            asm.LOAD_CONST(next)
-            asm.CALL_FUNCTION(2)
+        fields = node.fields
+        multi = bool(fields) and type(fields[-1]) in (ast.Call, ast.ELLIPSIS)
+        if multi:
+            fields = fields[:-1]
+        keyed = [f for f in fields if isinstance(f, ast.Field)]
+
+        if not multi and len(fields) <= MAX_BUILD_FIELDS:
+            if not fields:
+                asm.CALL_FUNCTION(0)
+            elif not keyed:
+                for field in fields:
+                    self.visit_exp(field, asm)
+                asm.BUILD_LIST(len(fields))
+                asm.CALL_FUNCTION(1)
+            elif len(keyed) == len(fields):
+                # only string keys can go in a dict, true would be the key 1
+                strings = all(isinstance(f.key, ast.String) for f in fields)
+                asm.LOAD_CONST(None)
+                for field in fields:
+                    self.visit_exp(field.key, asm)
+                    self.visit_exp(field.value, asm)
+                    if not strings:
+                        asm.BUILD_TUPLE(2)
+                if strings:
+                    asm.BUILD_MAP(len(fields))
+                else:
+                    asm.BUILD_LIST(len(fields))
+                asm.CALL_FUNCTION(2)
+            else:
+                asm.BUILD_LIST(0)
+                asm.BUILD_LIST(0)
+                self.visit_fields(fields, asm)
+                asm.CALL_FUNCTION(2)
             return
 
-        l_before, l_after = Label(), Label()
-        next = self.visit_fields(node.fields[:-1], asm)
-        asm.LOAD_CONST(next)
-        self.visit(node.fields[-1], asm)
-        asm.GET_ITER()
-        asm.emit(l_before)
-        # iter -> next -> map
-        asm.FOR_ITER(l_after)
-        # item -> iter -> next -> map
-        asm.ROT_THREE()
-        # iter -> next -> item -> map
-        asm.ROT_THREE()
-        # next -> item -> iter -> map
-        asm.DUP_TOP()
-        # next -> next -> item -> iter -> map
-        asm.LOAD_CONST(1)
-        # 1 -> next -> next -> item -> iter -> map
-        asm.BINARY_ADD()
-        # next+1 -> next -> item -> iter -> map
-        asm.ROT_FOUR()
-        # next -> item -> iter -> next+1 -> map
-        asm.ROT_TWO()
-        # item -> next -> iter -> next+1 -> map
-        asm.MAP_ADD(3)
-        # iter -> next+1 -> map
-        asm.JUMP_ABSOLUTE(l_before)
-        asm.emit(l_after)
-        # next -> map
+        asm.BUILD_LIST(0)
+        asm.BUILD_LIST(0)
+        self.visit_fields(fields, asm)
+        if multi:
+            l_before, l_after = Label(), Label()
+            self.visit(node.fields[-1], asm, context=Load)
+            asm.GET_ITER()
+            asm.emit(l_before)
+            # iter -> pairs -> list
+            asm.FOR_ITER(l_after)
+            # item -> iter -> pairs -> list
+            asm.LIST_APPEND(3)
+            asm.JUMP_ABSOLUTE(l_before)
+            asm.emit(l_after)
+        # pairs -> list
         asm.CALL_FUNCTION(2)
 
     @_(type(None))
     def visit(self, node, asm, break_target):
         pass
 
-    def __init__(self, filename):
+    def __init__(self, filename, optimize=True, stats=None, lazy=False):
         self.filename = filename
+        self.optimize = optimize
+        self.stats = stats
+        # nested functions are generated on their first call
+        self.lazy = lazy
+        # set while the per operator fallback of an integer tree is
+        # generated, so its subtrees are not specialized again
+        self.generic = False
@@ -0,0 +1,417 @@
+from sly.lex import Token
+from . import ast
+from .error import Error, token_repr
+from .parse import CONSTANTS
+
+# (left, right) priorities of binary operators, as in lparser.c
+BINARY = {
+    'OR': (1, 1), 'AND': (2, 2),
+    '<': (3, 3), '>': (3, 3), 'LE': (3, 3), 'GE': (3, 3), 'NE': (3, 3), 'EQ': (3, 3),
+    '|': (4, 4), '~': (5, 5), '&': (6, 6), 'SHL': (7, 7), 'SHR': (7, 7),
+    'CONCAT': (9, 8),
+    '+': (10, 10), '-': (10, 10),
+    '*': (11, 11), '/': (11, 11), 'IDIV': (11, 11), '%': (11, 11),
+    '^': (14, 13)}
+
+UNARY = {'NOT', '#', '-', '~'}
+UNARY_PRIORITY = 12
+
+EXPRESSION_START = UNARY | {
+    'NIL', 'TRUE', 'FALSE', 'NUMBER', 'STRING', 'LONGSTRING',
+    'ELLIPSIS', 'FUNCTION', '{', 'NAME', '('}
+
+ARGS_START = {'(', 'STRING', 'LONGSTRING', '{'}
+
+EOF = Token()
+EOF.type = EOF.value = '$end'
+
+
+class LuaDescentParser(Error):
+    """recursive descent parser building the same tree as LuaParser"""
+
+    def __init__(self, filename, text):
+        self.filename = filename
+        self.text = text
+
+    def parse(self, tokens):
+        self.start(tokens)
+        return ast.File(body=list(self.chunk()), lineno=1, index=0)
+
+    def statements(self, tokens):
+        """top-level statements of the chunk, parsed one at a time"""
+        self.start(tokens)
+        return self.chunk()
+
+    def start(self, tokens):
+        # tokens are pulled as needed, so they are never all held at once
+        self.tokens = iter(tokens)
+        self.ahead = None
+        self.token = next(self.tokens, EOF)
+
+    def advance(self):
+        t = self.token
+        if self.ahead is None:
+            self.token = next(self.tokens, EOF)
+        else:
+            self.token, self.ahead = self.ahead, None
+        return t
+
+    def lookahead(self):
+        if self.ahead is None:
+            self.ahead = next(self.tokens, EOF)
+        return self.ahead
+
+    def expect(self, type):
+        if self.token.type != type:
+            self.error(self.token)
+        return self.advance()
+
+    def error(self, t):
+        if t is EOF:
+            raise EOFError()
+        super().error(t, f"Invalid token {token_repr(t.value)}")
+
+    def chunk(self):
+        if self.token.type == 'SHEBANG':
+            self.advance()
+        while True:
+            type = self.token.type
+            if type == 'RETURN':
+                yield self.retstat()
+                break
+            stat = self.STATEMENTS.get(type)
+            if stat is None:
+                break
+            yield stat(self)
+        if self.token is not EOF:
+            self.error(self.token)
+
+    def block(self):
+        body = []
+        while True:
+            type = self.token.type
+            if type == 'RETURN':
+                body.append(self.retstat())
+                return body
+            stat = self.STATEMENTS.get(type)
+            if stat is None:
+                return body
+            body.append(stat(self))
+
+    def retstat(self):
+        t = self.advance()
+        value = self.explist() if self.token.type in EXPRESSION_START else []
+        if self.token.type == ';':
+            self.advance()
+        return ast.Return(value=value, lineno=t.lineno, index=t.index)
+
+    def empty_stat(self):
+        self.advance()
+
+    def label_stat(self):
+        t = self.advance()
+        name = self.name()
+        self.expect('LABEL')
+        return ast.Label(name=name.id, lineno=t.lineno, index=t.index)
+
+    def break_stat(self):
+        t = self.advance()
+        return ast.Break(lineno=t.lineno, index=t.index)
+
+    def goto_stat(self):
+        t = self.advance()
+        return ast.Goto(target=self.name().id, lineno=t.lineno, index=t.index)
+
+    def do_stat(self):
+        t = self.advance()
+        body = self.block()
+        self.expect('END')
+        return ast.Block(body=body, lineno=t.lineno, index=t.index)
+
+    def while_stat(self):
+        t = self.advance()
+        test = self.exp()
+        self.expect('DO')
+        body = self.block()
+        self.expect('END')
+        return ast.While(test=test, body=body, lineno=t.lineno, index=t.index)
+
+    def repeat_stat(self):
+        t = self.advance()
+        body = self.block()
+        self.expect('UNTIL')
+        test = self.exp()
+        return ast.Repeat(body=body, test=test, lineno=t.lineno, index=t.index)
+
+    def if_stat(self):
+        t = self.advance()
+        test = self.exp()
+        self.expect('THEN')
+        body = self.block()
+        return ast.If(test=test, body=body, orelse=self.orelse(), lineno=t.lineno, index=t.index)
+
+    def orelse(self):
+        type = self.token.type
+        if type == 'ELSEIF':
+            return self.if_stat()
+        if type == 'ELSE':
+            self.advance()
+            body = self.block()
+            self.expect('END')
+            return body
+        self.expect('END')
+        return []
+
+    def for_stat(self):
+        t = self.advance()
+        target = self.name()
+        if self.token.type == '=':
+            self.advance()
+            start = self.exp()
+            self.expect(',')
+            stop = self.exp()
+            if self.token.type == ',':
+                self.advance()
+                step = self.exp()
+                do = self.expect('DO')
+            else:
+                do = self.expect('DO')
+                step = ast.Number(n=b"1", lineno=do.lineno, index=do.index)
+            body = self.block()
+            self.expect('END')
+            return ast.For(
+                target=target, start=start, stop=stop, step=step, body=body,
+                lineno=t.lineno, index=t.index)
+
+        targets = [target]
+        while self.token.type == ',':
+            self.advance()
+            targets.append(self.name())
+        self.expect('IN')
+        iter = self.explist()
+        self.expect('DO')
+        body = self.block()
+        self.expect('END')
+        return ast.ForEach(target=targets, iter=iter, body=body, lineno=t.lineno, index=t.index)
+
+    def function_stat(self):
+        t = self.advance()
+        name = self.name()
+        while self.token.type in ('.', ':'):
+            if self.advance().type == '.':
+                name = ast.Attribute(value=name, attr=self.name(), lineno=name.lineno, index=name.index)
+            else:
+                name = ast.Method(value=name, method=self.name(), lineno=name.lineno, index=name.index)
+        pars = self.parlist()
+        if isinstance(name, ast.Method):
+            pars.value = [ast.Name(id=b'self', lineno=pars.lineno, index=pars.index)] + pars.value
+        body = self.block()
+        self.expect('END')
+        return ast.Function(name=name, pars=pars, body=body, lineno=t.lineno, index=t.index)
+
+    def local_stat(self):
+        t = self.advance()
+        if self.token.type == 'FUNCTION':
+            self.advance()
+            name = self.name()
+            pars = self.parlist()
+            body = self.block()
+            self.expect('END')
+            return ast.FunctionLocal(name=name, pars=pars, body=body, lineno=t.lineno, index=t.index)
+
+        target = self.namelist()
+        value = []
+        if self.token.type == '=':
+            self.advance()
+            value = self.explist()
+        return ast.AssignLocal(target=target, value=value, lineno=t.lineno, index=t.index)
+
+    def exp_stat(self):
+        node, kind = self.suffixedexp()
+        if self.token.type in ('=', ','):
+            target = [node]
+            while True:
+                if kind != 'var':
+                    self.error(self.token)
+                if self.token.type != ',':
+                    break
+                self.advance()
+                node, kind = self.suffixedexp()
+                target.append(node)
+            self.expect('=')
+            value = self.explist()
+            return ast.Assign(target=target, value=value, lineno=target[0].lineno, index=target[0].index)
+
+        if kind != 'call':
+            self.error(self.token)
+        return ast.CallStatement(body=node, lineno=node.lineno, index=node.index)
+
+    STATEMENTS = {
+        ';': empty_stat,
+        'LABEL': label_stat,
+        'BREAK': break_stat,
+        'GOTO': goto_stat,
+        'DO': do_stat,
+        'WHILE': while_stat,
+        'REPEAT': repeat_stat,
+        'IF': if_stat,
+        'FOR': for_stat,
+        'FUNCTION': function_stat,
+        'LOCAL': local_stat,
+        'NAME': exp_stat,
+        '(': exp_stat}
+
+    def name(self):
+        t = self.expect('NAME')
+        return ast.Name(id=t.value, lineno=t.lineno, index=t.index)
+
+    def namelist(self):
+        names = [self.name()]
+        while self.token.type == ',':
+            self.advance()
+            names.append(self.name())
+        return names
+
+    def explist(self):
+        exps = [self.exp()]
+        while self.token.type == ',':
+            self.advance()
+            exps.append(self.exp())
+        return exps
+
+    def exp(self, limit=0):
+        t = self.token
+        if t.type in UNARY:
+            self.advance()
+            operand = self.exp(UNARY_PRIORITY)
+            left = ast.UnaryOp(op=t.value, operand=operand, lineno=t.lineno, index=t.index)
+        else:
+            left = self.simpleexp()
+
+        while True:
+            priority = BINARY.get(self.token.type)
+            if priority is None or priority[0] <= limit:
+                return left
+            op = self.advance().value
+            right = self.exp(priority[1])
+            left = ast.BinOp(left=left, op=op, right=right, lineno=left.lineno, index=left.index)
+
+    def simpleexp(self):
+        t = self.token
+        type = t.type
+        if type == 'NUMBER':
+            self.advance()
+            return ast.Number(n=t.value, lineno=t.lineno, index=t.index)
+        if type == 'STRING' or type == 'LONGSTRING':
+            self.advance()
+            return ast.String(s=t.value, lineno=t.lineno, index=t.index)
+        if type in ('NIL', 'TRUE', 'FALSE'):
+            self.advance()
+            return CONSTANTS[t.value](lineno=t.lineno, index=t.index)
+        if type == 'ELLIPSIS':
+            self.advance()
+            return ast.ELLIPSIS(lineno=t.lineno, index=t.index)
+        if type == 'FUNCTION':
+            self.advance()
+            pars = self.parlist()
+            body = self.block()
+            self.expect('END')
+            return ast.Lambda(pars=pars, body=body, lineno=t.lineno, index=t.index)
+        if type == '{':
+            return self.table()
+        return self.suffixedexp()[0]
+
+    def suffixedexp(self):
+        """the expression and whether it is a 'var', a 'call' or in 'parens'"""
+        t = self.token
+        if t.type == 'NAME':
+            node = self.name()
+            kind = 'var'
+        elif t.type == '(':
+            self.advance()
+            node = self.exp()
+            self.expect(')')
+            kind = 'parens'
+        else:
+            self.error(t)
+
+        while True:
+            type = self.token.type
+            if type == '.':
+                self.advance()
+                node = ast.Attribute(value=node, attr=self.name(), lineno=node.lineno, index=node.index)
+                kind = 'var'
+            elif type == '[':
+                self.advance()
+                slice = self.exp()
+                self.expect(']')
+                node = ast.Subscript(value=node, slice=slice, lineno=node.lineno, index=node.index)
+                kind = 'var'
+            elif type == ':':
+                self.advance()
+                func = ast.Method(value=node, method=self.name(), lineno=node.lineno, index=node.index)
+                node = ast.Call(func=func, args=self.args(), lineno=node.lineno, index=node.index)
+                kind = 'call'
+            elif type in ARGS_START:
+                node = ast.Call(func=node, args=self.args(), lineno=node.lineno, index=node.index)
+                kind = 'call'
+            else:
+                return node, kind
+
+    def args(self):
+        t = self.token
+        if t.type == '(':
+            self.advance()
+            value = [] if self.token.type == ')' else self.explist()
+            self.expect(')')
+            return ast.ExpressionList(value=value, lineno=t.lineno, index=t.index)
+        if t.type == '{':
+            node = self.table()
+        else:
+            node = self.simpleexp()
+        return ast.ExpressionList(value=[node], lineno=node.lineno, index=node.index)
+
+    def parlist(self):
+        t = self.expect('(')
+        names = []
+        varargs = False
+        if self.token.type == 'ELLIPSIS':
+            self.advance()
+            varargs = True
+        elif self.token.type != ')':
+            names.append(self.name())
+            while self.token.type == ',':
+                self.advance()
+                if self.token.type == 'ELLIPSIS':
+                    self.advance()
+                    varargs = True
+                    break
+                names.append(self.name())
+        self.expect(')')
+        return ast.Parameters(value=names, varargs=varargs, lineno=t.lineno, index=t.index)
+
+    def table(self):
+        t = self.expect('{')
+        fields = []
+        while self.token.type != '}':
+            fields.append(self.field())
+            if self.token.type not in (',', ';'):
+                break
+            self.advance()
+        self.expect('}')
+        return ast.Table(fields=fields, lineno=t.lineno, index=t.index)
+
+    def field(self):
+        t = self.token
+        if t.type == '[':
+            self.advance()
+            key = self.exp()
+            self.expect(']')
+            self.expect('=')
+            return ast.Field(key=key, value=self.exp(), lineno=t.lineno, index=t.index)
+        if t.type == 'NAME' and self.lookahead().type == '=':
+            self.advance()
+            self.advance()
+            key = ast.String(s=t.value, lineno=t.lineno, index=t.index)
+            return ast.Field(key=key, value=self.exp(), lineno=t.lineno, index=t.index)
+        return self.exp()
@@ -1,14 +1,26 @@
+def token_repr(value):
+    # names and strings are bytes, keywords and operators are str
+    if isinstance(value, bytes):
+        value = value.decode('utf-8', 'replace')
+    return repr(value)
+
+
 class Error:
 
     def line_of(self, t):
-        last_cr = self.text.rfind('\n', 0, t.index)
-        next_cr = self.text.find('\n', t.index)
+        newline = '\n' if isinstance(self.text, str) else b'\n'
+        last_cr = self.text.rfind(newline, 0, t.index)
+        next_cr = self.text.find(newline, t.index)
         if next_cr < 0:
             next_cr = None
-        return self.text[last_cr+1: next_cr]
+        line = self.text[last_cr+1: next_cr]
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', 'replace')
+        return line
 
     def col_offset(self, t):
-        last_cr = self.text.rfind('\n', 0, t.index)
+        newline = '\n' if isinstance(self.text, str) else b'\n'
+        last_cr = self.text.rfind(newline, 0, t.index)
         if last_cr < 0:
             last_cr = 0
         return t.index - last_cr
@@ -0,0 +1,54 @@
+from .asm import Assembler
+
+
+class Prototype:
+    """a function whose body is generated on its first call
+
+    Closures of a lazy function start out with the code of stub(). The
+    stub passes its closure and arguments to the prototype, which
+    generates the real code once, swaps it into the closure and calls
+    it. Later calls of that closure run the real code directly, and
+    closures made later get the cached code on their first call.
+
+    The prototype is a constant of the enclosing code, so lazy chunks
+    cannot be marshalled.
+    """
+
+    def __init__(self, codegen, node, name, slots):
+        self.codegen = codegen
+        self.node = node
+        self.name = name
+        self.slots = slots
+        self.code = None
+
+    def bind(self, func):
+        # the stub finds its closure in a keyword only argument
+        func.__kwdefaults__ = {'.func': func}
+        return func
+
+    def __call__(self, func, args):
+        if self.code is None:
+            self.code = self.codegen.function_code(self.node, self.name, self.slots)
+            # the tree is no longer needed
+            self.codegen = self.node = self.slots = None
+        func.__code__ = self.code
+        func.__kwdefaults__ = None
+        return func(*args)
+
+    def stub(self, filename, argcount, freenames):
+        asm = Assembler()
+        asm.LOAD_CONST(self)
+        asm.LOAD_FAST(argcount)
+        for i in range(argcount):
+            asm.LOAD_FAST(i)
+        asm.BUILD_TUPLE(argcount)
+        asm.LOAD_FAST(argcount + 1)
+        asm.BUILD_TUPLE_UNPACK(2)
+        asm.CALL_FUNCTION(2)
+        asm.RETURN_VALUE()
+        varnames = tuple(f'.{i:d}' for i in range(argcount)) + ('.func', '...')
+        return asm.build(
+            argcount, (), varnames,
+            filename, self.name,
+            self.node.lineno, freenames, (),
+            kwonlyargcount=1)
@@ -1,33 +1,34 @@
+import os
 import re
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
 from sly import Lexer, Parser
-from sly.yacc import YaccSymbol, YaccProduction
+from sly.yacc import YaccSymbol, YaccProduction, YaccError, LRTable
 from . import ast
-from .error import Error
+from .error import Error, token_repr
 
-ESCAPE_RE = re.compile(r"\\[abfnrtv\\\"']|\\z\s*|\\x[0-9a-fA-F]{2}|\\\d{1,3}|\\u{[0-9a-fA-F]+}")
-ESCAPE_CHARS = {"a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+ESCAPE_RE = re.compile(rb"\\[abfnrtv\\\"']|\\z\s*|\\x[0-9a-fA-F]{2}|\\\d{1,3}|\\u{[0-9a-fA-F]+}")
+ESCAPE_CHARS = {c: bytes((v,)) for c, v in zip(b'abfnrtv"\'\\', b'\a\b\f\n\r\t\v"\'\\')}
 
 def escape(string):
     def replace(match):
         s = match.group(0)
         c = s[1]
 
-        if c in "\"'\\":
-            return c
-        elif c in "abfnrtv":
+        if c in ESCAPE_CHARS:
             return ESCAPE_CHARS[c]
-        elif c == 'z':
-            return ''
-        elif c == 'x':
-            return chr(int(s[2:], 16))
-        elif c == 'u':
-            return chr(int(s[3:-1], 16))
+        elif c == ord('z'):
+            return b''
+        elif c == ord('x'):
+            return bytes((int(s[2:], 16),))
+        elif c == ord('u'):
+            return chr(int(s[3:-1], 16)).encode('utf-8', 'surrogatepass')
         else:
             o = int(s[1:])
             if o > 255:
-                raise Exception("decimal escape too large near '%s'"%(s))
+                raise Exception("decimal escape too large near '%s'"%(s.decode()))
 
-            return chr(o)
+            return bytes((o,))
 
     return ESCAPE_RE.sub(replace, string)
 
@@ -97,7 +98,7 @@ class LuaLexer(Error, Lexer):
        r"'(?:[^'\n\\]|\\[abfnrtv\\'\"\n]|\\z\s*|\\x[0-9a-fA-F]{2}|\\\d{1,3}|\\u{[0-9a-fA-F]+})*'")
     def STRING(self, t):
         self.lineno += t.value.count('\n')
-        t.value = escape(t.value[1:-1])
+        t.value = escape(t.value[1:-1].encode())
         return t
 
     @_(r'\[(?P<b>=*)\[(?:(?!\](?P=b)\]).|\n)*\](?P=b)\]')
@@ -132,6 +133,47 @@ class LuaLexer(Error, Lexer):
         super().error(t, f"Bad character {t.value[0]!r}")
 
 
+PARSETAB = os.path.join(os.path.dirname(__file__), 'parsetab.py')
+
+def grammar_signature(grammar):
+    digest = sha256()
+    for p in grammar.Productions:
+        digest.update(f'{p} {p.prec}\n'.encode())
+    for term, prec in sorted(grammar.Precedence.items()):
+        digest.update(f'{term} {prec}\n'.encode())
+    return digest.hexdigest()
+
+def write_tables(filename, signature, lrtable):
+    with NamedTemporaryFile('w', dir=os.path.dirname(filename), suffix='.tmp', delete=False) as f:
+        f.write('# generated from the grammar of fml.compile.parse.LuaParser, do not edit\n\n')
+        f.write(f'signature = {signature!r}\n')
+        for name in ('lr_action', 'lr_goto', 'defaulted_states'):
+            f.write(f'\n{name} = {{\n')
+            for state, row in getattr(lrtable, name).items():
+                f.write(f'    {state!r}: {row!r},\n')
+            f.write('}\n')
+    os.chmod(f.name, 0o644)
+    os.replace(f.name, filename)
+
+def load_tables(grammar):
+    """the LALR tables of grammar, from parsetab.py unless the grammar
+    changed since it was written"""
+    signature = grammar_signature(grammar)
+    try:
+        from . import parsetab
+    except ImportError:
+        parsetab = None
+    if parsetab is not None and parsetab.signature == signature:
+        return parsetab
+
+    lrtable = LRTable(grammar)
+    try:
+        write_tables(PARSETAB, signature, lrtable)
+    except OSError:
+        pass
+    return lrtable
+
+
 CONSTANTS = {
     'true': ast.TRUE,
     'false': ast.FALSE,
@@ -140,6 +182,15 @@ CONSTANTS = {
 class LuaParser(Error, Parser):
     tokens = LuaLexer.tokens
 
+    @classmethod
+    def _build(cls, definitions):
+        # same as Parser._build, except for where the tables come from
+        rules = cls._Parser__collect_rules(definitions)
+        if not cls._Parser__validate_specification():
+            raise YaccError('Invalid parser specification')
+        cls._Parser__build_grammar(rules)
+        cls._lrtable = load_tables(cls._grammar)
+
     precedence = (
         ('left', OR),
         ('left', AND),
@@ -269,7 +320,7 @@ class LuaParser(Error, Parser):
             target = p[1],
             start = p[3],
             stop = p[5],
-            step = ast.Number(n="1", **self.position(p, 6)),
+            step = ast.Number(n=b"1", **self.position(p, 6)),
             body = p[7],
             **self.position(p))
 
@@ -295,7 +346,7 @@ class LuaParser(Error, Parser):
         args = p[2]
 
         if isinstance(p[1], ast.Method):
-            args.value = [ast.Name(id='self', **self.position(p,2))] + args.value
+            args.value = [ast.Name(id=b'self', **self.position(p,2))] + args.value
 
         return ast.Function(
             name=p[1],
@@ -582,20 +633,7 @@ class LuaParser(Error, Parser):
         self.filename = filename
         self.text = text
 
-    def line_of(self, t):
-        last_cr = self.text.rfind('\n', 0, t.index)
-        next_cr = self.text.find('\n', t.index)
-        if next_cr < 0:
-            next_cr = None
-        return self.text[last_cr+1: next_cr]
-
-    def col_offset(self, t):
-        last_cr = self.text.rfind('\n', 0, t.index)
-        if last_cr < 0:
-            last_cr = 0
-        return t.index - last_cr
-
     def error(self, t):
         if t is None:
             raise EOFError()
-        super().error(t, f"Invalid token {t.value!r}")
+        super().error(t, f"Invalid token {token_repr(t.value)}")
@@ -0,0 +1,462 @@
+# generated from the grammar of fml.compile.parse.LuaParser, do not edit
+
+signature = '2b4f2dbe3026832ea686e8b39e762f1a1968e95e63de95d6a0650dae28f30d51'
+
+lr_action = {
+    0: {'SHEBANG': 3, '$end': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    1: {'$end': 0},
+    2: {'$end': -1},
+    3: {'$end': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    4: {'$end': -4, 'END': -4, 'UNTIL': -4, 'ELSE': -4, 'ELSEIF': -4},
+    5: {'$end': -3, 'END': -3, 'UNTIL': -3, 'ELSE': -3, 'ELSEIF': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    6: {';': 29, '$end': -27, 'END': -27, 'UNTIL': -27, 'ELSE': -27, 'ELSEIF': -27, '~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    7: {'RETURN': -22, 'LOCAL': -22, 'FUNCTION': -22, 'FOR': -22, 'IF': -22, 'REPEAT': -22, 'WHILE': -22, 'DO': -22, 'GOTO': -22, 'BREAK': -22, ';': -22, 'LABEL': -22, '(': -22, 'NAME': -22, '$end': -22, 'END': -22, 'UNTIL': -22, 'ELSE': -22, 'ELSEIF': -22},
+    8: {'FUNCTION': 54, 'NAME': 26},
+    9: {'NAME': 26},
+    10: {'=': -38, ',': -38, ':': -38, '(': -38, 'LONGSTRING': -38, 'STRING': -38, '{': -38, '.': -38, '[': -38, '^': -38, '%': -38, 'IDIV': -38, '/': -38, '*': -38, '-': -38, '+': -38, 'CONCAT': -38, 'SHR': -38, 'SHL': -38, '&': -38, '~': -38, '|': -38, 'EQ': -38, 'NE': -38, 'GE': -38, 'LE': -38, '>': -38, '<': -38, 'AND': -38, 'OR': -38, ';': -38, '$end': -38, 'END': -38, 'UNTIL': -38, 'ELSE': -38, 'ELSEIF': -38, 'THEN': -38, 'DO': -38, ')': -38, '}': -38, 'RETURN': -38, 'LOCAL': -38, 'FUNCTION': -38, 'FOR': -38, 'IF': -38, 'REPEAT': -38, 'WHILE': -38, 'GOTO': -38, 'BREAK': -38, 'LABEL': -38, 'NAME': -38, ']': -38},
+    11: {'NAME': 26},
+    12: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    13: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    14: {'UNTIL': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    15: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    16: {'NAME': 26},
+    17: {'RETURN': -18, 'LOCAL': -18, 'FUNCTION': -18, 'FOR': -18, 'IF': -18, 'REPEAT': -18, 'WHILE': -18, 'DO': -18, 'GOTO': -18, 'BREAK': -18, ';': -18, 'LABEL': -18, '(': -18, 'NAME': -18, '$end': -18, 'END': -18, 'UNTIL': -18, 'ELSE': -18, 'ELSEIF': -18},
+    18: {'RETURN': -19, 'LOCAL': -19, 'FUNCTION': -19, 'FOR': -19, 'IF': -19, 'REPEAT': -19, 'WHILE': -19, 'DO': -19, 'GOTO': -19, 'BREAK': -19, ';': -19, 'LABEL': -19, '(': -19, 'NAME': -19, '$end': -19, 'END': -19, 'UNTIL': -19, 'ELSE': -19, 'ELSEIF': -19},
+    19: {'RETURN': -20, 'LOCAL': -20, 'FUNCTION': -20, 'FOR': -20, 'IF': -20, 'REPEAT': -20, 'WHILE': -20, 'DO': -20, 'GOTO': -20, 'BREAK': -20, ';': -20, 'LABEL': -20, '(': 69, 'NAME': -20, '$end': -20, 'END': -20, 'UNTIL': -20, 'ELSE': -20, 'ELSEIF': -20, ':': 65, '.': -77, '[': -77, 'LONGSTRING': 50, 'STRING': 51, '{': 45},
+    20: {'=': 70, ',': 71},
+    21: {'NAME': 26},
+    22: {':': 73, '.': -78, '[': -78, '(': 69, 'LONGSTRING': 50, 'STRING': 51, '{': 45},
+    23: {'=': -34, ',': -34, ':': -80, '(': -80, 'LONGSTRING': -80, 'STRING': -80, '{': -80, '.': -80, '[': -80},
+    24: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    25: {'.': 76, '[': 77},
+    26: {'=': -106, ',': -106, ':': -106, '(': -106, 'LONGSTRING': -106, 'STRING': -106, '{': -106, '.': -106, '[': -106, '^': -106, '%': -106, 'IDIV': -106, '/': -106, '*': -106, '-': -106, '+': -106, 'CONCAT': -106, 'SHR': -106, 'SHL': -106, '&': -106, '~': -106, '|': -106, 'EQ': -106, 'NE': -106, 'GE': -106, 'LE': -106, '>': -106, '<': -106, 'AND': -106, 'OR': -106, ';': -106, '$end': -106, 'END': -106, 'UNTIL': -106, 'ELSE': -106, 'ELSEIF': -106, 'RETURN': -106, 'LOCAL': -106, 'FUNCTION': -106, 'FOR': -106, 'IF': -106, 'REPEAT': -106, 'WHILE': -106, 'DO': -106, 'GOTO': -106, 'BREAK': -106, 'LABEL': -106, 'NAME': -106, 'IN': -106, 'THEN': -106, ')': -106, '}': -106, ']': -106},
+    27: {'$end': -2},
+    28: {'$end': -5, 'END': -5, 'UNTIL': -5, 'ELSE': -5, 'ELSEIF': -5},
+    29: {'$end': -26, 'END': -26, 'UNTIL': -26, 'ELSE': -26, 'ELSEIF': -26},
+    30: {';': 78, '$end': -29, 'END': -29, 'UNTIL': -29, 'ELSE': -29, 'ELSEIF': -29, ',': 79},
+    31: {';': -41, ',': -41, '$end': -41, 'END': -41, 'UNTIL': -41, 'ELSE': -41, 'ELSEIF': -41, ')': -41, 'RETURN': -41, 'LOCAL': -41, 'FUNCTION': -41, 'FOR': -41, 'IF': -41, 'REPEAT': -41, 'WHILE': -41, 'DO': -41, 'GOTO': -41, 'BREAK': -41, 'LABEL': -41, '(': -41, 'NAME': -41, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    32: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    33: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    34: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    35: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    36: {'^': -68, '%': -68, 'IDIV': -68, '/': -68, '*': -68, '-': -68, '+': -68, 'CONCAT': -68, 'SHR': -68, 'SHL': -68, '&': -68, '~': -68, '|': -68, 'EQ': -68, 'NE': -68, 'GE': -68, 'LE': -68, '>': -68, '<': -68, 'AND': -68, 'OR': -68, ';': -68, ',': -68, '$end': -68, 'END': -68, 'UNTIL': -68, 'ELSE': -68, 'ELSEIF': -68, 'THEN': -68, 'DO': -68, ')': -68, '}': -68, 'RETURN': -68, 'LOCAL': -68, 'FUNCTION': -68, 'FOR': -68, 'IF': -68, 'REPEAT': -68, 'WHILE': -68, 'GOTO': -68, 'BREAK': -68, 'LABEL': -68, '(': -68, 'NAME': -68, ']': -68},
+    37: {'^': -69, '%': -69, 'IDIV': -69, '/': -69, '*': -69, '-': -69, '+': -69, 'CONCAT': -69, 'SHR': -69, 'SHL': -69, '&': -69, '~': -69, '|': -69, 'EQ': -69, 'NE': -69, 'GE': -69, 'LE': -69, '>': -69, '<': -69, 'AND': -69, 'OR': -69, ';': -69, ',': -69, '$end': -69, 'END': -69, 'UNTIL': -69, 'ELSE': -69, 'ELSEIF': -69, 'THEN': -69, 'DO': -69, ')': -69, '}': -69, 'RETURN': -69, 'LOCAL': -69, 'FUNCTION': -69, 'FOR': -69, 'IF': -69, 'REPEAT': -69, 'WHILE': -69, 'GOTO': -69, 'BREAK': -69, 'LABEL': -69, '(': -69, 'NAME': -69, ']': -69, '.': 76, '[': 77},
+    38: {'^': -70, '%': -70, 'IDIV': -70, '/': -70, '*': -70, '-': -70, '+': -70, 'CONCAT': -70, 'SHR': -70, 'SHL': -70, '&': -70, '~': -70, '|': -70, 'EQ': -70, 'NE': -70, 'GE': -70, 'LE': -70, '>': -70, '<': -70, 'AND': -70, 'OR': -70, ';': -70, ',': -70, '$end': -70, 'END': -70, 'UNTIL': -70, 'ELSE': -70, 'ELSEIF': -70, 'THEN': -70, 'DO': -70, ')': -70, '}': -70, 'RETURN': -70, 'LOCAL': -70, 'FUNCTION': -70, 'FOR': -70, 'IF': -70, 'REPEAT': -70, 'WHILE': -70, 'GOTO': -70, 'BREAK': -70, 'LABEL': -70, '(': -70, 'NAME': -70, ']': -70},
+    39: {'^': -71, '%': -71, 'IDIV': -71, '/': -71, '*': -71, '-': -71, '+': -71, 'CONCAT': -71, 'SHR': -71, 'SHL': -71, '&': -71, '~': -71, '|': -71, 'EQ': -71, 'NE': -71, 'GE': -71, 'LE': -71, '>': -71, '<': -71, 'AND': -71, 'OR': -71, ';': -71, ',': -71, '$end': -71, 'END': -71, 'UNTIL': -71, 'ELSE': -71, 'ELSEIF': -71, 'THEN': -71, 'DO': -71, ')': -71, '}': -71, 'RETURN': -71, 'LOCAL': -71, 'FUNCTION': -71, 'FOR': -71, 'IF': -71, 'REPEAT': -71, 'WHILE': -71, 'GOTO': -71, 'BREAK': -71, 'LABEL': -71, '(': -71, 'NAME': -71, ']': -71},
+    40: {'^': -72, '%': -72, 'IDIV': -72, '/': -72, '*': -72, '-': -72, '+': -72, 'CONCAT': -72, 'SHR': -72, 'SHL': -72, '&': -72, '~': -72, '|': -72, 'EQ': -72, 'NE': -72, 'GE': -72, 'LE': -72, '>': -72, '<': -72, 'AND': -72, 'OR': -72, ';': -72, ',': -72, '$end': -72, 'END': -72, 'UNTIL': -72, 'ELSE': -72, 'ELSEIF': -72, 'THEN': -72, 'DO': -72, ')': -72, '}': -72, 'RETURN': -72, 'LOCAL': -72, 'FUNCTION': -72, 'FOR': -72, 'IF': -72, 'REPEAT': -72, 'WHILE': -72, 'GOTO': -72, 'BREAK': -72, 'LABEL': -72, '(': -72, 'NAME': -72, ']': -72},
+    41: {'^': -73, '%': -73, 'IDIV': -73, '/': -73, '*': -73, '-': -73, '+': -73, 'CONCAT': -73, 'SHR': -73, 'SHL': -73, '&': -73, '~': -73, '|': -73, 'EQ': -73, 'NE': -73, 'GE': -73, 'LE': -73, '>': -73, '<': -73, 'AND': -73, 'OR': -73, ';': -73, ',': -73, '$end': -73, 'END': -73, 'UNTIL': -73, 'ELSE': -73, 'ELSEIF': -73, 'THEN': -73, 'DO': -73, ')': -73, '}': -73, 'RETURN': -73, 'LOCAL': -73, 'FUNCTION': -73, 'FOR': -73, 'IF': -73, 'REPEAT': -73, 'WHILE': -73, 'GOTO': -73, 'BREAK': -73, 'LABEL': -73, '(': -73, 'NAME': -73, ']': -73},
+    42: {'^': -74, '%': -74, 'IDIV': -74, '/': -74, '*': -74, '-': -74, '+': -74, 'CONCAT': -74, 'SHR': -74, 'SHL': -74, '&': -74, '~': -74, '|': -74, 'EQ': -74, 'NE': -74, 'GE': -74, 'LE': -74, '>': -74, '<': -74, 'AND': -74, 'OR': -74, ';': -74, ',': -74, '$end': -74, 'END': -74, 'UNTIL': -74, 'ELSE': -74, 'ELSEIF': -74, 'THEN': -74, 'DO': -74, ')': -74, '}': -74, 'RETURN': -74, 'LOCAL': -74, 'FUNCTION': -74, 'FOR': -74, 'IF': -74, 'REPEAT': -74, 'WHILE': -74, 'GOTO': -74, 'BREAK': -74, 'LABEL': -74, '(': -74, 'NAME': -74, ']': -74},
+    43: {'^': -75, '%': -75, 'IDIV': -75, '/': -75, '*': -75, '-': -75, '+': -75, 'CONCAT': -75, 'SHR': -75, 'SHL': -75, '&': -75, '~': -75, '|': -75, 'EQ': -75, 'NE': -75, 'GE': -75, 'LE': -75, '>': -75, '<': -75, 'AND': -75, 'OR': -75, ';': -75, ',': -75, '$end': -75, 'END': -75, 'UNTIL': -75, 'ELSE': -75, 'ELSEIF': -75, 'THEN': -75, 'DO': -75, ')': -75, '}': -75, 'RETURN': -75, 'LOCAL': -75, 'FUNCTION': -75, 'FOR': -75, 'IF': -75, 'REPEAT': -75, 'WHILE': -75, 'GOTO': -75, 'BREAK': -75, 'LABEL': -75, '(': -75, 'NAME': -75, ']': -75},
+    44: {'^': -76, '%': -76, 'IDIV': -76, '/': -76, '*': -76, '-': -76, '+': -76, 'CONCAT': -76, 'SHR': -76, 'SHL': -76, '&': -76, '~': -76, '|': -76, 'EQ': -76, 'NE': -76, 'GE': -76, 'LE': -76, '>': -76, '<': -76, 'AND': -76, 'OR': -76, ';': -76, ',': -76, '$end': -76, 'END': -76, 'UNTIL': -76, 'ELSE': -76, 'ELSEIF': -76, 'THEN': -76, 'DO': -76, ')': -76, '}': -76, 'RETURN': -76, 'LOCAL': -76, 'FUNCTION': -76, 'FOR': -76, 'IF': -76, 'REPEAT': -76, 'WHILE': -76, 'GOTO': -76, 'BREAK': -76, 'LABEL': -76, '(': -76, 'NAME': -76, ']': -76},
+    45: {'}': -107, '[': 111, '~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, 'NAME': 26, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24},
+    46: {'.': -77, '[': -77, '^': -77, '%': -77, 'IDIV': -77, '/': -77, '*': -77, '-': -77, '+': -77, 'CONCAT': -77, 'SHR': -77, 'SHL': -77, '&': -77, '~': -77, '|': -77, 'EQ': -77, 'NE': -77, 'GE': -77, 'LE': -77, '>': -77, '<': -77, 'AND': -77, 'OR': -77, ';': -77, ',': -77, '$end': -77, 'END': -77, 'UNTIL': -77, 'ELSE': -77, 'ELSEIF': -77, 'THEN': -77, 'DO': -77, ')': -77, '}': -77, 'RETURN': -77, 'LOCAL': -77, 'FUNCTION': -77, 'FOR': -77, 'IF': -77, 'REPEAT': -77, 'WHILE': -77, 'GOTO': -77, 'BREAK': -77, 'LABEL': -77, '(': 69, 'NAME': -77, ']': -77, ':': 65, 'LONGSTRING': 50, 'STRING': 51, '{': 45},
+    47: {'.': -78, '[': -78, '^': -78, '%': -78, 'IDIV': -78, '/': -78, '*': -78, '-': -78, '+': -78, 'CONCAT': -78, 'SHR': -78, 'SHL': -78, '&': -78, '~': -78, '|': -78, 'EQ': -78, 'NE': -78, 'GE': -78, 'LE': -78, '>': -78, '<': -78, 'AND': -78, 'OR': -78, ';': -78, ',': -78, '$end': -78, 'END': -78, 'UNTIL': -78, 'ELSE': -78, 'ELSEIF': -78, 'THEN': -78, 'DO': -78, ')': -78, '}': -78, 'RETURN': -78, 'LOCAL': -78, 'FUNCTION': -78, 'FOR': -78, 'IF': -78, 'REPEAT': -78, 'WHILE': -78, 'GOTO': -78, 'BREAK': -78, 'LABEL': -78, '(': 69, 'NAME': -78, ']': -78, ':': 73, 'LONGSTRING': 50, 'STRING': 51, '{': 45},
+    48: {'(': 113},
+    49: {'^': -94, '%': -94, 'IDIV': -94, '/': -94, '*': -94, '-': -94, '+': -94, 'CONCAT': -94, 'SHR': -94, 'SHL': -94, '&': -94, '~': -94, '|': -94, 'EQ': -94, 'NE': -94, 'GE': -94, 'LE': -94, '>': -94, '<': -94, 'AND': -94, 'OR': -94, ';': -94, ',': -94, '$end': -94, 'END': -94, 'UNTIL': -94, 'ELSE': -94, 'ELSEIF': -94, 'THEN': -94, 'DO': -94, ')': -94, '}': -94, 'RETURN': -94, 'LOCAL': -94, 'FUNCTION': -94, 'FOR': -94, 'IF': -94, 'REPEAT': -94, 'WHILE': -94, 'GOTO': -94, 'BREAK': -94, 'LABEL': -94, '(': -94, 'NAME': -94, ']': -94},
+    50: {'^': -108, '%': -108, 'IDIV': -108, '/': -108, '*': -108, '-': -108, '+': -108, 'CONCAT': -108, 'SHR': -108, 'SHL': -108, '&': -108, '~': -108, '|': -108, 'EQ': -108, 'NE': -108, 'GE': -108, 'LE': -108, '>': -108, '<': -108, 'AND': -108, 'OR': -108, ';': -108, ',': -108, '$end': -108, 'END': -108, 'UNTIL': -108, 'ELSE': -108, 'ELSEIF': -108, 'THEN': -108, 'DO': -108, ':': -108, '(': -108, 'LONGSTRING': -108, 'STRING': -108, '{': -108, 'RETURN': -108, 'LOCAL': -108, 'FUNCTION': -108, 'FOR': -108, 'IF': -108, 'REPEAT': -108, 'WHILE': -108, 'GOTO': -108, 'BREAK': -108, 'LABEL': -108, 'NAME': -108, '.': -108, '[': -108, ')': -108, '}': -108, ']': -108},
+    51: {'^': -109, '%': -109, 'IDIV': -109, '/': -109, '*': -109, '-': -109, '+': -109, 'CONCAT': -109, 'SHR': -109, 'SHL': -109, '&': -109, '~': -109, '|': -109, 'EQ': -109, 'NE': -109, 'GE': -109, 'LE': -109, '>': -109, '<': -109, 'AND': -109, 'OR': -109, ';': -109, ',': -109, '$end': -109, 'END': -109, 'UNTIL': -109, 'ELSE': -109, 'ELSEIF': -109, 'THEN': -109, 'DO': -109, ':': -109, '(': -109, 'LONGSTRING': -109, 'STRING': -109, '{': -109, 'RETURN': -109, 'LOCAL': -109, 'FUNCTION': -109, 'FOR': -109, 'IF': -109, 'REPEAT': -109, 'WHILE': -109, 'GOTO': -109, 'BREAK': -109, 'LABEL': -109, 'NAME': -109, '.': -109, '[': -109, ')': -109, '}': -109, ']': -109},
+    52: {':': -80, '(': -80, 'LONGSTRING': -80, 'STRING': -80, '{': -80, '.': -80, '[': -80, '^': -80, '%': -80, 'IDIV': -80, '/': -80, '*': -80, '-': -80, '+': -80, 'CONCAT': -80, 'SHR': -80, 'SHL': -80, '&': -80, '~': -80, '|': -80, 'EQ': -80, 'NE': -80, 'GE': -80, 'LE': -80, '>': -80, '<': -80, 'AND': -80, 'OR': -80, ';': -80, ',': -80, '$end': -80, 'END': -80, 'UNTIL': -80, 'ELSE': -80, 'ELSEIF': -80, 'THEN': -80, 'DO': -80, ')': -80, '}': -80, 'RETURN': -80, 'LOCAL': -80, 'FUNCTION': -80, 'FOR': -80, 'IF': -80, 'REPEAT': -80, 'WHILE': -80, 'GOTO': -80, 'BREAK': -80, 'LABEL': -80, 'NAME': -80, ']': -80},
+    53: {'=': 114, 'RETURN': -7, 'LOCAL': -7, 'FUNCTION': -7, 'FOR': -7, 'IF': -7, 'REPEAT': -7, 'WHILE': -7, 'DO': -7, 'GOTO': -7, 'BREAK': -7, ';': -7, 'LABEL': -7, '(': -7, 'NAME': -7, '$end': -7, 'END': -7, 'UNTIL': -7, 'ELSE': -7, 'ELSEIF': -7, ',': 115},
+    54: {'NAME': 26},
+    55: {'=': -39, ',': -39, 'RETURN': -39, 'LOCAL': -39, 'FUNCTION': -39, 'FOR': -39, 'IF': -39, 'REPEAT': -39, 'WHILE': -39, 'DO': -39, 'GOTO': -39, 'BREAK': -39, ';': -39, 'LABEL': -39, '(': -39, 'NAME': -39, '$end': -39, 'END': -39, 'UNTIL': -39, 'ELSE': -39, 'ELSEIF': -39, ')': -39},
+    56: {'.': 118, ':': 119, '(': 113},
+    57: {'.': -31, ':': -31, '(': -31},
+    58: {'IN': 120, ',': 115},
+    59: {'=': 121, 'IN': -39, ',': -39},
+    60: {'END': 122},
+    61: {'THEN': 123, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    62: {'UNTIL': 124},
+    63: {'DO': 125, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    64: {'RETURN': -17, 'LOCAL': -17, 'FUNCTION': -17, 'FOR': -17, 'IF': -17, 'REPEAT': -17, 'WHILE': -17, 'DO': -17, 'GOTO': -17, 'BREAK': -17, ';': -17, 'LABEL': -17, '(': -17, 'NAME': -17, '$end': -17, 'END': -17, 'UNTIL': -17, 'ELSE': -17, 'ELSEIF': -17},
+    65: {'NAME': 26},
+    66: {':': -83, '(': -83, 'LONGSTRING': -83, 'STRING': -83, '{': -83, 'RETURN': -83, 'LOCAL': -83, 'FUNCTION': -83, 'FOR': -83, 'IF': -83, 'REPEAT': -83, 'WHILE': -83, 'DO': -83, 'GOTO': -83, 'BREAK': -83, ';': -83, 'LABEL': -83, 'NAME': -83, '$end': -83, '.': -83, '[': -83, 'END': -83, 'UNTIL': -83, 'ELSE': -83, 'ELSEIF': -83, '^': -83, '%': -83, 'IDIV': -83, '/': -83, '*': -83, '-': -83, '+': -83, 'CONCAT': -83, 'SHR': -83, 'SHL': -83, '&': -83, '~': -83, '|': -83, 'EQ': -83, 'NE': -83, 'GE': -83, 'LE': -83, '>': -83, '<': -83, 'AND': -83, 'OR': -83, ',': -83, 'THEN': -83, ')': -83, '}': -83, ']': -83},
+    67: {':': -85, '(': -85, 'LONGSTRING': -85, 'STRING': -85, '{': -85, 'RETURN': -85, 'LOCAL': -85, 'FUNCTION': -85, 'FOR': -85, 'IF': -85, 'REPEAT': -85, 'WHILE': -85, 'DO': -85, 'GOTO': -85, 'BREAK': -85, ';': -85, 'LABEL': -85, 'NAME': -85, '$end': -85, '.': -85, '[': -85, 'END': -85, 'UNTIL': -85, 'ELSE': -85, 'ELSEIF': -85, '^': -85, '%': -85, 'IDIV': -85, '/': -85, '*': -85, '-': -85, '+': -85, 'CONCAT': -85, 'SHR': -85, 'SHL': -85, '&': -85, '~': -85, '|': -85, 'EQ': -85, 'NE': -85, 'GE': -85, 'LE': -85, '>': -85, '<': -85, 'AND': -85, 'OR': -85, ',': -85, 'THEN': -85, ')': -85, '}': -85, ']': -85},
+    68: {':': -86, '(': -86, 'LONGSTRING': -86, 'STRING': -86, '{': -86, 'RETURN': -86, 'LOCAL': -86, 'FUNCTION': -86, 'FOR': -86, 'IF': -86, 'REPEAT': -86, 'WHILE': -86, 'DO': -86, 'GOTO': -86, 'BREAK': -86, ';': -86, 'LABEL': -86, 'NAME': -86, '$end': -86, '.': -86, '[': -86, 'END': -86, 'UNTIL': -86, 'ELSE': -86, 'ELSEIF': -86, '^': -86, '%': -86, 'IDIV': -86, '/': -86, '*': -86, '-': -86, '+': -86, 'CONCAT': -86, 'SHR': -86, 'SHL': -86, '&': -86, '~': -86, '|': -86, 'EQ': -86, 'NE': -86, 'GE': -86, 'LE': -86, '>': -86, '<': -86, 'AND': -86, 'OR': -86, ',': -86, 'THEN': -86, ')': -86, '}': -86, ']': -86},
+    69: {')': -107, '~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    70: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    71: {'NAME': 26, '(': 24},
+    72: {'LABEL': 131},
+    73: {'NAME': 26},
+    74: {':': -84, '(': -84, 'LONGSTRING': -84, 'STRING': -84, '{': -84, 'RETURN': -84, 'LOCAL': -84, 'FUNCTION': -84, 'FOR': -84, 'IF': -84, 'REPEAT': -84, 'WHILE': -84, 'DO': -84, 'GOTO': -84, 'BREAK': -84, ';': -84, 'LABEL': -84, 'NAME': -84, '$end': -84, '.': -84, '[': -84, 'END': -84, 'UNTIL': -84, 'ELSE': -84, 'ELSEIF': -84, '^': -84, '%': -84, 'IDIV': -84, '/': -84, '*': -84, '-': -84, '+': -84, 'CONCAT': -84, 'SHR': -84, 'SHL': -84, '&': -84, '~': -84, '|': -84, 'EQ': -84, 'NE': -84, 'GE': -84, 'LE': -84, '>': -84, '<': -84, 'AND': -84, 'OR': -84, ',': -84, 'THEN': -84, ')': -84, '}': -84, ']': -84},
+    75: {')': 133, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    76: {'NAME': 26},
+    77: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    78: {'$end': -28, 'END': -28, 'UNTIL': -28, 'ELSE': -28, 'ELSEIF': -28},
+    79: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    80: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    81: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    82: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    83: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    84: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    85: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    86: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    87: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    88: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    89: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    90: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    91: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    92: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    93: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    94: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    95: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    96: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    97: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    98: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    99: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    100: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    101: {'^': 80, '%': -43, 'IDIV': -43, '/': -43, '*': -43, '-': -43, '+': -43, 'CONCAT': -43, 'SHR': -43, 'SHL': -43, '&': -43, '~': -43, '|': -43, 'EQ': -43, 'NE': -43, 'GE': -43, 'LE': -43, '>': -43, '<': -43, 'AND': -43, 'OR': -43, ';': -43, ',': -43, '$end': -43, 'END': -43, 'UNTIL': -43, 'ELSE': -43, 'ELSEIF': -43, 'THEN': -43, 'DO': -43, ')': -43, '}': -43, 'RETURN': -43, 'LOCAL': -43, 'FUNCTION': -43, 'FOR': -43, 'IF': -43, 'REPEAT': -43, 'WHILE': -43, 'GOTO': -43, 'BREAK': -43, 'LABEL': -43, '(': -43, 'NAME': -43, ']': -43},
+    102: {'^': 80, '%': -44, 'IDIV': -44, '/': -44, '*': -44, '-': -44, '+': -44, 'CONCAT': -44, 'SHR': -44, 'SHL': -44, '&': -44, '~': -44, '|': -44, 'EQ': -44, 'NE': -44, 'GE': -44, 'LE': -44, '>': -44, '<': -44, 'AND': -44, 'OR': -44, ';': -44, ',': -44, '$end': -44, 'END': -44, 'UNTIL': -44, 'ELSE': -44, 'ELSEIF': -44, 'THEN': -44, 'DO': -44, ')': -44, '}': -44, 'RETURN': -44, 'LOCAL': -44, 'FUNCTION': -44, 'FOR': -44, 'IF': -44, 'REPEAT': -44, 'WHILE': -44, 'GOTO': -44, 'BREAK': -44, 'LABEL': -44, '(': -44, 'NAME': -44, ']': -44},
+    103: {'^': 80, '%': -45, 'IDIV': -45, '/': -45, '*': -45, '-': -45, '+': -45, 'CONCAT': -45, 'SHR': -45, 'SHL': -45, '&': -45, '~': -45, '|': -45, 'EQ': -45, 'NE': -45, 'GE': -45, 'LE': -45, '>': -45, '<': -45, 'AND': -45, 'OR': -45, ';': -45, ',': -45, '$end': -45, 'END': -45, 'UNTIL': -45, 'ELSE': -45, 'ELSEIF': -45, 'THEN': -45, 'DO': -45, ')': -45, '}': -45, 'RETURN': -45, 'LOCAL': -45, 'FUNCTION': -45, 'FOR': -45, 'IF': -45, 'REPEAT': -45, 'WHILE': -45, 'GOTO': -45, 'BREAK': -45, 'LABEL': -45, '(': -45, 'NAME': -45, ']': -45},
+    104: {'^': 80, '%': -46, 'IDIV': -46, '/': -46, '*': -46, '-': -46, '+': -46, 'CONCAT': -46, 'SHR': -46, 'SHL': -46, '&': -46, '~': -46, '|': -46, 'EQ': -46, 'NE': -46, 'GE': -46, 'LE': -46, '>': -46, '<': -46, 'AND': -46, 'OR': -46, ';': -46, ',': -46, '$end': -46, 'END': -46, 'UNTIL': -46, 'ELSE': -46, 'ELSEIF': -46, 'THEN': -46, 'DO': -46, ')': -46, '}': -46, 'RETURN': -46, 'LOCAL': -46, 'FUNCTION': -46, 'FOR': -46, 'IF': -46, 'REPEAT': -46, 'WHILE': -46, 'GOTO': -46, 'BREAK': -46, 'LABEL': -46, '(': -46, 'NAME': -46, ']': -46},
+    105: {'}': 158},
+    106: {'}': 159},
+    107: {'}': -98, ';': 161, ',': 162},
+    108: {';': -99, ',': -99, '}': -99},
+    109: {';': -101, ',': -101, '}': -101, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    110: {'=': 163, ':': -38, '(': -38, 'LONGSTRING': -38, 'STRING': -38, '{': -38, '.': -38, '[': -38, '^': -38, '%': -38, 'IDIV': -38, '/': -38, '*': -38, '-': -38, '+': -38, 'CONCAT': -38, 'SHR': -38, 'SHL': -38, '&': -38, '~': -38, '|': -38, 'EQ': -38, 'NE': -38, 'GE': -38, 'LE': -38, '>': -38, '<': -38, 'AND': -38, 'OR': -38, ';': -38, ',': -38, '}': -38},
+    111: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    112: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    113: {'ELLIPSIS': 49, ')': -107, 'NAME': 26},
+    114: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    115: {'NAME': 26},
+    116: {'(': 113},
+    117: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    118: {'NAME': 26},
+    119: {'NAME': 26},
+    120: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    121: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    122: {'RETURN': -16, 'LOCAL': -16, 'FUNCTION': -16, 'FOR': -16, 'IF': -16, 'REPEAT': -16, 'WHILE': -16, 'DO': -16, 'GOTO': -16, 'BREAK': -16, ';': -16, 'LABEL': -16, '(': -16, 'NAME': -16, '$end': -16, 'END': -16, 'UNTIL': -16, 'ELSE': -16, 'ELSEIF': -16},
+    123: {'END': -3, 'ELSE': -3, 'ELSEIF': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    124: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    125: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    126: {'(': 69, 'LONGSTRING': 50, 'STRING': 51, '{': 45},
+    127: {')': 181},
+    128: {')': 182, ',': 79},
+    129: {'RETURN': -21, 'LOCAL': -21, 'FUNCTION': -21, 'FOR': -21, 'IF': -21, 'REPEAT': -21, 'WHILE': -21, 'DO': -21, 'GOTO': -21, 'BREAK': -21, ';': -21, 'LABEL': -21, '(': -21, 'NAME': -21, '$end': -21, 'END': -21, 'UNTIL': -21, 'ELSE': -21, 'ELSEIF': -21, ',': 79},
+    130: {'=': -35, ',': -35, ':': -80, '(': -80, 'LONGSTRING': -80, 'STRING': -80, '{': -80, '.': -80, '[': -80},
+    131: {'RETURN': -30, 'LOCAL': -30, 'FUNCTION': -30, 'FOR': -30, 'IF': -30, 'REPEAT': -30, 'WHILE': -30, 'DO': -30, 'GOTO': -30, 'BREAK': -30, ';': -30, 'LABEL': -30, '(': -30, 'NAME': -30, '$end': -30, 'END': -30, 'UNTIL': -30, 'ELSE': -30, 'ELSEIF': -30},
+    132: {'(': 69, 'LONGSTRING': 50, 'STRING': 51, '{': 45},
+    133: {':': -79, '(': -79, 'LONGSTRING': -79, 'STRING': -79, '{': -79, '.': -79, '[': -79, '^': -79, '%': -79, 'IDIV': -79, '/': -79, '*': -79, '-': -79, '+': -79, 'CONCAT': -79, 'SHR': -79, 'SHL': -79, '&': -79, '~': -79, '|': -79, 'EQ': -79, 'NE': -79, 'GE': -79, 'LE': -79, '>': -79, '<': -79, 'AND': -79, 'OR': -79, ';': -79, ',': -79, '$end': -79, 'END': -79, 'UNTIL': -79, 'ELSE': -79, 'ELSEIF': -79, 'THEN': -79, 'DO': -79, ')': -79, '}': -79, 'RETURN': -79, 'LOCAL': -79, 'FUNCTION': -79, 'FOR': -79, 'IF': -79, 'REPEAT': -79, 'WHILE': -79, 'GOTO': -79, 'BREAK': -79, 'LABEL': -79, 'NAME': -79, ']': -79},
+    134: {'=': -36, ',': -36, ':': -36, '(': -36, 'LONGSTRING': -36, 'STRING': -36, '{': -36, '.': -36, '[': -36, '^': -36, '%': -36, 'IDIV': -36, '/': -36, '*': -36, '-': -36, '+': -36, 'CONCAT': -36, 'SHR': -36, 'SHL': -36, '&': -36, '~': -36, '|': -36, 'EQ': -36, 'NE': -36, 'GE': -36, 'LE': -36, '>': -36, '<': -36, 'AND': -36, 'OR': -36, ';': -36, '$end': -36, 'END': -36, 'UNTIL': -36, 'ELSE': -36, 'ELSEIF': -36, 'THEN': -36, 'DO': -36, ')': -36, '}': -36, 'RETURN': -36, 'LOCAL': -36, 'FUNCTION': -36, 'FOR': -36, 'IF': -36, 'REPEAT': -36, 'WHILE': -36, 'GOTO': -36, 'BREAK': -36, 'LABEL': -36, 'NAME': -36, ']': -36},
+    135: {']': 184, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    136: {';': -42, ',': -42, '$end': -42, 'END': -42, 'UNTIL': -42, 'ELSE': -42, 'ELSEIF': -42, ')': -42, 'RETURN': -42, 'LOCAL': -42, 'FUNCTION': -42, 'FOR': -42, 'IF': -42, 'REPEAT': -42, 'WHILE': -42, 'DO': -42, 'GOTO': -42, 'BREAK': -42, 'LABEL': -42, '(': -42, 'NAME': -42, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    137: {'^': 80, '%': -47, 'IDIV': -47, '/': -47, '*': -47, '-': -47, '+': -47, 'CONCAT': -47, 'SHR': -47, 'SHL': -47, '&': -47, '~': -47, '|': -47, 'EQ': -47, 'NE': -47, 'GE': -47, 'LE': -47, '>': -47, '<': -47, 'AND': -47, 'OR': -47, ';': -47, ',': -47, '$end': -47, 'END': -47, 'UNTIL': -47, 'ELSE': -47, 'ELSEIF': -47, 'THEN': -47, 'DO': -47, ')': -47, '}': -47, 'RETURN': -47, 'LOCAL': -47, 'FUNCTION': -47, 'FOR': -47, 'IF': -47, 'REPEAT': -47, 'WHILE': -47, 'GOTO': -47, 'BREAK': -47, 'LABEL': -47, '(': -47, 'NAME': -47, ']': -47},
+    138: {'^': 80, '%': -48, 'IDIV': -48, '/': -48, '*': -48, '-': -48, '+': -48, 'CONCAT': -48, 'SHR': -48, 'SHL': -48, '&': -48, '~': -48, '|': -48, 'EQ': -48, 'NE': -48, 'GE': -48, 'LE': -48, '>': -48, '<': -48, 'AND': -48, 'OR': -48, ';': -48, ',': -48, '$end': -48, 'END': -48, 'UNTIL': -48, 'ELSE': -48, 'ELSEIF': -48, 'THEN': -48, 'DO': -48, ')': -48, '}': -48, 'RETURN': -48, 'LOCAL': -48, 'FUNCTION': -48, 'FOR': -48, 'IF': -48, 'REPEAT': -48, 'WHILE': -48, 'GOTO': -48, 'BREAK': -48, 'LABEL': -48, '(': -48, 'NAME': -48, ']': -48},
+    139: {'^': 80, '%': -49, 'IDIV': -49, '/': -49, '*': -49, '-': -49, '+': -49, 'CONCAT': -49, 'SHR': -49, 'SHL': -49, '&': -49, '~': -49, '|': -49, 'EQ': -49, 'NE': -49, 'GE': -49, 'LE': -49, '>': -49, '<': -49, 'AND': -49, 'OR': -49, ';': -49, ',': -49, '$end': -49, 'END': -49, 'UNTIL': -49, 'ELSE': -49, 'ELSEIF': -49, 'THEN': -49, 'DO': -49, ')': -49, '}': -49, 'RETURN': -49, 'LOCAL': -49, 'FUNCTION': -49, 'FOR': -49, 'IF': -49, 'REPEAT': -49, 'WHILE': -49, 'GOTO': -49, 'BREAK': -49, 'LABEL': -49, '(': -49, 'NAME': -49, ']': -49},
+    140: {'^': 80, '%': -50, 'IDIV': -50, '/': -50, '*': -50, '-': -50, '+': -50, 'CONCAT': -50, 'SHR': -50, 'SHL': -50, '&': -50, '~': -50, '|': -50, 'EQ': -50, 'NE': -50, 'GE': -50, 'LE': -50, '>': -50, '<': -50, 'AND': -50, 'OR': -50, ';': -50, ',': -50, '$end': -50, 'END': -50, 'UNTIL': -50, 'ELSE': -50, 'ELSEIF': -50, 'THEN': -50, 'DO': -50, ')': -50, '}': -50, 'RETURN': -50, 'LOCAL': -50, 'FUNCTION': -50, 'FOR': -50, 'IF': -50, 'REPEAT': -50, 'WHILE': -50, 'GOTO': -50, 'BREAK': -50, 'LABEL': -50, '(': -50, 'NAME': -50, ']': -50},
+    141: {'^': 80, '%': -51, 'IDIV': -51, '/': -51, '*': -51, '-': -51, '+': -51, 'CONCAT': -51, 'SHR': -51, 'SHL': -51, '&': -51, '~': -51, '|': -51, 'EQ': -51, 'NE': -51, 'GE': -51, 'LE': -51, '>': -51, '<': -51, 'AND': -51, 'OR': -51, ';': -51, ',': -51, '$end': -51, 'END': -51, 'UNTIL': -51, 'ELSE': -51, 'ELSEIF': -51, 'THEN': -51, 'DO': -51, ')': -51, '}': -51, 'RETURN': -51, 'LOCAL': -51, 'FUNCTION': -51, 'FOR': -51, 'IF': -51, 'REPEAT': -51, 'WHILE': -51, 'GOTO': -51, 'BREAK': -51, 'LABEL': -51, '(': -51, 'NAME': -51, ']': -51},
+    142: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': -52, '+': -52, 'CONCAT': -52, 'SHR': -52, 'SHL': -52, '&': -52, '~': -52, '|': -52, 'EQ': -52, 'NE': -52, 'GE': -52, 'LE': -52, '>': -52, '<': -52, 'AND': -52, 'OR': -52, ';': -52, ',': -52, '$end': -52, 'END': -52, 'UNTIL': -52, 'ELSE': -52, 'ELSEIF': -52, 'THEN': -52, 'DO': -52, ')': -52, '}': -52, 'RETURN': -52, 'LOCAL': -52, 'FUNCTION': -52, 'FOR': -52, 'IF': -52, 'REPEAT': -52, 'WHILE': -52, 'GOTO': -52, 'BREAK': -52, 'LABEL': -52, '(': -52, 'NAME': -52, ']': -52},
+    143: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': -53, '+': -53, 'CONCAT': -53, 'SHR': -53, 'SHL': -53, '&': -53, '~': -53, '|': -53, 'EQ': -53, 'NE': -53, 'GE': -53, 'LE': -53, '>': -53, '<': -53, 'AND': -53, 'OR': -53, ';': -53, ',': -53, '$end': -53, 'END': -53, 'UNTIL': -53, 'ELSE': -53, 'ELSEIF': -53, 'THEN': -53, 'DO': -53, ')': -53, '}': -53, 'RETURN': -53, 'LOCAL': -53, 'FUNCTION': -53, 'FOR': -53, 'IF': -53, 'REPEAT': -53, 'WHILE': -53, 'GOTO': -53, 'BREAK': -53, 'LABEL': -53, '(': -53, 'NAME': -53, ']': -53},
+    144: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': -54, 'SHL': -54, '&': -54, '~': -54, '|': -54, 'EQ': -54, 'NE': -54, 'GE': -54, 'LE': -54, '>': -54, '<': -54, 'AND': -54, 'OR': -54, ';': -54, ',': -54, '$end': -54, 'END': -54, 'UNTIL': -54, 'ELSE': -54, 'ELSEIF': -54, 'THEN': -54, 'DO': -54, ')': -54, '}': -54, 'RETURN': -54, 'LOCAL': -54, 'FUNCTION': -54, 'FOR': -54, 'IF': -54, 'REPEAT': -54, 'WHILE': -54, 'GOTO': -54, 'BREAK': -54, 'LABEL': -54, '(': -54, 'NAME': -54, ']': -54},
+    145: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': -55, 'SHL': -55, '&': -55, '~': -55, '|': -55, 'EQ': -55, 'NE': -55, 'GE': -55, 'LE': -55, '>': -55, '<': -55, 'AND': -55, 'OR': -55, ';': -55, ',': -55, '$end': -55, 'END': -55, 'UNTIL': -55, 'ELSE': -55, 'ELSEIF': -55, 'THEN': -55, 'DO': -55, ')': -55, '}': -55, 'RETURN': -55, 'LOCAL': -55, 'FUNCTION': -55, 'FOR': -55, 'IF': -55, 'REPEAT': -55, 'WHILE': -55, 'GOTO': -55, 'BREAK': -55, 'LABEL': -55, '(': -55, 'NAME': -55, ']': -55},
+    146: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': -56, 'SHL': -56, '&': -56, '~': -56, '|': -56, 'EQ': -56, 'NE': -56, 'GE': -56, 'LE': -56, '>': -56, '<': -56, 'AND': -56, 'OR': -56, ';': -56, ',': -56, '$end': -56, 'END': -56, 'UNTIL': -56, 'ELSE': -56, 'ELSEIF': -56, 'THEN': -56, 'DO': -56, ')': -56, '}': -56, 'RETURN': -56, 'LOCAL': -56, 'FUNCTION': -56, 'FOR': -56, 'IF': -56, 'REPEAT': -56, 'WHILE': -56, 'GOTO': -56, 'BREAK': -56, 'LABEL': -56, '(': -56, 'NAME': -56, ']': -56},
+    147: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': -57, '~': -57, '|': -57, 'EQ': -57, 'NE': -57, 'GE': -57, 'LE': -57, '>': -57, '<': -57, 'AND': -57, 'OR': -57, ';': -57, ',': -57, '$end': -57, 'END': -57, 'UNTIL': -57, 'ELSE': -57, 'ELSEIF': -57, 'THEN': -57, 'DO': -57, ')': -57, '}': -57, 'RETURN': -57, 'LOCAL': -57, 'FUNCTION': -57, 'FOR': -57, 'IF': -57, 'REPEAT': -57, 'WHILE': -57, 'GOTO': -57, 'BREAK': -57, 'LABEL': -57, '(': -57, 'NAME': -57, ']': -57},
+    148: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': -58, '|': -58, 'EQ': -58, 'NE': -58, 'GE': -58, 'LE': -58, '>': -58, '<': -58, 'AND': -58, 'OR': -58, ';': -58, ',': -58, '$end': -58, 'END': -58, 'UNTIL': -58, 'ELSE': -58, 'ELSEIF': -58, 'THEN': -58, 'DO': -58, ')': -58, '}': -58, 'RETURN': -58, 'LOCAL': -58, 'FUNCTION': -58, 'FOR': -58, 'IF': -58, 'REPEAT': -58, 'WHILE': -58, 'GOTO': -58, 'BREAK': -58, 'LABEL': -58, '(': -58, 'NAME': -58, ']': -58},
+    149: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': -59, 'EQ': -59, 'NE': -59, 'GE': -59, 'LE': -59, '>': -59, '<': -59, 'AND': -59, 'OR': -59, ';': -59, ',': -59, '$end': -59, 'END': -59, 'UNTIL': -59, 'ELSE': -59, 'ELSEIF': -59, 'THEN': -59, 'DO': -59, ')': -59, '}': -59, 'RETURN': -59, 'LOCAL': -59, 'FUNCTION': -59, 'FOR': -59, 'IF': -59, 'REPEAT': -59, 'WHILE': -59, 'GOTO': -59, 'BREAK': -59, 'LABEL': -59, '(': -59, 'NAME': -59, ']': -59},
+    150: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': -60, 'NE': -60, 'GE': -60, 'LE': -60, '>': -60, '<': -60, 'AND': -60, 'OR': -60, ';': -60, ',': -60, '$end': -60, 'END': -60, 'UNTIL': -60, 'ELSE': -60, 'ELSEIF': -60, 'THEN': -60, 'DO': -60, ')': -60, '}': -60, 'RETURN': -60, 'LOCAL': -60, 'FUNCTION': -60, 'FOR': -60, 'IF': -60, 'REPEAT': -60, 'WHILE': -60, 'GOTO': -60, 'BREAK': -60, 'LABEL': -60, '(': -60, 'NAME': -60, ']': -60},
+    151: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': -61, 'NE': -61, 'GE': -61, 'LE': -61, '>': -61, '<': -61, 'AND': -61, 'OR': -61, ';': -61, ',': -61, '$end': -61, 'END': -61, 'UNTIL': -61, 'ELSE': -61, 'ELSEIF': -61, 'THEN': -61, 'DO': -61, ')': -61, '}': -61, 'RETURN': -61, 'LOCAL': -61, 'FUNCTION': -61, 'FOR': -61, 'IF': -61, 'REPEAT': -61, 'WHILE': -61, 'GOTO': -61, 'BREAK': -61, 'LABEL': -61, '(': -61, 'NAME': -61, ']': -61},
+    152: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': -62, 'NE': -62, 'GE': -62, 'LE': -62, '>': -62, '<': -62, 'AND': -62, 'OR': -62, ';': -62, ',': -62, '$end': -62, 'END': -62, 'UNTIL': -62, 'ELSE': -62, 'ELSEIF': -62, 'THEN': -62, 'DO': -62, ')': -62, '}': -62, 'RETURN': -62, 'LOCAL': -62, 'FUNCTION': -62, 'FOR': -62, 'IF': -62, 'REPEAT': -62, 'WHILE': -62, 'GOTO': -62, 'BREAK': -62, 'LABEL': -62, '(': -62, 'NAME': -62, ']': -62},
+    153: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': -63, 'NE': -63, 'GE': -63, 'LE': -63, '>': -63, '<': -63, 'AND': -63, 'OR': -63, ';': -63, ',': -63, '$end': -63, 'END': -63, 'UNTIL': -63, 'ELSE': -63, 'ELSEIF': -63, 'THEN': -63, 'DO': -63, ')': -63, '}': -63, 'RETURN': -63, 'LOCAL': -63, 'FUNCTION': -63, 'FOR': -63, 'IF': -63, 'REPEAT': -63, 'WHILE': -63, 'GOTO': -63, 'BREAK': -63, 'LABEL': -63, '(': -63, 'NAME': -63, ']': -63},
+    154: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': -64, 'NE': -64, 'GE': -64, 'LE': -64, '>': -64, '<': -64, 'AND': -64, 'OR': -64, ';': -64, ',': -64, '$end': -64, 'END': -64, 'UNTIL': -64, 'ELSE': -64, 'ELSEIF': -64, 'THEN': -64, 'DO': -64, ')': -64, '}': -64, 'RETURN': -64, 'LOCAL': -64, 'FUNCTION': -64, 'FOR': -64, 'IF': -64, 'REPEAT': -64, 'WHILE': -64, 'GOTO': -64, 'BREAK': -64, 'LABEL': -64, '(': -64, 'NAME': -64, ']': -64},
+    155: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': -65, 'NE': -65, 'GE': -65, 'LE': -65, '>': -65, '<': -65, 'AND': -65, 'OR': -65, ';': -65, ',': -65, '$end': -65, 'END': -65, 'UNTIL': -65, 'ELSE': -65, 'ELSEIF': -65, 'THEN': -65, 'DO': -65, ')': -65, '}': -65, 'RETURN': -65, 'LOCAL': -65, 'FUNCTION': -65, 'FOR': -65, 'IF': -65, 'REPEAT': -65, 'WHILE': -65, 'GOTO': -65, 'BREAK': -65, 'LABEL': -65, '(': -65, 'NAME': -65, ']': -65},
+    156: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': -66, 'OR': -66, ';': -66, ',': -66, '$end': -66, 'END': -66, 'UNTIL': -66, 'ELSE': -66, 'ELSEIF': -66, 'THEN': -66, 'DO': -66, ')': -66, '}': -66, 'RETURN': -66, 'LOCAL': -66, 'FUNCTION': -66, 'FOR': -66, 'IF': -66, 'REPEAT': -66, 'WHILE': -66, 'GOTO': -66, 'BREAK': -66, 'LABEL': -66, '(': -66, 'NAME': -66, ']': -66},
+    157: {'^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': -67, ';': -67, ',': -67, '$end': -67, 'END': -67, 'UNTIL': -67, 'ELSE': -67, 'ELSEIF': -67, 'THEN': -67, 'DO': -67, ')': -67, '}': -67, 'RETURN': -67, 'LOCAL': -67, 'FUNCTION': -67, 'FOR': -67, 'IF': -67, 'REPEAT': -67, 'WHILE': -67, 'GOTO': -67, 'BREAK': -67, 'LABEL': -67, '(': -67, 'NAME': -67, ']': -67},
+    158: {'^': -95, '%': -95, 'IDIV': -95, '/': -95, '*': -95, '-': -95, '+': -95, 'CONCAT': -95, 'SHR': -95, 'SHL': -95, '&': -95, '~': -95, '|': -95, 'EQ': -95, 'NE': -95, 'GE': -95, 'LE': -95, '>': -95, '<': -95, 'AND': -95, 'OR': -95, ';': -95, ',': -95, '$end': -95, 'END': -95, 'UNTIL': -95, 'ELSE': -95, 'ELSEIF': -95, 'THEN': -95, 'DO': -95, ':': -95, '(': -95, 'LONGSTRING': -95, 'STRING': -95, '{': -95, 'RETURN': -95, 'LOCAL': -95, 'FUNCTION': -95, 'FOR': -95, 'IF': -95, 'REPEAT': -95, 'WHILE': -95, 'GOTO': -95, 'BREAK': -95, 'LABEL': -95, 'NAME': -95, '.': -95, '[': -95, ')': -95, '}': -95, ']': -95},
+    159: {'^': -96, '%': -96, 'IDIV': -96, '/': -96, '*': -96, '-': -96, '+': -96, 'CONCAT': -96, 'SHR': -96, 'SHL': -96, '&': -96, '~': -96, '|': -96, 'EQ': -96, 'NE': -96, 'GE': -96, 'LE': -96, '>': -96, '<': -96, 'AND': -96, 'OR': -96, ';': -96, ',': -96, '$end': -96, 'END': -96, 'UNTIL': -96, 'ELSE': -96, 'ELSEIF': -96, 'THEN': -96, 'DO': -96, ':': -96, '(': -96, 'LONGSTRING': -96, 'STRING': -96, '{': -96, 'RETURN': -96, 'LOCAL': -96, 'FUNCTION': -96, 'FOR': -96, 'IF': -96, 'REPEAT': -96, 'WHILE': -96, 'GOTO': -96, 'BREAK': -96, 'LABEL': -96, 'NAME': -96, '.': -96, '[': -96, ')': -96, '}': -96, ']': -96},
+    160: {'}': -97, '[': 111, '~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, 'NAME': 26, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24},
+    161: {'[': -104, '~': -104, '-': -104, '#': -104, 'NOT': -104, 'NUMBER': -104, 'FALSE': -104, 'TRUE': -104, 'NIL': -104, 'NAME': -104, '{': -104, 'FUNCTION': -104, 'ELLIPSIS': -104, 'LONGSTRING': -104, 'STRING': -104, '(': -104, '}': -104},
+    162: {'[': -105, '~': -105, '-': -105, '#': -105, 'NOT': -105, 'NUMBER': -105, 'FALSE': -105, 'TRUE': -105, 'NIL': -105, 'NAME': -105, '{': -105, 'FUNCTION': -105, 'ELLIPSIS': -105, 'LONGSTRING': -105, 'STRING': -105, '(': -105, '}': -105},
+    163: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    164: {']': 187, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    165: {'END': 188},
+    166: {')': 189},
+    167: {',': 190, ')': 191},
+    168: {')': 192},
+    169: {'RETURN': -6, 'LOCAL': -6, 'FUNCTION': -6, 'FOR': -6, 'IF': -6, 'REPEAT': -6, 'WHILE': -6, 'DO': -6, 'GOTO': -6, 'BREAK': -6, ';': -6, 'LABEL': -6, '(': -6, 'NAME': -6, '$end': -6, 'END': -6, 'UNTIL': -6, 'ELSE': -6, 'ELSEIF': -6, ',': 79},
+    170: {'=': -40, ',': -40, 'RETURN': -40, 'LOCAL': -40, 'FUNCTION': -40, 'FOR': -40, 'IF': -40, 'REPEAT': -40, 'WHILE': -40, 'DO': -40, 'GOTO': -40, 'BREAK': -40, ';': -40, 'LABEL': -40, '(': -40, 'NAME': -40, '$end': -40, 'END': -40, 'UNTIL': -40, 'ELSE': -40, 'ELSEIF': -40, 'IN': -40, ')': -40},
+    171: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    172: {'END': 194},
+    173: {'.': -32, ':': -32, '(': -32},
+    174: {'.': -33, ':': -33, '(': -33},
+    175: {'DO': 195, ',': 79},
+    176: {',': 196, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    177: {'END': 198, 'ELSE': 199, 'ELSEIF': 200},
+    178: {'RETURN': -14, 'LOCAL': -14, 'FUNCTION': -14, 'FOR': -14, 'IF': -14, 'REPEAT': -14, 'WHILE': -14, 'DO': -14, 'GOTO': -14, 'BREAK': -14, ';': -14, 'LABEL': -14, '(': -14, 'NAME': -14, '$end': -14, 'END': -14, 'UNTIL': -14, 'ELSE': -14, 'ELSEIF': -14, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    179: {'END': 201},
+    180: {':': -81, '(': -81, 'LONGSTRING': -81, 'STRING': -81, '{': -81, 'RETURN': -81, 'LOCAL': -81, 'FUNCTION': -81, 'FOR': -81, 'IF': -81, 'REPEAT': -81, 'WHILE': -81, 'DO': -81, 'GOTO': -81, 'BREAK': -81, ';': -81, 'LABEL': -81, 'NAME': -81, '$end': -81, '.': -81, '[': -81, 'END': -81, 'UNTIL': -81, 'ELSE': -81, 'ELSEIF': -81, '^': -81, '%': -81, 'IDIV': -81, '/': -81, '*': -81, '-': -81, '+': -81, 'CONCAT': -81, 'SHR': -81, 'SHL': -81, '&': -81, '~': -81, '|': -81, 'EQ': -81, 'NE': -81, 'GE': -81, 'LE': -81, '>': -81, '<': -81, 'AND': -81, 'OR': -81, ',': -81, 'THEN': -81, ')': -81, '}': -81, ']': -81},
+    181: {':': -87, '(': -87, 'LONGSTRING': -87, 'STRING': -87, '{': -87, 'RETURN': -87, 'LOCAL': -87, 'FUNCTION': -87, 'FOR': -87, 'IF': -87, 'REPEAT': -87, 'WHILE': -87, 'DO': -87, 'GOTO': -87, 'BREAK': -87, ';': -87, 'LABEL': -87, 'NAME': -87, '$end': -87, '.': -87, '[': -87, 'END': -87, 'UNTIL': -87, 'ELSE': -87, 'ELSEIF': -87, '^': -87, '%': -87, 'IDIV': -87, '/': -87, '*': -87, '-': -87, '+': -87, 'CONCAT': -87, 'SHR': -87, 'SHL': -87, '&': -87, '~': -87, '|': -87, 'EQ': -87, 'NE': -87, 'GE': -87, 'LE': -87, '>': -87, '<': -87, 'AND': -87, 'OR': -87, ',': -87, 'THEN': -87, ')': -87, '}': -87, ']': -87},
+    182: {':': -88, '(': -88, 'LONGSTRING': -88, 'STRING': -88, '{': -88, 'RETURN': -88, 'LOCAL': -88, 'FUNCTION': -88, 'FOR': -88, 'IF': -88, 'REPEAT': -88, 'WHILE': -88, 'DO': -88, 'GOTO': -88, 'BREAK': -88, ';': -88, 'LABEL': -88, 'NAME': -88, '$end': -88, '.': -88, '[': -88, 'END': -88, 'UNTIL': -88, 'ELSE': -88, 'ELSEIF': -88, '^': -88, '%': -88, 'IDIV': -88, '/': -88, '*': -88, '-': -88, '+': -88, 'CONCAT': -88, 'SHR': -88, 'SHL': -88, '&': -88, '~': -88, '|': -88, 'EQ': -88, 'NE': -88, 'GE': -88, 'LE': -88, '>': -88, '<': -88, 'AND': -88, 'OR': -88, ',': -88, 'THEN': -88, ')': -88, '}': -88, ']': -88},
+    183: {':': -82, '(': -82, 'LONGSTRING': -82, 'STRING': -82, '{': -82, 'RETURN': -82, 'LOCAL': -82, 'FUNCTION': -82, 'FOR': -82, 'IF': -82, 'REPEAT': -82, 'WHILE': -82, 'DO': -82, 'GOTO': -82, 'BREAK': -82, ';': -82, 'LABEL': -82, 'NAME': -82, '$end': -82, '.': -82, '[': -82, 'END': -82, 'UNTIL': -82, 'ELSE': -82, 'ELSEIF': -82, '^': -82, '%': -82, 'IDIV': -82, '/': -82, '*': -82, '-': -82, '+': -82, 'CONCAT': -82, 'SHR': -82, 'SHL': -82, '&': -82, '~': -82, '|': -82, 'EQ': -82, 'NE': -82, 'GE': -82, 'LE': -82, '>': -82, '<': -82, 'AND': -82, 'OR': -82, ',': -82, 'THEN': -82, ')': -82, '}': -82, ']': -82},
+    184: {'=': -37, ',': -37, ':': -37, '(': -37, 'LONGSTRING': -37, 'STRING': -37, '{': -37, '.': -37, '[': -37, '^': -37, '%': -37, 'IDIV': -37, '/': -37, '*': -37, '-': -37, '+': -37, 'CONCAT': -37, 'SHR': -37, 'SHL': -37, '&': -37, '~': -37, '|': -37, 'EQ': -37, 'NE': -37, 'GE': -37, 'LE': -37, '>': -37, '<': -37, 'AND': -37, 'OR': -37, ';': -37, '$end': -37, 'END': -37, 'UNTIL': -37, 'ELSE': -37, 'ELSEIF': -37, 'THEN': -37, 'DO': -37, ')': -37, '}': -37, 'RETURN': -37, 'LOCAL': -37, 'FUNCTION': -37, 'FOR': -37, 'IF': -37, 'REPEAT': -37, 'WHILE': -37, 'GOTO': -37, 'BREAK': -37, 'LABEL': -37, 'NAME': -37, ']': -37},
+    185: {';': -100, ',': -100, '}': -100},
+    186: {';': -102, ',': -102, '}': -102, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    187: {'=': 202},
+    188: {'^': -89, '%': -89, 'IDIV': -89, '/': -89, '*': -89, '-': -89, '+': -89, 'CONCAT': -89, 'SHR': -89, 'SHL': -89, '&': -89, '~': -89, '|': -89, 'EQ': -89, 'NE': -89, 'GE': -89, 'LE': -89, '>': -89, '<': -89, 'AND': -89, 'OR': -89, ';': -89, ',': -89, '$end': -89, 'END': -89, 'UNTIL': -89, 'ELSE': -89, 'ELSEIF': -89, 'THEN': -89, 'DO': -89, ')': -89, '}': -89, 'RETURN': -89, 'LOCAL': -89, 'FUNCTION': -89, 'FOR': -89, 'IF': -89, 'REPEAT': -89, 'WHILE': -89, 'GOTO': -89, 'BREAK': -89, 'LABEL': -89, '(': -89, 'NAME': -89, ']': -89},
+    189: {'RETURN': -90, 'LOCAL': -90, 'FUNCTION': -90, 'FOR': -90, 'IF': -90, 'REPEAT': -90, 'WHILE': -90, 'DO': -90, 'GOTO': -90, 'BREAK': -90, ';': -90, 'LABEL': -90, '(': -90, 'NAME': -90, 'END': -90},
+    190: {'ELLIPSIS': 49, 'NAME': 26},
+    191: {'RETURN': -93, 'LOCAL': -93, 'FUNCTION': -93, 'FOR': -93, 'IF': -93, 'REPEAT': -93, 'WHILE': -93, 'DO': -93, 'GOTO': -93, 'BREAK': -93, ';': -93, 'LABEL': -93, '(': -93, 'NAME': -93, 'END': -93},
+    192: {'RETURN': -92, 'LOCAL': -92, 'FUNCTION': -92, 'FOR': -92, 'IF': -92, 'REPEAT': -92, 'WHILE': -92, 'DO': -92, 'GOTO': -92, 'BREAK': -92, ';': -92, 'LABEL': -92, '(': -92, 'NAME': -92, 'END': -92},
+    193: {'END': 204},
+    194: {'RETURN': -9, 'LOCAL': -9, 'FUNCTION': -9, 'FOR': -9, 'IF': -9, 'REPEAT': -9, 'WHILE': -9, 'DO': -9, 'GOTO': -9, 'BREAK': -9, ';': -9, 'LABEL': -9, '(': -9, 'NAME': -9, '$end': -9, 'END': -9, 'UNTIL': -9, 'ELSE': -9, 'ELSEIF': -9},
+    195: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    196: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    197: {'RETURN': -13, 'LOCAL': -13, 'FUNCTION': -13, 'FOR': -13, 'IF': -13, 'REPEAT': -13, 'WHILE': -13, 'DO': -13, 'GOTO': -13, 'BREAK': -13, ';': -13, 'LABEL': -13, '(': -13, 'NAME': -13, '$end': -13, 'END': -13, 'UNTIL': -13, 'ELSE': -13, 'ELSEIF': -13},
+    198: {'RETURN': -23, 'LOCAL': -23, 'FUNCTION': -23, 'FOR': -23, 'IF': -23, 'REPEAT': -23, 'WHILE': -23, 'DO': -23, 'GOTO': -23, 'BREAK': -23, ';': -23, 'LABEL': -23, '(': -23, 'NAME': -23, '$end': -23, 'END': -23, 'UNTIL': -23, 'ELSE': -23, 'ELSEIF': -23},
+    199: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    200: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    201: {'RETURN': -15, 'LOCAL': -15, 'FUNCTION': -15, 'FOR': -15, 'IF': -15, 'REPEAT': -15, 'WHILE': -15, 'DO': -15, 'GOTO': -15, 'BREAK': -15, ';': -15, 'LABEL': -15, '(': -15, 'NAME': -15, '$end': -15, 'END': -15, 'UNTIL': -15, 'ELSE': -15, 'ELSEIF': -15},
+    202: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    203: {')': 210},
+    204: {'RETURN': -8, 'LOCAL': -8, 'FUNCTION': -8, 'FOR': -8, 'IF': -8, 'REPEAT': -8, 'WHILE': -8, 'DO': -8, 'GOTO': -8, 'BREAK': -8, ';': -8, 'LABEL': -8, '(': -8, 'NAME': -8, '$end': -8, 'END': -8, 'UNTIL': -8, 'ELSE': -8, 'ELSEIF': -8},
+    205: {'END': 211},
+    206: {',': 212, 'DO': 213, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    207: {'END': 214},
+    208: {'THEN': 215, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    209: {';': -103, ',': -103, '}': -103, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    210: {'RETURN': -91, 'LOCAL': -91, 'FUNCTION': -91, 'FOR': -91, 'IF': -91, 'REPEAT': -91, 'WHILE': -91, 'DO': -91, 'GOTO': -91, 'BREAK': -91, ';': -91, 'LABEL': -91, '(': -91, 'NAME': -91, 'END': -91},
+    211: {'RETURN': -10, 'LOCAL': -10, 'FUNCTION': -10, 'FOR': -10, 'IF': -10, 'REPEAT': -10, 'WHILE': -10, 'DO': -10, 'GOTO': -10, 'BREAK': -10, ';': -10, 'LABEL': -10, '(': -10, 'NAME': -10, '$end': -10, 'END': -10, 'UNTIL': -10, 'ELSE': -10, 'ELSEIF': -10},
+    212: {'~': 32, '-': 33, '#': 34, 'NOT': 35, 'NUMBER': 41, 'FALSE': 42, 'TRUE': 43, 'NIL': 44, '{': 45, 'FUNCTION': 48, 'ELLIPSIS': 49, 'LONGSTRING': 50, 'STRING': 51, '(': 24, 'NAME': 26},
+    213: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    214: {'RETURN': -24, 'LOCAL': -24, 'FUNCTION': -24, 'FOR': -24, 'IF': -24, 'REPEAT': -24, 'WHILE': -24, 'DO': -24, 'GOTO': -24, 'BREAK': -24, ';': -24, 'LABEL': -24, '(': -24, 'NAME': -24, '$end': -24, 'END': -24, 'UNTIL': -24, 'ELSE': -24, 'ELSEIF': -24},
+    215: {'END': -3, 'ELSE': -3, 'ELSEIF': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    216: {'DO': 219, '^': 80, '%': 81, 'IDIV': 82, '/': 83, '*': 84, '-': 85, '+': 86, 'CONCAT': 87, 'SHR': 88, 'SHL': 89, '&': 90, '~': 91, '|': 92, 'EQ': 93, 'NE': 94, 'GE': 95, 'LE': 96, '>': 97, '<': 98, 'AND': 99, 'OR': 100},
+    217: {'END': 220},
+    218: {'END': 198, 'ELSE': 199, 'ELSEIF': 200},
+    219: {'END': -3, 'RETURN': 6, 'LOCAL': 8, 'FUNCTION': 9, 'FOR': 11, 'IF': 13, 'REPEAT': 14, 'WHILE': 15, 'DO': 12, 'GOTO': 16, 'BREAK': 17, ';': 7, 'LABEL': 21, '(': 24, 'NAME': 26},
+    220: {'RETURN': -12, 'LOCAL': -12, 'FUNCTION': -12, 'FOR': -12, 'IF': -12, 'REPEAT': -12, 'WHILE': -12, 'DO': -12, 'GOTO': -12, 'BREAK': -12, ';': -12, 'LABEL': -12, '(': -12, 'NAME': -12, '$end': -12, 'END': -12, 'UNTIL': -12, 'ELSE': -12, 'ELSEIF': -12},
+    221: {'RETURN': -25, 'LOCAL': -25, 'FUNCTION': -25, 'FOR': -25, 'IF': -25, 'REPEAT': -25, 'WHILE': -25, 'DO': -25, 'GOTO': -25, 'BREAK': -25, ';': -25, 'LABEL': -25, '(': -25, 'NAME': -25, '$end': -25, 'END': -25, 'UNTIL': -25, 'ELSE': -25, 'ELSEIF': -25},
+    222: {'END': 223},
+    223: {'RETURN': -11, 'LOCAL': -11, 'FUNCTION': -11, 'FOR': -11, 'IF': -11, 'REPEAT': -11, 'WHILE': -11, 'DO': -11, 'GOTO': -11, 'BREAK': -11, ';': -11, 'LABEL': -11, '(': -11, 'NAME': -11, '$end': -11, 'END': -11, 'UNTIL': -11, 'ELSE': -11, 'ELSEIF': -11},
+}
+
+lr_goto = {
+    0: {'file': 1, 'block': 2, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    1: {},
+    2: {},
+    3: {'block': 27, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    4: {},
+    5: {'stat': 5, 'block': 28, 'retstat': 4, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    6: {'explist': 30, 'exp': 31, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    7: {},
+    8: {'namelist': 53, 'name': 55},
+    9: {'funcname': 56, 'name': 57},
+    10: {},
+    11: {'namelist': 58, 'name': 59},
+    12: {'block': 60, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    13: {'exp': 61, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    14: {'block': 62, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    15: {'exp': 63, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    16: {'name': 64},
+    17: {},
+    18: {},
+    19: {'args': 66, 'string': 67, 'tableconstructor': 68},
+    20: {},
+    21: {'name': 72},
+    22: {'args': 74, 'string': 67, 'tableconstructor': 68},
+    23: {},
+    24: {'exp': 75, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    25: {},
+    26: {},
+    27: {},
+    28: {},
+    29: {},
+    30: {},
+    31: {},
+    32: {'exp': 101, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    33: {'exp': 102, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    34: {'exp': 103, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    35: {'exp': 104, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    36: {},
+    37: {},
+    38: {},
+    39: {},
+    40: {},
+    41: {},
+    42: {},
+    43: {},
+    44: {},
+    45: {'emptylist': 105, 'fieldlist': 106, 'fieldlisthead': 107, 'field': 108, 'exp': 109, 'name': 110, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'var': 52},
+    46: {'args': 66, 'string': 67, 'tableconstructor': 68},
+    47: {'args': 74, 'string': 67, 'tableconstructor': 68},
+    48: {'parlist': 112},
+    49: {},
+    50: {},
+    51: {},
+    52: {},
+    53: {},
+    54: {'name': 116},
+    55: {},
+    56: {'parlist': 117},
+    57: {},
+    58: {},
+    59: {},
+    60: {},
+    61: {},
+    62: {},
+    63: {},
+    64: {},
+    65: {'name': 126},
+    66: {},
+    67: {},
+    68: {},
+    69: {'emptylist': 127, 'explist': 128, 'exp': 31, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    70: {'explist': 129, 'exp': 31, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    71: {'var': 130, 'prefixexp': 25, 'name': 10, 'functioncall': 46, 'prefixcall': 47},
+    72: {},
+    73: {'name': 132},
+    74: {},
+    75: {},
+    76: {'name': 134},
+    77: {'prefixexp': 37, 'exp': 135, 'tableconstructor': 36, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    78: {},
+    79: {'exp': 136, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    80: {'exp': 137, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    81: {'exp': 138, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    82: {'exp': 139, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    83: {'exp': 140, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    84: {'exp': 141, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    85: {'exp': 142, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    86: {'exp': 143, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    87: {'exp': 144, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    88: {'exp': 145, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    89: {'exp': 146, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    90: {'exp': 147, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    91: {'exp': 148, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    92: {'exp': 149, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    93: {'exp': 150, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    94: {'exp': 151, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    95: {'exp': 152, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    96: {'exp': 153, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    97: {'exp': 154, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    98: {'exp': 155, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    99: {'exp': 156, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    100: {'exp': 157, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    101: {},
+    102: {},
+    103: {},
+    104: {},
+    105: {},
+    106: {},
+    107: {'fieldsep': 160},
+    108: {},
+    109: {},
+    110: {},
+    111: {'exp': 164, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    112: {'block': 165, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    113: {'ellipsis': 166, 'namelist': 167, 'emptylist': 168, 'name': 55},
+    114: {'explist': 169, 'exp': 31, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    115: {'name': 170},
+    116: {'parlist': 171},
+    117: {'block': 172, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    118: {'name': 173},
+    119: {'name': 174},
+    120: {'explist': 175, 'exp': 31, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    121: {'name': 10, 'exp': 176, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'var': 52},
+    122: {},
+    123: {'block': 177, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    124: {'exp': 178, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    125: {'block': 179, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    126: {'args': 180, 'string': 67, 'tableconstructor': 68},
+    127: {},
+    128: {},
+    129: {},
+    130: {},
+    131: {},
+    132: {'args': 183, 'string': 67, 'tableconstructor': 68},
+    133: {},
+    134: {},
+    135: {},
+    136: {},
+    137: {},
+    138: {},
+    139: {},
+    140: {},
+    141: {},
+    142: {},
+    143: {},
+    144: {},
+    145: {},
+    146: {},
+    147: {},
+    148: {},
+    149: {},
+    150: {},
+    151: {},
+    152: {},
+    153: {},
+    154: {},
+    155: {},
+    156: {},
+    157: {},
+    158: {},
+    159: {},
+    160: {'field': 185, 'exp': 109, 'name': 110, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'var': 52},
+    161: {},
+    162: {},
+    163: {'name': 10, 'exp': 186, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'var': 52},
+    164: {},
+    165: {},
+    166: {},
+    167: {},
+    168: {},
+    169: {},
+    170: {},
+    171: {'name': 10, 'block': 193, 'retstat': 4, 'stat': 5, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    172: {},
+    173: {},
+    174: {},
+    175: {},
+    176: {},
+    177: {'ifstat': 197},
+    178: {},
+    179: {},
+    180: {},
+    181: {},
+    182: {},
+    183: {},
+    184: {},
+    185: {},
+    186: {},
+    187: {},
+    188: {},
+    189: {},
+    190: {'ellipsis': 203, 'name': 170},
+    191: {},
+    192: {},
+    193: {},
+    194: {},
+    195: {'block': 205, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    196: {'name': 10, 'exp': 206, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'var': 52},
+    197: {},
+    198: {},
+    199: {'block': 207, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    200: {'exp': 208, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    201: {},
+    202: {'exp': 209, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'name': 10, 'var': 52},
+    203: {},
+    204: {},
+    205: {},
+    206: {},
+    207: {},
+    208: {},
+    209: {},
+    210: {},
+    211: {},
+    212: {'name': 10, 'exp': 216, 'tableconstructor': 36, 'prefixexp': 37, 'functiondef': 38, 'ellipsis': 39, 'string': 40, 'functioncall': 46, 'prefixcall': 47, 'var': 52},
+    213: {'name': 10, 'block': 217, 'retstat': 4, 'stat': 5, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    214: {},
+    215: {'block': 218, 'retstat': 4, 'stat': 5, 'name': 10, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    216: {},
+    217: {},
+    218: {'ifstat': 221},
+    219: {'name': 10, 'block': 222, 'retstat': 4, 'stat': 5, 'label': 18, 'functioncall': 19, 'varlist': 20, 'prefixcall': 22, 'var': 23, 'prefixexp': 25},
+    220: {},
+    221: {},
+    222: {},
+    223: {},
+}
+
+defaulted_states = {
+    2: -1,
+    27: -2,
+}
@@ -0,0 +1,97 @@
+from dis import opmap, hasjabs, hasjrel
+from .asm import Instruction, Label
+
+DUP_TOP = opmap["DUP_TOP"]
+POP_TOP = opmap["POP_TOP"]
+ROT_TWO = opmap["ROT_TWO"]
+LOAD_CONST = opmap["LOAD_CONST"]
+LOAD_FAST = opmap["LOAD_FAST"]
+JUMP_FORWARD = opmap["JUMP_FORWARD"]
+JUMP_ABSOLUTE = opmap["JUMP_ABSOLUTE"]
+RETURN_VALUE = opmap["RETURN_VALUE"]
+RAISE_VARARGS = opmap["RAISE_VARARGS"]
+
+JUMPS = frozenset(hasjabs + hasjrel)
+UNCONDITIONAL_JUMPS = frozenset({JUMP_FORWARD, JUMP_ABSOLUTE})
+NO_FALLTHROUGH = UNCONDITIONAL_JUMPS | {RETURN_VALUE, RAISE_VARARGS}
+# instructions whose only effect is pushing one value
+PURE_PUSH = frozenset({DUP_TOP, LOAD_CONST, LOAD_FAST})
+
+
+def next_instruction(insts, i):
+    """index of the first instruction at or after i"""
+    while i < len(insts) and not isinstance(insts[i], Instruction):
+        i += 1
+    return i
+
+def thread_jumps(insts):
+    """retarget jumps to labels that jump again"""
+    index = {inst: i for i, inst in enumerate(insts) if isinstance(inst, Label)}
+
+    def follow(label):
+        i = next_instruction(insts, index[label])
+        if i < len(insts) and insts[i].opcode in UNCONDITIONAL_JUMPS:
+            return insts[i].arg
+
+    for i, inst in enumerate(insts):
+        if not isinstance(inst, Instruction) or inst.opcode not in JUMPS:
+            continue
+        seen = {inst.arg}
+        target = follow(inst.arg)
+        while target is not None and target not in seen:
+            # relative jumps only go forward
+            if inst.opcode in hasjrel and index[target] < i:
+                break
+            seen.add(target)
+            inst.arg = target
+            target = follow(target)
+
+def remove_dead_code(insts):
+    """drop unreachable instructions and jumps to the next instruction"""
+    targets = {inst.arg for inst in insts
+               if isinstance(inst, Instruction) and inst.opcode in JUMPS}
+    result = []
+    reachable = True
+    for i, inst in enumerate(insts):
+        if isinstance(inst, Label):
+            if inst in targets:
+                reachable = True
+            if reachable:
+                result.append(inst)
+            continue
+        if not reachable:
+            continue
+        result.append(inst)
+        if not isinstance(inst, Instruction) or inst.opcode not in NO_FALLTHROUGH:
+            continue
+        reachable = False
+        if inst.opcode in UNCONDITIONAL_JUMPS:
+            end = next_instruction(insts, i + 1)
+            if inst.arg in insts[i+1:end]:
+                result.pop()
+                reachable = True
+    return result
+
+def remove_stack_ops(insts):
+    """drop values pushed only to be popped and swaps undone right away"""
+    result = []
+    for inst in insts:
+        last = result[-1] if result else None
+        if isinstance(inst, Instruction) and isinstance(last, Instruction):
+            if inst.opcode == POP_TOP and last.opcode in PURE_PUSH:
+                result.pop()
+                continue
+            if inst.opcode == ROT_TWO and last.opcode == ROT_TWO:
+                result.pop()
+                continue
+        result.append(inst)
+    return result
+
+def optimize(insts):
+    while True:
+        size = len(insts)
+        thread_jumps(insts)
+        insts = remove_dead_code(insts)
+        insts = remove_stack_ops(insts)
+        if len(insts) == size:
+            return insts
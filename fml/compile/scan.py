@@ -0,0 +1,124 @@
+import re
+from sly import lex
+from .parse import escape
+from .error import Error, token_repr
+
+
+class Token(lex.Token):
+    """sly tokens only have an end from sly 0.5 on"""
+    __slots__ = () if 'end' in lex.Token.__slots__ else ('end',)
+
+
+# keywords and operators keep str values, so the tree only holds bytes
+# for names, numbers and strings taken from the source
+KEYWORDS = {
+    name.encode(): (name.upper(), name)
+    for name in (
+        'and', 'break', 'do', 'else', 'elseif', 'end',
+        'false', 'for', 'goto', 'function', 'if', 'in',
+        'local', 'nil', 'not', 'or', 'repeat', 'return',
+        'then', 'true', 'until', 'while')}
+
+OPERATORS = {
+    '<<': 'SHL', '>>': 'SHR', '//': 'IDIV',
+    '==': 'EQ', '~=': 'NE', '<=': 'LE', '>=': 'GE',
+    '::': 'LABEL', '...': 'ELLIPSIS', '..': 'CONCAT'}
+OPERATORS.update((c, c) for c in '+-*/^%#&~|<>=(){}[];:,.')
+OPERATORS = {op.encode(): (type, op) for op, type in OPERATORS.items()}
+
+# whitespace and comments are skipped in the same match as the token
+# after them, so the whole chunk is a sequence of matches of TOKEN_RE
+TOKEN_RE = re.compile(rb'''
+(?:[ \t\n]+|--\[(?P<c>=*)\[(?:(?!\](?P=c)\]).|\n)*\](?P=c)\]|--[^\n]*)*
+(?:
+  (?P<NAME>[a-zA-Z_][a-zA-Z_0-9]*)
+| (?P<OP>\.\.\.|\.\.|==|~=|<=|>=|<<|>>|//|::|[-+*/^%#&~|<>=(){}\];:,]|\.(?![0-9])|\[(?!=*\[))
+| (?P<NUMBER>0[xX](?:[0-9A-Fa-f]+(?:\.[0-9A-Fa-f]*)?|\.[0-9A-Fa-f]+)(?:[pP][+-]?\d+)?|(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+| (?P<STRING>"[^"\\\n]*"|'[^'\\\n]*')
+| (?P<ESCAPED>"(?:[^"\n\\]|\\[abfnrtv\\"'\n]|\\z\s*|\\x[0-9a-fA-F]{2}|\\\d{1,3}|\\u{[0-9a-fA-F]+})*"
+  |'(?:[^'\n\\]|\\[abfnrtv\\'"\n]|\\z\s*|\\x[0-9a-fA-F]{2}|\\\d{1,3}|\\u{[0-9a-fA-F]+})*')
+| (?P<LONGSTRING>\[(?P<b>=*)\[(?:(?!\](?P=b)\]).|\n)*\](?P=b)\])
+| (?P<BRACKET>\[)
+)?''', re.VERBOSE)
+
+
+class LuaScanner(Error):
+    """hand written replacement of LuaLexer, scanning bytes
+
+    Names, numbers and strings are bytes, and keywords and operators
+    are str, so no token is decoded. The text may be any buffer whose
+    slices are bytes, such as an mmap of the source file.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def tokenize(self, text, lineno=1, index=0):
+        self.text = text
+        length = len(text)
+        # offset of the first newline not counted in lineno yet
+        newline = text.find(b'\n', index)
+        if newline < 0:
+            newline = length
+
+        if index == 0 and text[:1] == b'#':
+            t = Token()
+            t.type, t.value, t.lineno, t.index, t.end = 'SHEBANG', text[:newline], lineno, 0, newline
+            yield t
+            index = newline
+
+        for m in TOKEN_RE.finditer(text, index):
+            kind = m.lastgroup
+            if kind is None or kind == 'c':
+                index = m.end()
+                if index < length:
+                    if index > newline:
+                        lineno += text[newline:index].count(b'\n')
+                    t = Token()
+                    t.type, t.value, t.lineno, t.index, t.end = 'ERROR', text[index:], lineno, index, length
+                    self.error(t)
+                return
+
+            start, end = m.span(kind)
+            if start > newline:
+                lineno += text[newline:start].count(b'\n')
+                newline = text.find(b'\n', start)
+                if newline < 0:
+                    newline = length
+
+            t = Token()
+            t.lineno = lineno
+            t.index = start
+            t.end = end
+            if kind == 'OP':
+                t.type, t.value = OPERATORS[text[start:end]]
+            elif kind == 'NAME':
+                value = text[start:end]
+                keyword = KEYWORDS.get(value)
+                if keyword is None:
+                    t.type, t.value = 'NAME', value
+                else:
+                    t.type, t.value = keyword
+            elif kind == 'NUMBER':
+                t.type = 'NUMBER'
+                t.value = text[start:end]
+            elif kind == 'STRING':
+                t.type = 'STRING'
+                t.value = text[start+1:end-1]
+            elif kind == 'ESCAPED':
+                t.type = 'STRING'
+                t.value = escape(text[start+1:end-1])
+            elif kind == 'LONGSTRING':
+                level = len(m.group('b')) + 2
+                value = text[start+level:end-level]
+                if value.startswith(b'\n'):
+                    value = value[1:]
+                t.type = 'LONGSTRING'
+                t.value = value
+            else:
+                # "[" not starting a long string
+                t.type = t.value = '['
+            yield t
+
+    def error(self, t):
+        super().error(t, f"Bad character {token_repr(t.value[:1])}")
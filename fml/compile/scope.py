@@ -1,18 +1,40 @@
 from . import ast
 from .asm import Label
-from .symbol import SymbolTable, ForLoopBlockSymbolTable, BlockSymbolTable, Global
-from .error import Error
+from .symbol import SymbolTable, ForLoopBlockSymbolTable, BlockSymbolTable, Global, Attribute
+from .error import Error, token_repr
 from dataclasses import fields
 
+# operators with an inline fast path for numbers, see CodegenVisitor
+INLINE_OPS = {'+', '-', '*', '<', '<=', '>', '>=', '==', '~='}
+# inline operators whose integer results may need to wrap around
+INTEGER_OPS = {'+', '-', '*'}
+# operators compiled to jumps instead of events
+LOGICAL_OPS = {'and', 'or', 'not'}
+
 
 class ScopeVisitor(Error, ast.Visitor):
 
     def visit_function(self, node, symtable):
         symtable = SymbolTable(symtable)
         self.visit(node.pars, symtable)
-        self.visit(node.body, symtable)
+        self.visit_block(node.body, symtable)
         node.symtable = symtable
 
+    def visit_block(self, body, symtable):
+        self.visit(body, symtable)
+        self.check_gotos(symtable)
+        symtable.close()
+
+    def check_gotos(self, symtable):
+        # every label of the block is known once its body is visited
+        for node in symtable.gotos:
+            label, varname = symtable.find_label(node.target, node._nlocals)
+            if label is None:
+                if varname is None:
+                    self.error(node, f'no visible label {token_repr(node.target)}')
+                else:
+                    self.error(node, f'jumps into the scope of local {token_repr(varname)}')
+
     @_(str, bool, int, type(None),
        ast.Break,
        ast.NIL, ast.FALSE, ast.TRUE,
@@ -22,43 +44,78 @@ class ScopeVisitor(Error, ast.Visitor):
 
     @_(ast.Goto)
     def visit(self, node, symtable):
-        node._symtable = symtable
         node._nlocals = len(symtable.locals)
+        label = symtable.labels.get(node.target, None)
+        if label is None:
+            # the Label picks this up when it follows
+            node._label = symtable.forward.setdefault(node.target, Label())
+        else:
+            node._label = label._label
+        symtable.gotos.append(node)
 
     @_(ast.Label)
     def visit(self, node, symtable):
         exist = symtable.labels.get(node.name, None)
         if exist is not None:
-            self.error(node, f"label {node.name!r} already defined on line {exist.lineno}")
+            self.error(node, f"label {token_repr(node.name)} already defined on line {exist.lineno}")
         symtable.labels[node.name] = node
-        node._label = Label()
+        node._label = symtable.forward.pop(node.name, None) or Label()
         node._nlocals = len(symtable.locals)
 
     @_(ast.ExpressionList, ast.Assign,
-       ast.CallStatement, ast.Call, ast.Return, ast.Break,
-       ast.Subscript, ast.Attribute, ast.Method, ast.Field)
+       ast.CallStatement, ast.Call, ast.Return, ast.Break, ast.Field)
     def visit(self, node, symtable):
         for field in fields(node):
             self.visit(getattr(node, field.name), symtable)
 
+    def visit_field(self, node, symtable):
+        # symbols of the inline cache of a constant key
+        node._shape = symtable.add(Attribute("shape"))
+        node._values = symtable.add(Attribute("values"))
+        node._index = symtable.add(Global(".index"))
+        node._class = symtable.add(Attribute("__class__"))
+        node._luatable = symtable.add(Global("LuaTable"))
+
+    @_(ast.Attribute, ast.Method)
+    def visit(self, node, symtable):
+        self.visit(node.value, symtable)
+        self.visit_field(node, symtable)
+
+    @_(ast.Subscript)
+    def visit(self, node, symtable):
+        self.visit(node.value, symtable)
+        self.visit(node.slice, symtable)
+        if isinstance(node.slice, ast.String):
+            self.visit_field(node, symtable)
+
     @_(list)
     def visit(self, node, symtable):
         for subnode in node:
             self.visit(subnode, symtable)
 
+    def chunk_symtable(self, cls=SymbolTable):
+        symtable = cls(None)
+        symtable.table[b"_ENV"] = symtable.add(Global("_ENV"))
+        symtable.declare_local(b"...")
+        return symtable
+
+    def visit_stream(self, nodes, symtable):
+        for node in nodes:
+            self.visit(node, symtable)
+            yield node
+        self.check_gotos(symtable)
+
     @_(ast.File)
     def visit(self, node, symtable):
-        symtable = SymbolTable(symtable)
-        symtable.table["_ENV"] = symtable.add(Global("_ENV"))
-        symtable.declare_local("...")
-        self.visit(node.body, symtable)
+        symtable = self.chunk_symtable()
+        self.visit_block(node.body, symtable)
         node.symtable = symtable
 
     @_(ast.Parameters)
     def visit(self, node, symtable):
         for subnode in node.value:
             symtable.declare_local(subnode.id)
-        symtable.declare_local('...' if node.varargs else '__...__')
+        symtable.declare_local(b'...' if node.varargs else b'__...__')
 
     @_(ast.Function)
     def visit(self, node, symtable):
@@ -78,25 +135,27 @@ class ScopeVisitor(Error, ast.Visitor):
     @_(ast.Block)
     def visit(self, node, symtable):
         symtable = BlockSymbolTable(symtable)
-        self.visit(node.body, symtable)
+        self.visit_block(node.body, symtable)
 
     @_(ast.If)
     def visit(self, node, symtable):
         self.visit(node.test, symtable)
-        self.visit(node.body, BlockSymbolTable(symtable))
-        self.visit(node.orelse, BlockSymbolTable(symtable))
+        self.visit_block(node.body, BlockSymbolTable(symtable))
+        self.visit_block(node.orelse, BlockSymbolTable(symtable))
 
     @_(ast.While)
     def visit(self, node, symtable):
         self.visit(node.test, symtable)
         symtable = BlockSymbolTable(symtable)
-        self.visit(node.body, symtable)
+        self.visit_block(node.body, symtable)
 
     @_(ast.Repeat)
     def visit(self, node, symtable):
         symtable = BlockSymbolTable(symtable)
         self.visit(node.body, symtable)
         self.visit(node.test, symtable)
+        self.check_gotos(symtable)
+        symtable.close()
 
     @_(ast.For)
     def visit(self, node, symtable):
@@ -109,7 +168,7 @@ class ScopeVisitor(Error, ast.Visitor):
         symtable = ForLoopBlockSymbolTable(symtable)
         symtable.declare_local(node.target.id)
         self.visit(node.target, symtable)
-        self.visit(node.body, symtable)
+        self.visit_block(node.body, symtable)
 
     @_(ast.ForEach)
     def visit(self, node, symtable):
@@ -119,7 +178,7 @@ class ScopeVisitor(Error, ast.Visitor):
         for subnode in node.target:
             symtable.declare_local(subnode.id)
         self.visit(node.target, symtable)
-        self.visit(node.body, symtable)
+        self.visit_block(node.body, symtable)
 
     @_(ast.AssignLocal)
     def visit(self, node, symtable):
@@ -134,12 +193,16 @@ class ScopeVisitor(Error, ast.Visitor):
         symbol = symtable.find(node.id)
         if symbol is None:
             node._env = True
-            symbol = symtable.find("_ENV")
+            node._version = symtable.add(Attribute("version"))
+            node._global = symtable.add(Global(".global"))
+            node._class = symtable.add(Attribute("__class__"))
+            node._luatable = symtable.add(Global("LuaTable"))
+            symbol = symtable.find(b"_ENV")
         node.symbol = symbol
 
     @_(ast.ELLIPSIS)
     def visit(self, node, symtable):
-        symbol = symtable.table.get('...')
+        symbol = symtable.table.get(b'...')
         if symbol is None:
             self.error(node, "cannot use '...' outside a vararg function")
         assert symbol is not None
@@ -147,13 +210,21 @@ class ScopeVisitor(Error, ast.Visitor):
 
     @_(ast.BinOp)
     def visit(self, node, symtable):
-        node._op = symtable.add(Global(f".b{node.op}"))
+        if node.op not in LOGICAL_OPS:
+            node._op = symtable.add(Global(f".b{node.op}"))
+        if node.op in INLINE_OPS:
+            node._class = symtable.add(Attribute("__class__"))
+            node._number = symtable.add(Global("number_types"))
+        if node.op in INTEGER_OPS:
+            node._int = symtable.add(Global("int"))
+            node._wrap = symtable.add(Global("wrap"))
         self.visit(node.left, symtable)
         self.visit(node.right, symtable)
 
     @_(ast.UnaryOp)
     def visit(self, node, symtable):
-        node._op = symtable.add(Global(f".u{node.op}"))
+        if node.op not in LOGICAL_OPS:
+            node._op = symtable.add(Global(f".u{node.op}"))
         self.visit(node.operand, symtable)
 
     @_(ast.Table)
@@ -164,42 +235,3 @@ class ScopeVisitor(Error, ast.Visitor):
     def __init__(self, filename, text):
         self.filename = filename
         self.text = text
-
-
-class GotoVisitor(Error, ast.Visitor):
-
-    @_(ast.Goto)
-    def visit(self, node):
-        label, varname = node._symtable.find_label(node.target, node._nlocals)
-        if label is None:
-            if varname is None:
-                self.error(node, f'no visible label {node.target!r}')
-            else:
-                self.error(node, f'jumps into the scope of local {varname!r}')
-
-        node._label = label._label
-
-    @_(ast.If)
-    def visit(self, node):
-        self.visit(node.body)
-        self.visit(node.orelse)
-
-    @_(ast.Block, ast.While, ast.Repeat,
-       ast.For, ast.ForEach,
-       ast.File, ast.Function, ast.FunctionLocal)
-    def visit(self, node):
-        self.visit(node.body)
-
-    @_(type(None), ast.Label, ast.Assign, ast.AssignLocal,
-       ast.CallStatement, ast.Return, ast.Break)
-    def visit(self, node):
-        pass
-
-    @_(list)
-    def visit(self, node):
-        for subnode in node:
-            self.visit(subnode)
-
-    def __init__(self, filename, text):
-        self.filename = filename
-        self.text = text
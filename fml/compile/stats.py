@@ -0,0 +1,68 @@
+from time import perf_counter
+from contextlib import contextmanager
+from dataclasses import fields
+from .ast import Node
+from .asm import Instruction
+
+
+def count_nodes(node):
+    if isinstance(node, list):
+        return sum(map(count_nodes, node))
+    if isinstance(node, Node):
+        return 1 + sum(count_nodes(getattr(node, field.name)) for field in fields(node))
+    return 0
+
+
+class CompileStats:
+    """where compiling a chunk went, filled in by compile
+
+    Times are in seconds and exclusive, so the time spent assembling
+    nested functions is not counted again in codegen. Sizes add up the
+    code objects of every function in the chunk, except stacksize,
+    which is the largest one.
+    """
+
+    PHASES = ('lex', 'parse', 'scope', 'codegen', 'assemble')
+
+    def __init__(self):
+        self.times = dict.fromkeys(self.PHASES, 0.0)
+        self.current = None
+        self.tokens = 0
+        self.nodes = 0
+        self.functions = 0
+        self.instructions = 0
+        self.constants = 0
+        self.stacksize = 0
+        self.bytecode = 0
+
+    @contextmanager
+    def phase(self, name):
+        outer = self.current
+        self.current = name
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            self.times[name] += elapsed
+            if outer is not None:
+                self.times[outer] -= elapsed
+            self.current = outer
+
+    def add_code(self, code, insts):
+        self.functions += 1
+        self.instructions += sum(isinstance(inst, Instruction) for inst in insts)
+        self.constants += len(code.co_consts)
+        self.stacksize = max(self.stacksize, code.co_stacksize)
+        self.bytecode += len(code.co_code)
+
+    @property
+    def total(self):
+        return sum(self.times.values())
+
+    def format(self):
+        lines = [f"{name + ':':14}{elapsed * 1000:10.3f} ms" for name, elapsed in self.times.items()]
+        lines.append(f"{'total:':14}{self.total * 1000:10.3f} ms")
+        for name in ('tokens', 'nodes', 'functions', 'instructions', 'constants', 'stacksize', 'bytecode'):
+            lines.append(f"{name + ':':14}{getattr(self, name):10d}")
+        return '\n'.join(lines)
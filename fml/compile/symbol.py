@@ -1,3 +1,5 @@
+from heapq import heappush, heappop
+
 class Symbol:
     pass
 
@@ -23,6 +25,12 @@ class Local(Symbol):
     def __init__(self, name):
         self.name = name
 
+class Release(Symbol):
+    """end of the scope of locals, whose fast slots can be reused"""
+
+    def __init__(self, symbols):
+        self.symbols = symbols
+
 
 class BaseSymbolTable:
 
@@ -32,6 +40,14 @@ class BaseSymbolTable:
         self.table = {}
         self._loopvars = []
         self.labels = {}
+        self.gotos = []
+        # locals declared here by name, and those shadowed by a later
+        # declaration, which a backward goto can bring back into scope,
+        # so they are kept until the block closes
+        self.declared = {}
+        self.shadowed = []
+        # labels of gotos compiled before the label was seen
+        self.forward = {}
         self.locals = []
 
     def find_label(self, name, nlocals):
@@ -43,23 +59,33 @@ class BaseSymbolTable:
 
     def find(self, name):
         symbol = self.table.get(name, None)
-        if symbol is None:
-            if self.parent is not None:
-                symbol = self.parent.find(name)
-                if symbol is None:
-                    symbol = Global(name)
-                self.table[name] = self.reference(symbol)
+        if symbol is None and self.parent is not None:
+            symbol = self.parent.find(name)
+            if symbol is not None:
+                symbol = self.table[name] = self.reference(symbol)
         return symbol
 
     def reference(self, symbol):
         return symbol
 
     def declare_local(self, name):
+        # names in the source are bytes, code objects want str
         self.locals.append(name)
-        symbol = self.add(Local(name))
+        symbol = self.add(Local(name.decode()))
         self.table[name] = symbol
+        if name in self.declared:
+            self.shadowed.append(self.declared[name])
+        self.declared[name] = symbol
         return symbol
 
+    def close(self):
+        self.release(self.shadowed + list(self.declared.values()))
+        self.shadowed = []
+        self.declared = {}
+
+    def release(self, symbols):
+        self.add(Release(symbols))
+
     def get_loopvar(self, n=0):
         if n >= len(self._loopvars):
             loopvar = (
@@ -95,6 +121,8 @@ class SymbolTable(BaseSymbolTable):
         freenames = []
         cellnames = []
         freevars = []
+        # fast slots of locals out of scope
+        free = []
 
         for symbol in self.symbols:
             if isinstance(symbol, Global) or isinstance(symbol, Attribute):
@@ -105,9 +133,15 @@ class SymbolTable(BaseSymbolTable):
                 if symbol.is_referenced:
                     symbol.slot = len(cellnames)
                     cellnames.append(symbol.name)
+                elif free:
+                    symbol.slot = heappop(free)
                 else:
                     symbol.slot = len(varnames)
                     varnames.append(symbol.name)
+            elif isinstance(symbol, Release):
+                for local in symbol.symbols:
+                    if not local.is_referenced:
+                        heappush(free, local.slot)
 
         for symbol in self.symbols:
             if not isinstance(symbol, Free):
@@ -120,11 +154,50 @@ class SymbolTable(BaseSymbolTable):
         return tuple(names), tuple(varnames), tuple(freenames), tuple(cellnames), tuple(freevars)
 
 
+class StreamSymbolTable(SymbolTable):
+    """symbol table of a chunk compiled one statement at a time
+
+    Code using a symbol is emitted before the rest of the chunk is seen,
+    so slots are given out as symbols are added. Any local may still be
+    captured by a later function, so all but the internal ones, whose
+    names start with a dot, live in cells.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.names = {}
+        self.varnames = []
+        self.cellnames = []
+
+    def add(self, symbol):
+        if isinstance(symbol, Local):
+            if symbol.name.startswith('.'):
+                symbol.slot = len(self.varnames)
+                self.varnames.append(symbol.name)
+            else:
+                symbol.is_referenced = True
+                symbol.slot = len(self.cellnames)
+                self.cellnames.append(symbol.name)
+        else:
+            symbol.slot = self.names.setdefault(symbol.name, len(self.names))
+        return symbol
+
+    def release(self, symbols):
+        # slots are given out already
+        pass
+
+    def get_slots(self):
+        return tuple(self.names), tuple(self.varnames), (), tuple(self.cellnames), ()
+
+
 class BlockSymbolTable(BaseSymbolTable):
 
     def add(self, symbol):
         return self.parent.add(symbol)
 
+    def release(self, symbols):
+        self.parent.release(symbols)
+
     def get_loopvar(self, n=0):
         return self.parent.get_loopvar(n)
 
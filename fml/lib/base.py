@@ -1,5 +1,11 @@
-from ..compile import compile
+from ..compile import compile, compile_stream
 from types import FunctionType
+from functools import partial, lru_cache
+from itertools import count, product
+from operator import add, sub, mul, neg, invert, and_, or_, xor, lt, le, eq
+from os import fsencode, fsdecode, fstat
+from mmap import mmap, ACCESS_READ
+from math import floor, ceil, fmod, copysign, pow
 from ctypes.util import find_library
 from ctypes import CDLL, CFUNCTYPE, c_int, c_longlong, c_double, c_char_p, c_void_p, POINTER, byref, cast, get_errno
 
@@ -9,6 +15,12 @@ _strtod = libc.strtod
 _strtod.restype = c_double
 _strtod.argtypes = [c_char_p, POINTER(c_void_p)]
 
+libm = CDLL(find_library("m"))
+
+_pow = libm.pow
+_pow.restype = c_double
+_pow.argtypes = [c_double, c_double]
+
 _strtoll = libc.strtoll
 _strtoll.restype = c_longlong
 _strtoll.argtypes = [c_char_p, POINTER(c_void_p), c_int]
@@ -32,19 +44,623 @@ def strtoll(bytes, base=0):
         return ll
 
 
-class LuaTable:
+class LuaError(Exception):
     pass
 
+
+_TRUE, _FALSE = object(), object()
+_BOOLEANS = {_TRUE: True, _FALSE: False}
+
+MAXABITS = 31
+
+MAXINTEGER = 2 ** 63 - 1
+MININTEGER = -2 ** 63
+
+_versions = count()
+
+def _hashkey(key):
+    # Lua keys 2 and 2.0 are the same key, and true is not the key 1
+    if type(key) is float:
+        if key.is_integer():
+            return int(key)
+    elif type(key) is bool:
+        return _TRUE if key else _FALSE
+    return key
+
+def computesizes(nums, total):
+    # nums[i] is the number of integer keys k with 2^(i-1) < k <= 2^i,
+    # returns the largest power of two n such that more than half of
+    # the slots 1..n would be in use
+    a = 0
+    optimal = 0
+    twotoi = 1
+    for n in nums:
+        if total <= twotoi // 2:
+            break
+        a += n
+        if a > twotoi // 2:
+            optimal = twotoi
+        twotoi *= 2
+    return optimal
+
+
+class Shape:
+    """layout of the string keys of a record like table
+
+    Tables given the same keys in the same order share a shape, so only
+    the values are stored per table. Shapes form a tree from ``ROOT``
+    through ``transitions``, each adding one key.
+    """
+
+    __slots__ = ('keys', 'index', 'transitions')
+
+    def __init__(self, keys=()):
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+        self.transitions = {}
+
+    def add(self, key):
+        # None when the table should fall back to a dict
+        shape = self.transitions.get(key)
+        if shape is None:
+            if len(self.keys) >= MAXSHAPEKEYS or len(self.transitions) >= MAXTRANSITIONS:
+                return None
+            shape = self.transitions[key] = Shape(self.keys + (key,))
+        return shape
+
+MAXSHAPEKEYS = 32
+MAXTRANSITIONS = 64
+ROOT = Shape()
+
+
+class Hash(dict):
+    """hash part of a table without a shape
+
+    Absent keys are nil, or looked up through the metatable of ``table``,
+    which is only set while the table has a metatable.
+    """
+
+    __slots__ = ('table',)
+
+    def __missing__(self, key):
+        table = self.table
+        if table is None:
+            return None
+        return index_tm(table, key)
+
+
+class LuaTable:
+    """Lua table with an array part for keys 1..n and a hash part for the rest
+
+    ``array[k-1]`` holds the value of key ``k``, empty slots are None.
+    Integer keys are moved between the two parts when the hash part grows
+    past ``limit``, following the sizing rule of ltable.c.
+
+    The hash part starts out as a ``shape`` and a list of ``values``
+    holding string keys only. A key of another type, a deletion or too
+    many keys turn it into the ``hash`` dict, ``shape`` becomes None and
+    ``values`` the hash itself.
+    An empty array part is the shared empty tuple.
+
+    ``version`` is drawn from a global counter on every write to the hash
+    part and on every change of ``metatable``, so it identifies both the
+    table and its string keyed contents. Compiled global lookups cache
+    their result against it.
+
+    ``flags`` has a bit set for each metamethod known to be absent when
+    the table is used as a metatable, see ``fasttm``. Writes to the hash
+    part clear it.
+    """
+
+    __slots__ = ('array', 'hash', 'limit', 'version', 'shape', 'values', 'metatable', 'flags')
+
+    def __init__(self, array=None, hash=None):
+        self.array = array or ()
+        self.hash = None
+        self.limit = 4
+        self.version = next(_versions)
+        self.shape = ROOT
+        self.values = []
+        self.metatable = None
+        self.flags = 0
+        if hash:
+            # hash is a dict or a list of (key, value) pairs, a dict cannot
+            # hold both true and 1 as keys
+            if type(hash) is dict:
+                # records built from string keys get their shape in one go
+                shape = ROOT
+                for key in hash:
+                    if type(key) is not bytes:
+                        break
+                    shape = shape.add(key)
+                    if shape is None:
+                        break
+                else:
+                    # a slice is sized exactly, list() leaves room to grow
+                    values = list(hash.values())[:]
+                    if None not in values:
+                        self.shape = shape
+                        self.values = values
+                        return
+                hash = hash.items()
+
+            n = len(self.array)
+            for key, value in hash:
+                key = _hashkey(key)
+                # positional fields win over explicit keys
+                if type(key) is int and 0 < key <= n:
+                    continue
+                self[key] = value
+
+    def __getitem__(self, key):
+        if type(key) is bytes:
+            shape = self.shape
+            if shape is None:
+                value = self.hash.get(key)
+            else:
+                i = shape.index.get(key)
+                value = None if i is None else self.values[i]
+        elif type(key) is int and 0 < key <= len(self.array):
+            value = self.array[key-1]
+        else:
+            value = self.rawget(key)
+        if value is None and self.metatable is not None:
+            return index_tm(self, key)
+        return value
+
+    def __setitem__(self, key, value):
+        if self.metatable is not None and newindex_tm(self, key, value):
+            return
+        if type(key) is bytes:
+            self.sethash(key, value)
+        elif type(key) is int and 0 < key <= len(self.array):
+            self.array[key-1] = value
+        else:
+            self.rawset(key, value)
+
+    def gethash(self, key):
+        # raw value of a key of the hash part
+        shape = self.shape
+        if shape is None:
+            return self.hash.get(key)
+        i = shape.index.get(key)
+        if i is not None:
+            return self.values[i]
+
+    def rawget(self, key):
+        if type(key) is not int:
+            key = _hashkey(key)
+        if type(key) is int and 0 < key <= len(self.array):
+            return self.array[key-1]
+        return self.gethash(key)
+
+    def rawset(self, key, value):
+        if type(key) is not int:
+            if key is None:
+                raise LuaError("table index is nil")
+            if key != key:
+                raise LuaError("table index is NaN")
+            key = _hashkey(key)
+            if type(key) is not int:
+                self.sethash(key, value)
+                return
+
+        array = self.array
+        n = len(array)
+        if 0 < key <= n:
+            array[key-1] = value
+        elif key == n + 1 and value is not None:
+            if not n:
+                self.array = array = []
+            array.append(value)
+            hash = self.hash
+            if hash:
+                key += 1
+                while key in hash:
+                    array.append(hash.pop(key))
+                    key += 1
+        else:
+            self.sethash(key, value)
+
+    def sethash(self, key, value):
+        self.version = next(_versions)
+        self.flags = 0
+        shape = self.shape
+        if shape is not None:
+            i = shape.index.get(key)
+            if i is not None:
+                if value is not None:
+                    self.values[i] = value
+                    return
+            elif value is None:
+                return
+            elif type(key) is bytes:
+                shape = shape.add(key)
+                if shape is not None:
+                    self.shape = shape
+                    self.values.append(value)
+                    return
+            self.unshape()
+
+        hash = self.hash
+        if value is None:
+            hash.pop(key, None)
+            return
+        hash[key] = value
+        if len(hash) > self.limit:
+            self.rehash()
+
+    def setmetatable(self, metatable):
+        self.version = next(_versions)
+        self.metatable = metatable
+        if self.shape is None:
+            self.hash.table = None if metatable is None else self
+
+    def unshape(self):
+        self.hash = Hash(zip(self.shape.keys, self.values))
+        self.hash.table = None if self.metatable is None else self
+        self.limit = max(4, 2 * len(self.hash))
+        self.shape = None
+        # so inline caches index the hash the way they index values
+        self.values = self.hash
+
+    def rehash(self):
+        nums = [0] * (MAXABITS + 1)
+        total = 0
+        for i, value in enumerate(self.array):
+            if value is not None:
+                nums[i.bit_length()] += 1
+                total += 1
+        for key in self.hash:
+            if type(key) is int and 0 < key <= 2 ** MAXABITS:
+                nums[(key-1).bit_length()] += 1
+                total += 1
+        self.resize(computesizes(nums, total))
+        self.limit = max(4, 2 * len(self.hash))
+
+    def resize(self, size):
+        array = self.array
+        hash = self.hash
+        n = len(array)
+        if size > n:
+            if not n:
+                self.array = array = []
+            array.extend(hash.pop(key, None) for key in range(n + 1, size + 1))
+        elif size < n:
+            for key in range(size + 1, n + 1):
+                value = array[key-1]
+                if value is not None:
+                    hash[key] = value
+            del array[size:]
+
+    def length(self):
+        array = self.array
+        j = len(array)
+        if j and array[j-1] is None:
+            # binary search for a border in the array part
+            i = 0
+            while j - i > 1:
+                m = (i + j) // 2
+                if array[m-1] is None:
+                    j = m
+                else:
+                    i = m
+            return i
+
+        hash = self.hash
+        if hash is None or j + 1 not in hash:
+            return j
+
+        # unbound search for a border in the hash part
+        i, j = j, j + 1
+        while j in hash:
+            i = j
+            j *= 2
+        while j - i > 1:
+            m = (i + j) // 2
+            if m in hash:
+                i = m
+            else:
+                j = m
+        return i
+
+    def items(self):
+        for i, value in enumerate(self.array, 1):
+            if value is not None:
+                yield i, value
+        if self.shape is not None:
+            yield from zip(self.shape.keys, self.values)
+            return
+        for key, value in self.hash.items():
+            yield _BOOLEANS.get(key, key), value
+
+# metamethods whose absence is cached in the flags of a metatable
+TM_INDEX, TM_NEWINDEX, TM_LEN, TM_EQ = 1, 2, 4, 8
+
+# longest __index or __newindex chain followed before giving up
+MAXTAGLOOP = 2000
+
+def fasttm(metatable, flag, name):
+    # tables without a metatable, or whose metatable is known to lack the
+    # metamethod, never look the name up
+    if metatable is None or metatable.flags & flag:
+        return None
+    tm = metatable.gethash(name)
+    if tm is None:
+        metatable.flags |= flag
+    return tm
+
+def first(values):
+    return values[0] if values else None
+
+def truth(value):
+    return value is not None and value is not False
+
+def index_tm(table, key):
+    # table[key] is nil, tables along the __index chain are looked up here
+    # without going through __getitem__ again
+    for _ in range(MAXTAGLOOP):
+        tm = fasttm(table.metatable, TM_INDEX, b"__index")
+        if tm is None:
+            return None
+        if type(tm) is not LuaTable:
+            return first(tm(table, key))
+        value = tm.rawget(key)
+        if value is not None:
+            return value
+        table = tm
+    raise LuaError("'__index' chain too long; possible loop")
+
+def newindex_tm(table, key, value):
+    # True when the assignment went through __newindex
+    for loop in range(MAXTAGLOOP):
+        tm = fasttm(table.metatable, TM_NEWINDEX, b"__newindex")
+        if tm is None or table.rawget(key) is not None:
+            if not loop:
+                return False
+            table.rawset(key, value)
+            return True
+        if type(tm) is not LuaTable:
+            tm(table, key, value)
+            return True
+        table = tm
+    raise LuaError("'__newindex' chain too long; possible loop")
+
+# operators: each event looks the pair of operand types up in a table of
+# the number and string cases, anything not found there is left to the
+# metamethods of the operands
+
+INF, NAN = float('inf'), float('nan')
+
+def wrap(n):
+    # integer results out of range wrap around in two's complement
+    n &= 0xFFFFFFFFFFFFFFFF
+    return n - 0x10000000000000000 if n > MAXINTEGER else n
+
+TYPENAMES = {type(None): 'nil', bool: 'boolean', int: 'number', float: 'number', bytes: 'string', LuaTable: 'table'}
+
+def typename(value):
+    return TYPENAMES.get(type(value), 'function')
+
+@lru_cache(maxsize=1024)
+def str2number(s):
+    return tonumber(None, s)
+
+def tointeger(value):
+    if type(value) is bytes:
+        number = str2number(value)
+        if number is None:
+            raise LuaError("attempt to perform bitwise operation on a string value")
+        value = number
+    if type(value) is float and value.is_integer() and -2.0 ** 63 <= value < 2.0 ** 63:
+        return int(value)
+    if type(value) is not int:
+        raise LuaError("number has no integer representation")
+    return value
+
+def int_add(a, b):
+    n = a + b
+    return n if MININTEGER <= n <= MAXINTEGER else wrap(n)
+
+def int_sub(a, b):
+    n = a - b
+    return n if MININTEGER <= n <= MAXINTEGER else wrap(n)
+
+def int_mul(a, b):
+    n = a * b
+    return n if MININTEGER <= n <= MAXINTEGER else wrap(n)
+
+def int_idiv(a, b):
+    if not b:
+        raise LuaError("attempt to perform 'n//0'")
+    n = a // b
+    return n if MININTEGER <= n <= MAXINTEGER else wrap(n)
+
+def int_mod(a, b):
+    if not b:
+        raise LuaError("attempt to perform 'n%0'")
+    return a % b
+
+def int_unm(a):
+    n = -a
+    return n if MININTEGER <= n <= MAXINTEGER else wrap(n)
+
+def float_div(a, b):
+    # python raises where IEEE 754 gives an infinity or nan
+    a, b = float(a), float(b)
+    if b:
+        return a / b
+    if not a or a != a:
+        return NAN
+    return copysign(INF, a) * copysign(1.0, b)
+
+def float_idiv(a, b):
+    n = float_div(a, b)
+    return float(floor(n)) if n - n == 0 else n
+
+def float_mod(a, b):
+    try:
+        m = fmod(float(a), float(b))
+    except ValueError:
+        return NAN
+    if m * b < 0:
+        m += b
+    return m
+
+def float_pow(a, b):
+    a, b = float(a), float(b)
+    try:
+        return pow(a, b)
+    except (ValueError, OverflowError):
+        return _pow(a, b)
+
+def shift_left(a, b):
+    if b < 0:
+        return shift_right(a, -b)
+    if b >= 64:
+        return 0
+    return wrap(a << b)
+
+def shift_right(a, b):
+    if b < 0:
+        return shift_left(a, -b)
+    if b >= 64:
+        return 0
+    return wrap((a & 0xFFFFFFFFFFFFFFFF) >> b)
+
+def tostring(value):
+    if type(value) is int:
+        return b"%d" % value
+    s = b"%.14g" % value
+    if s.lstrip(b"-").isdigit():
+        s += b".0"
+    return s
+
+def concat(a, b):
+    return (a if type(a) is bytes else tostring(a)) + (b if type(b) is bytes else tostring(b))
+
+def isnumber(value):
+    return type(value) in (int, float) or type(value) is bytes and str2number(value) is not None
+
+def isstring(value):
+    return type(value) in (bytes, int, float)
+
+def operand_error(a, b, what, valid=isnumber):
+    # the first operand is blamed unless it is valid for the operator
+    value = b if valid(a) else a
+    return LuaError(f"attempt to {what} a {typename(value)} value")
+
+def compare_error(a, b):
+    x, y = typename(a), typename(b)
+    if x == y:
+        return LuaError(f"attempt to compare two {x} values")
+    return LuaError(f"attempt to compare {x} with {y}")
+
+def gettm(a, b, name):
+    for value in (a, b):
+        if type(value) is LuaTable and value.metatable is not None:
+            tm = value.metatable.gethash(name)
+            if tm is not None:
+                return tm
+
+def binary_event(ops, name, what, valid=isnumber):
+    def event(a, b):
+        op = ops.get((type(a), type(b)))
+        if op is not None:
+            return op(a, b)
+        tm = gettm(a, b, name)
+        if tm is None:
+            raise operand_error(a, b, what, valid)
+        return first(tm(a, b))
+    return event
+
+def arith_event(intop, floatop, name):
+    ops = {(int, int): intop, (int, float): floatop, (float, int): floatop, (float, float): floatop}
+    event = binary_event(ops, name, "perform arithmetic on")
+
+    def coerce(a, b):
+        # strings are converted to numbers, which are dispatched again
+        x = str2number(a) if type(a) is bytes else a
+        y = str2number(b) if type(b) is bytes else b
+        if x is None or y is None:
+            raise operand_error(a, b, "perform arithmetic on")
+        return event(x, y)
+
+    for pair in product((int, float, bytes), repeat=2):
+        if bytes in pair:
+            ops[pair] = coerce
+    return event
+
+def bitwise_event(intop, name):
+    def coerce(a, b):
+        return intop(tointeger(a), tointeger(b))
+
+    ops = dict.fromkeys(product((int, float, bytes), repeat=2), coerce)
+    ops[int, int] = intop
+    return binary_event(ops, name, "perform bitwise operation on")
+
+add_event = arith_event(int_add, add, b"__add")
+sub_event = arith_event(int_sub, sub, b"__sub")
+mul_event = arith_event(int_mul, mul, b"__mul")
+div_event = arith_event(float_div, float_div, b"__div")
+mod_event = arith_event(int_mod, float_mod, b"__mod")
+pow_event = arith_event(float_pow, float_pow, b"__pow")
+idiv_event = arith_event(int_idiv, float_idiv, b"__idiv")
+
+band_event = bitwise_event(and_, b"__band")
+bor_event = bitwise_event(or_, b"__bor")
+bxor_event = bitwise_event(xor, b"__bxor")
+shl_event = bitwise_event(shift_left, b"__shl")
+shr_event = bitwise_event(shift_right, b"__shr")
+
+CONCAT = dict.fromkeys(product((bytes, int, float), repeat=2), concat)
+CONCAT[bytes, bytes] = add
+concat_event = binary_event(CONCAT, b"__concat", "concatenate", isstring)
+
+COMPARABLE = [(int, int), (int, float), (float, int), (float, float), (bytes, bytes)]
+LT = dict.fromkeys(COMPARABLE, lt)
+LE = dict.fromkeys(COMPARABLE, le)
+
 def lt_event(a, b):
-    if type(a) in (float, int) and type(b) in (float, int):
-        return a < b
+    op = LT.get((type(a), type(b)))
+    if op is not None:
+        return op(a, b)
+    tm = gettm(a, b, b"__lt")
+    if tm is None:
+        raise compare_error(a, b)
+    return truth(first(tm(a, b)))
 
 def le_event(a, b):
-    if type(a) in (float, int) and type(b) in (float, int):
-        return a <= b
+    op = LE.get((type(a), type(b)))
+    if op is not None:
+        return op(a, b)
+    tm = gettm(a, b, b"__le")
+    if tm is not None:
+        return truth(first(tm(a, b)))
+    # a <= b is not (b < a) when there is no __le
+    tm = gettm(b, a, b"__lt")
+    if tm is None:
+        raise compare_error(a, b)
+    return not truth(first(tm(b, a)))
+
+def table_eq(a, b):
+    if a is b:
+        return True
+    if a.metatable is None and b.metatable is None:
+        return False
+    tm = fasttm(a.metatable, TM_EQ, b"__eq") or fasttm(b.metatable, TM_EQ, b"__eq")
+    return tm is not None and truth(first(tm(a, b)))
+
+EQ = dict.fromkeys(COMPARABLE + [(bool, bool)], eq)
+EQ[LuaTable, LuaTable] = table_eq
 
 def eq_event(a, b):
-    pass
+    # values of different types are never equal, but int and float are
+    # both numbers
+    op = EQ.get((type(a), type(b)))
+    if op is not None:
+        return op(a, b)
+    return a is b
 
 def gt_event(a, b):
     return lt_event(b, a)
@@ -55,33 +671,166 @@ def ge_event(a, b):
 def ne_event(a, b):
     return not eq_event(a, b)
 
-def add_event(a, b):
-    if type(a) is int and type(b) is int:
-        return a + b
+def unary_event(ops, name, what):
+    def event(a):
+        op = ops.get(type(a))
+        if op is not None:
+            return op(a)
+        tm = gettm(a, None, name)
+        if tm is None:
+            raise LuaError(f"attempt to {what} a {typename(a)} value")
+        return first(tm(a, a))
+    return event
+
+def str_unm(a):
+    n = str2number(a)
+    if n is None:
+        raise LuaError("attempt to perform arithmetic on a string value")
+    return unm_event(n)
+
+def bnot(a):
+    return ~tointeger(a)
+
+unm_event = unary_event({int: int_unm, float: neg, bytes: str_unm}, b"__unm", "perform arithmetic on")
+bnot_event = unary_event({int: invert, float: bnot, bytes: bnot}, b"__bnot", "perform bitwise operation on")
+
+def len_event(a):
+    if type(a) is bytes:
+        return len(a)
+    if type(a) is LuaTable:
+        tm = fasttm(a.metatable, TM_LEN, b"__len")
+        if tm is None:
+            return a.length()
+        return first(tm(a))
+    raise LuaError(f"attempt to get length of a {typename(a)} value")
+
+def index_event(table, key):
+    if type(table) is not LuaTable:
+        raise LuaError("attempt to index a non-table value")
+    return table[key]
+
+def index_miss(table, key, site, inherit):
+    # site is the [index, shape] of an inline cache, tables without a
+    # shape are indexed by the key itself. inherit is [shape, guards,
+    # holder] of the last key found along the __index tables of a table
+    # of that shape, valid while the tables in guards keep their versions
+    if type(table) is not LuaTable:
+        return index_event(table, key)
+    shape = table.shape
+    if shape is None:
+        site[:] = (key, None)
+        return table.hash[key]
+    i = shape.index.get(key)
+    if i is not None:
+        site[:] = (i, shape)
+        return table.values[i]
+    metatable = table.metatable
+    if metatable is None:
+        return None
+
+    cached, guards, holder = inherit
+    if cached is shape and guards[0][0] is metatable:
+        for t, version in guards:
+            if t.version is not version:
+                break
+        else:
+            value = holder.gethash(key)
+            if value is not None:
+                return value
+
+    guards = []
+    for _ in range(MAXTAGLOOP):
+        metatable = table.metatable
+        tm = fasttm(metatable, TM_INDEX, b"__index")
+        if tm is None:
+            return None
+        guards.append((metatable, metatable.version))
+        if type(tm) is not LuaTable:
+            return first(tm(table, key))
+        value = tm.gethash(key)
+        if value is not None:
+            inherit[:] = (shape, tuple(guards), tm)
+            return value
+        guards.append((tm, tm.version))
+        table = tm
+    raise LuaError("'__index' chain too long; possible loop")
+
+def global_miss(env, key, site):
+    # site is the [version, value] of a cached global, values found
+    # through a metatable are not cached
+    if type(env) is not LuaTable:
+        return index_event(env, key)
+    value = env.gethash(key)
+    if value is None and env.metatable is not None:
+        return index_tm(env, key)
+    site[:] = (env.version, value)
+    return value
+
+def fornumber(value, what):
+    if type(value) is bytes:
+        value = tonumber(None, value)
+    if type(value) not in (int, float):
+        raise LuaError(f"'for' {what} must be a number")
+    return value
 
-def mul_event(a, b):
-    if type(a) is int and type(b) is int:
-        return a * b
+def forlimit(limit, step):
+    # integer limit of an integer loop with a float limit
+    if limit != limit:
+        return None
+    if limit in (float('inf'), float('-inf')):
+        return MAXINTEGER if limit > 0 else MININTEGER
+    return floor(limit) if step > 0 else ceil(limit)
 
-def forloop(sl, var):
-    step, limit = sl
-    var += step
-    if (step >= 0 and var > limit) or (step < 0 and var < limit):
-        return (None,)
+def floatloop(var, limit, step):
+    if step > 0:
+        while var <= limit:
+            yield var
+            var += step
     else:
-        return (var,)
+        while var >= limit:
+            yield var
+            var += step
 
 def forprep(var, limit, step=1):
-    if type(var) is int and type(limit) is int and type(step) is int:
-        return forloop, (step, limit), var - step
+    var = fornumber(var, 'initial value')
+    limit = fornumber(limit, 'limit')
+    step = fornumber(step, 'step')
+    if step == 0:
+        raise LuaError("'for' step is zero")
+
+    if type(var) is int and type(step) is int:
+        if type(limit) is float:
+            limit = forlimit(limit, step)
+            if limit is None:
+                return iter(())
+        if step > 0:
+            return iter(range(var, limit + 1, step))
+        return iter(range(var, limit - 1, step))
+
+    return floatloop(float(var), float(limit), float(step))
 
 
 BUILTINS = {
     'LuaTable': LuaTable,
+    'number_types': frozenset({int, float}),
     'forprep': forprep,
 
-    '.b+': add_event,
-    '.b*': mul_event,
+    'int': int,
+    'wrap': wrap,
+
+    '.b+':   add_event,
+    '.b-':   sub_event,
+    '.b*':   mul_event,
+    '.b/':   div_event,
+    '.b%':   mod_event,
+    '.b^':   pow_event,
+    '.b//':  idiv_event,
+    '.b&':   band_event,
+    '.b|':   bor_event,
+    '.b~':   bxor_event,
+    '.b<<':  shl_event,
+    '.b>>':  shr_event,
+    '.b..':  concat_event,
 
     '.b<':   lt_event,
     '.b<=':  le_event,
@@ -89,6 +838,13 @@ BUILTINS = {
     '.b>=':  ge_event,
     '.b==':  eq_event,
     '.b~=':  ne_event,
+
+    '.u-':   unm_event,
+    '.u~':   bnot_event,
+    '.u#':   len_event,
+
+    '.index': index_miss,
+    '.global': global_miss,
 }
 
 def tonumber(_ENV, e, base=None):
@@ -101,30 +857,92 @@ def tonumber(_ENV, e, base=None):
         if base is None:
             return strtod(e)
 
-def load(_ENV, chunk, filename=None, mode=b't', env=None):
+def setmetatable(_ENV, table, metatable=None):
+    if type(table) is not LuaTable:
+        raise LuaError("bad argument #1 to 'setmetatable' (table expected)")
+    if metatable is not None and type(metatable) is not LuaTable:
+        raise LuaError("bad argument #2 to 'setmetatable' (nil or table expected)")
+    if table.metatable is not None and table.metatable.gethash(b"__metatable") is not None:
+        raise LuaError("cannot change a protected metatable")
+    table.setmetatable(metatable)
+    return table
+
+def getmetatable(_ENV, obj):
+    if type(obj) is not LuaTable or obj.metatable is None:
+        return None
+    protected = obj.metatable.gethash(b"__metatable")
+    return obj.metatable if protected is None else protected
+
+def rawget(_ENV, table, key):
+    if type(table) is not LuaTable:
+        raise LuaError("bad argument #1 to 'rawget' (table expected)")
+    return table.rawget(key)
+
+def rawset(_ENV, table, key, value):
+    if type(table) is not LuaTable:
+        raise LuaError("bad argument #1 to 'rawset' (table expected)")
+    table.rawset(key, value)
+    return table
+
+def load(_ENV, chunk, filename=None, mode=b't', env=None, chunks=None, lazy=False):
     if env is None:
         env = _ENV
     if filename is None:
         filename = b'<string>'
-    if mode == b't':
-        code = compile(chunk.decode(), filename.decode())
+    key = (chunk, filename, mode)
+    code = None if chunks is None else chunks.get(key)
+    if code is None:
+        if mode == b't':
+            code = compile(chunk, fsdecode(filename), lazy=lazy)
+        if chunks is not None:
+            chunks.put(key, code)
     return FunctionType(code, {"__builtins__": BUILTINS, "_ENV": env})
 
-def loadfile(_ENV, filename=None, mode=b't', env=None):
+# files at least this large are mapped and compiled one statement at a time
+STREAM_SIZE = 1 << 22
+
+def loadfile(_ENV, filename=None, mode=b't', env=None, cache=None, chunks=None, lazy=False):
     with open(filename, 'rb') as f:
-        source = f.read()
-    return load(_ENV, source, filename, mode, env)
+        if fstat(f.fileno()).st_size < STREAM_SIZE:
+            source = f.read()
+        else:
+            source = mmap(f.fileno(), 0, access=ACCESS_READ)
+    if cache is None and isinstance(source, bytes):
+        return load(_ENV, source, filename, mode, env, chunks, lazy)
+
+    if env is None:
+        env = _ENV
+    filename = fsencode(filename)
+    # code of lazy functions cannot be marshalled
+    lazy = lazy and cache is None
+    try:
+        code = None if cache is None else cache.get(source, filename)
+        if code is None:
+            if isinstance(source, bytes):
+                code = compile(source, fsdecode(filename), lazy=lazy)
+            else:
+                code = compile_stream(source, fsdecode(filename), lazy=lazy)
+            if cache is not None:
+                cache.put(source, filename, code)
+    finally:
+        if not isinstance(source, bytes):
+            source.close()
+    return FunctionType(code, {"__builtins__": BUILTINS, "_ENV": env})
 
 
 def wraps(func, env):
     def wrapper(*args):
-        return func(env, *args)
+        return (func(env, *args),)
     return wrapper
 
 
-def luaopen(env):
+def luaopen(env, cache=None, chunks=None, lazy=False):
     env[b"_G"] = env
-    env[b"load"] = wraps(load, env)
-    env[b"loadfile"] = wraps(loadfile, env)
+    env[b"load"] = wraps(partial(load, chunks=chunks, lazy=lazy), env)
+    env[b"loadfile"] = wraps(partial(loadfile, cache=cache, chunks=chunks, lazy=lazy), env)
     env[b"tonumber"] = wraps(tonumber, env)
+    env[b"setmetatable"] = wraps(setmetatable, env)
+    env[b"getmetatable"] = wraps(getmetatable, env)
+    env[b"rawget"] = wraps(rawget, env)
+    env[b"rawset"] = wraps(rawset, env)
     return env
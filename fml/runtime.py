@@ -1,8 +1,16 @@
+from functools import partial
+from .lib.base import LuaTable
+from .compile.cache import ChunkCache
+
+
 class LuaState:
 
-    def __init__(self):
+    def __init__(self, cache=None, maxchunks=256, lazy=False):
         self.loaded = {}
-        self._ENV = {}
+        self.cache = cache
+        self.lazy = lazy
+        self.chunks = ChunkCache(maxchunks)
+        self._ENV = LuaTable()
 
     def require(self, name, func):
         if name not in self.loaded:
@@ -11,10 +19,10 @@ class LuaState:
 
     def loadlibs(self):
         from .lib import base
-        self.require(b"_G", base.luaopen)
+        self.require(b"_G", partial(base.luaopen, cache=self.cache, chunks=self.chunks, lazy=self.lazy))
 
     def load(self, *args):
-        return self._ENV[b"load"](*args)
+        return self._ENV[b"load"](*args)[0]
 
     def loadfile(self, *args):
-        return self._ENV[b"loadfile"](*args)
+        return self._ENV[b"loadfile"](*args)[0]
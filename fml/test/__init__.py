@@ -1,4 +1,6 @@
 def load_tests(loader, tests, pattern):
     tests.addTests(loader.loadTestsFromName(f'{__package__}.test_compile'))
     tests.addTests(loader.loadTestsFromName(f'{__package__}.test_lang'))
+    tests.addTests(loader.loadTestsFromName(f'{__package__}.test_table'))
+    tests.addTests(loader.loadTestsFromName(f'{__package__}.test_cache'))
     return tests
@@ -0,0 +1,108 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from ..runtime import LuaState
+from ..compile.cache import CodeCache
+
+
+class TestCodeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.filename = os.path.join(self.tmpdir.name, 'a.lua')
+        self.write(b"local a = ...; return a + 1, 10")
+        self.cachedir = os.path.join(self.tmpdir.name, 'cache')
+
+    def write(self, source):
+        with open(self.filename, 'wb') as f:
+            f.write(source)
+
+    def loadfile(self, cache):
+        state = LuaState(cache)
+        state.loadlibs()
+        return state.loadfile(self.filename)
+
+    def test_hit(self):
+        cache = CodeCache(self.cachedir)
+        self.assertEqual(self.loadfile(cache)(1), (2, 10))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(len(os.listdir(self.cachedir)), 1)
+
+        cache = CodeCache(self.cachedir)
+        self.assertEqual(self.loadfile(cache)(2), (3, 10))
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_source_changed(self):
+        cache = CodeCache(self.cachedir)
+        self.loadfile(cache)
+        self.write(b"return 42")
+        self.assertEqual(self.loadfile(cache)(), (42,))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(len(os.listdir(self.cachedir)), 2)
+
+    def test_corrupted(self):
+        cache = CodeCache(self.cachedir)
+        self.loadfile(cache)
+        for name in os.listdir(self.cachedir):
+            with open(os.path.join(self.cachedir, name), 'wb') as f:
+                f.write(b'\xe3')
+        self.assertEqual(self.loadfile(cache)(1), (2, 10))
+        self.assertEqual(self.loadfile(cache)(1), (2, 10))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_readonly(self):
+        cache = CodeCache(self.cachedir, readonly=True)
+        self.assertEqual(self.loadfile(cache)(1), (2, 10))
+        self.assertFalse(os.path.exists(self.cachedir))
+
+        self.loadfile(CodeCache(self.cachedir))
+        self.assertEqual(self.loadfile(cache)(1), (2, 10))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+    def test_lazy(self):
+        # lazy functions cannot be marshalled, so cached chunks are eager
+        self.write(b"local function f(a) return a + 1, 10 end; return f(...)")
+        cache = CodeCache(self.cachedir)
+        state = LuaState(cache, lazy=True)
+        state.loadlibs()
+        self.assertEqual(state.loadfile(self.filename)(1), (2, 10))
+        self.assertEqual(len(os.listdir(self.cachedir)), 1)
+
+    def test_stream(self):
+        from unittest.mock import patch
+        from ..lib import base
+        with patch.object(base, 'STREAM_SIZE', 0):
+            self.assertEqual(self.loadfile(None)(1), (2, 10))
+            cache = CodeCache(self.cachedir)
+            self.assertEqual(self.loadfile(cache)(1), (2, 10))
+            self.assertEqual(self.loadfile(cache)(2), (3, 10))
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+class TestChunkCache(unittest.TestCase):
+
+    def test_load(self):
+        state = LuaState(maxchunks=2)
+        state.loadlibs()
+        env = state.load(b"return {}")()[0]
+        f = state.load(b"return x", None, b't', env)
+        g = state.load(b"return x")
+        self.assertIs(f.__code__, g.__code__)
+        self.assertIs(f.__globals__["_ENV"], env)
+        self.assertIs(g.__globals__["_ENV"], state._ENV)
+        state.load(b"return x", b"x")
+        chunks = state.chunks
+        self.assertEqual((chunks.hits, chunks.misses, chunks.evictions), (1, 3, 1))
+
+        self.assertEqual(state.load(b"return {}")()[0].length(), 0)
+        self.assertEqual((chunks.hits, chunks.misses, chunks.evictions), (1, 4, 2))
+        self.assertEqual(list(chunks.codes), [(b"return x", b"x", b't'), (b"return {}", b"<string>", b't')])
+
+    def test_disabled(self):
+        state = LuaState(maxchunks=0)
+        state.loadlibs()
+        state.load(b"return 1")
+        self.assertEqual(state.load(b"return 1")(), (1,))
+        self.assertEqual((state.chunks.hits, state.chunks.misses), (0, 2))
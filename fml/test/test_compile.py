@@ -1,39 +1,333 @@
 import unittest
-from ..compile import compile
+from types import CodeType, FunctionType
+from ..compile import compile, compile_stream, LuaLexer, LuaScanner, LuaParser, LuaDescentParser
+from ..lib.base import BUILTINS, LuaTable
+from sly.lex import Token as SlyToken
 
 
 class TestLexer(unittest.TestCase):
 
     def test_bad_character(self):
         with self.assertRaisesRegex(SyntaxError, 'Bad character'):
-            compile('!', 'stdin')
+            compile(b'!', 'stdin')
+
+    SOURCES = [
+        "#!/usr/bin/env lua\nlocal a = 1",
+        "local function f(a, ...) return a .. 'x' .. ... end",
+        "a = {1, 2.5, .5, 3., 0x1F, 0xA.8p1, 1e10, 2E-3, 3..4}",
+        "a = b // c << d >> e ~= f == g <= h >= i & j | ~k ^ #l % m",
+        "::top:: goto top; a.b:c()",
+        "x = 'single' .. \"double\" .. 'esc\\n\\t\\'q' .. \"\\65\\x41\\u{41}\\z   \n  z\"",
+        "x = [[\nlong\nstring]] .. [==[with ]] inside]==] y = a[ [[k]] ]",
+        "-- comment\n--[[ long\ncomment ]] a --[==[\n]==] = 1 --[ short\n--[[ unclosed\nb = 2",
+        "x = [=[ unclosed",
+        "a = b..5 .. c...d",
+        "x = 1 --[[ long comment at the end ]]",
+        "if a then elseif b then else end while c do break end repeat until d",
+        "for i = 1, 10 do local t = {[i] = true, n = nil, f = false} end",
+    ]
+
+    def test_scanner(self):
+        # LuaLexer scans str, only its STRING values are bytes
+        def value(t):
+            if t.type in ('NAME', 'NUMBER', 'LONGSTRING', 'SHEBANG'):
+                return t.value.encode()
+            return t.value
+
+        for source in self.SOURCES:
+            with self.subTest(source=source):
+                lexed = list(LuaLexer('stdin').tokenize(source))
+                scanned = list(LuaScanner('stdin').tokenize(source.encode()))
+                expected = [(t.type, value(t), t.lineno, t.index) for t in lexed]
+                self.assertEqual([(t.type, t.value, t.lineno, t.index) for t in scanned], expected)
+                # sly tokens record their end from sly 0.5 on
+                if 'end' in SlyToken.__slots__:
+                    self.assertEqual([t.end for t in scanned], [t.end for t in lexed])
+
+    def test_escape(self):
+        tokens = LuaScanner('stdin').tokenize(b"'\\65\\x41\\u{41}\\u{20AC}\\255\\z  \\n'")
+        self.assertEqual([t.value for t in tokens], [b"AAA\xe2\x82\xac\xff\n"])
+
+    def test_scanner_bad_character(self):
+        for source in ('a = "unclosed', 'a = 1\n  \r', '$'):
+            with self.subTest(source=source):
+                with self.assertRaisesRegex(SyntaxError, 'Bad character') as cm:
+                    compile(source.encode(), 'stdin')
+                with self.assertRaises(SyntaxError) as expected:
+                    list(LuaLexer('stdin').tokenize(source))
+                self.assertEqual(cm.exception.args, expected.exception.args)
 
 
 class TestParser(unittest.TestCase):
 
     def test_invalid_token(self):
         with self.assertRaisesRegex(SyntaxError, 'Invalid token'):
-            compile(')', 'stdin')
+            compile(b')', 'stdin')
+
+    def test_tables(self):
+        from sly.yacc import LRTable
+        from ..compile import parsetab
+        from ..compile.parse import LuaParser, grammar_signature
+        self.assertEqual(parsetab.signature, grammar_signature(LuaParser._grammar))
+        self.assertIs(LuaParser._lrtable, parsetab)
+        lrtable = LRTable(LuaParser._grammar)
+        self.assertEqual(parsetab.lr_action, lrtable.lr_action)
+        self.assertEqual(parsetab.lr_goto, lrtable.lr_goto)
+        self.assertEqual(parsetab.defaulted_states, lrtable.defaulted_states)
+
+
+class TestNodes(unittest.TestCase):
+
+    def test_slots(self):
+        from ..compile import ast
+        node = ast.Name(id=b'x', lineno=1, index=0)
+        node.symbol = None
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.unknown = None
+        self.assertEqual(node, ast.Name(id=b'x', lineno=1, index=0))
+
+
+class TestVisitor(unittest.TestCase):
+
+    def test_dispatch(self):
+        from ..compile import ast
+
+        class Base(ast.Visitor):
+            @_(ast.Expression)
+            def visit(self, node):
+                return 'expression'
+
+            @_(ast.Name)
+            def visit(self, node):
+                return 'name'
+
+        class Derived(Base):
+            @_(ast.Number)
+            def visit(self, node):
+                return 'number'
+
+        name = ast.Name(id=b'x', lineno=1, index=0)
+        number = ast.Number(n=b'1', lineno=1, index=0)
+        string = ast.String(s=b'', lineno=1, index=0)
+        visitor = Derived()
+        self.assertEqual([visitor.visit(n) for n in (name, number, string)], ['name', 'number', 'expression'])
+        self.assertIs(visitor.visit, visitor.visit)
+        self.assertEqual(Base().visit(number), 'expression')
+        with self.assertRaises(KeyError):
+            visitor.visit(ast.Break(lineno=1, index=0))
+
+
+class TestDescentParser(unittest.TestCase):
+
+    SOURCES = [
+        b"",
+        b"#!/usr/bin/env lua\nreturn",
+        b"return 1;",
+        b"local a; local b, c = 1, 2, 3; a, b.c, b[c] = ...",
+        b";;; do local x end; ::l:: goto l; while x do break end repeat x = x - 1 until x < 0",
+        b"if a then b() elseif c then d() elseif e then else f() end if a then end",
+        b"for i = 1, 10 do end for i = 10, 1, -1 do end for k, v in pairs(t) do end",
+        b"function f() end function a.b.c:d(x, ...) return self end local function g(...) end",
+        b"f = function(a, b) return a end, function(...) end",
+        b"return 1 + 2 * 3 ^ -4 ^ 5 .. 'a' .. 'b' == 6 and not x or y < z ~= w",
+        b"return a | b ~ c & d << e >> f // g % h / i - -j + #k - ~l",
+        b"return - x ^ 2, not a == b, 1 .. 2 + 3, a < b <= c > d >= e",
+        b"f() f 'a' f [[b]] f {} a.b:c(1)(2) ('x'):rep(3) (g)()",
+        b"x = (a).b, (f()), (a + b)[c], a.b.c[d].e",
+        b"t = {} t = {1, 2; 3,} t = {[1] = 2, a = b, c, d = e == f; g}",
+        b"return {f = function() end, {}, {{}}, ...}",
+    ]
+
+    def parse(self, parser, source):
+        return parser('stdin', source).parse(LuaScanner('stdin').tokenize(source))
+
+    def test_same_tree(self):
+        for source in self.SOURCES:
+            with self.subTest(source=source):
+                self.assertEqual(
+                    self.parse(LuaDescentParser, source),
+                    self.parse(LuaParser, source))
+
+    def test_same_error(self):
+        for source in (b"x", b"(a) = 1", b"f() = 1", b"a, f() = 2", b"return 1 x = 2", b"t = {,}",
+                       b"for i do end", b"a = 1 +", b"if x then"):
+            with self.subTest(source=source):
+                try:
+                    self.parse(LuaParser, source)
+                except (SyntaxError, EOFError) as e:
+                    expected = e
+                with self.assertRaises(type(expected)) as cm:
+                    self.parse(LuaDescentParser, source)
+                self.assertEqual(cm.exception.args, expected.args)
 
 
 class TestScope(unittest.TestCase):
 
     def test_label_already_defined(self):
         with self.assertRaisesRegex(SyntaxError, "label 'a' already defined on line 1"):
-            compile("::a::\n::a::", 'stdin')
+            compile(b"::a::\n::a::", 'stdin')
+
 
+    def test_slot_reuse(self):
+        code = compile(b"do local a = 1 end do local b = 2 end if a then local c = 3 else local d, e = 4 end local f = 5", 'stdin')
+        self.assertEqual(code.co_varnames, ('...', 'a', 'e'))
+        code = compile(b"local a = 1; local a = a + 1; local b = 2; for i = 1, 2 do end for j = 1, 2 do end", 'stdin')
+        self.assertEqual(code.co_varnames, ('...', 'a', 'a', 'b', '.0f', '.0s', '.0v', 'i'))
+        code = compile(b"do local a = 1; f = function() return a end end do local b = 2 end", 'stdin')
+        self.assertEqual((code.co_varnames, code.co_cellvars), (('...', 'b'), ('a',)))
 
     def test_ellipsis_outside_vararg_function(self):
         with self.assertRaisesRegex(SyntaxError, "cannot use '...' outside a vararg function"):
-            compile("function a() return ... end", 'stdin')
+            compile(b"function a() return ... end", 'stdin')
 
 
 class TestGoto(unittest.TestCase):
 
     def test_no_visible_label(self):
         with self.assertRaisesRegex(SyntaxError, "no visible label"):
-            compile("goto a", 'stdin')
+            compile(b"goto a", 'stdin')
+
+    def test_nested(self):
+        compile(b"local f = function(n) goto done; n = n - 1; ::done:: return n end", 'stdin')
+        with self.assertRaisesRegex(SyntaxError, "no visible label 'b'"):
+            compile(b"local f = function() goto b end", 'stdin')
 
     def test_jumps_into_the_scope_of_local(self):
         with self.assertRaisesRegex(SyntaxError, "jumps into the scope of local"):
-            compile("goto b; local x = 1; :: b ::", 'stdin')
+            compile(b"goto b; local x = 1; :: b ::", 'stdin')
+
+
+class TestAssembler(unittest.TestCase):
+
+    def test_constants(self):
+        from math import nan
+        from ..compile.asm import Instruction, get_constants, opmap
+        values = [1, 1.0, True, 0.0, -0.0, nan, float('nan'), 'a', ''.join('a'), b'a', (1,), (1.0,), (1,), None]
+        insts = [Instruction(opmap["LOAD_CONST"], v) for v in values]
+        constants = get_constants(insts)
+        self.assertEqual(len(constants), 11)
+        self.assertEqual([inst.slot for inst in insts], [0, 1, 2, 3, 4, 5, 5, 6, 6, 7, 8, 9, 8, 10])
+        self.assertIs(type(constants[1]), float)
+        self.assertIs(type(constants[2]), bool)
+
+    def test_dedupe_strings(self):
+        code = compile(b'return "abc", "abc", "abc"', 'stdin')
+        self.assertEqual(code.co_consts.count(b"abc"), 1)
+        self.assertNotIn("abc", code.co_consts)
+
+
+class TestStream(unittest.TestCase):
+
+    PROGRAMS = [
+        b"#!/usr/bin/env lua\nlocal a, b = ...; return a, b",
+        b"local a = 1; goto skip; a = 100; ::skip:: local function f(x) return x + a end; return f(1), a",
+        b"local s = 0; for i = 1, 3 do local function f() return i end; s = s * 10 + f() end; return s",
+        b"x = 1; local function f() x = x + 1; return x end; f(); return f(), x",
+        b"local n = ...; goto done; do return 0 end ::done:: return n",
+    ]
+
+    def run_chunk(self, code, *args):
+        return FunctionType(code, {"__builtins__": BUILTINS, "_ENV": LuaTable()})(*args)
+
+    def test_same_result(self):
+        for program in self.PROGRAMS:
+            with self.subTest(program=program):
+                self.assertEqual(
+                    self.run_chunk(compile_stream(program, 'stdin'), 5, 6),
+                    self.run_chunk(compile(program, 'stdin'), 5, 6))
+
+    def test_goto(self):
+        with self.assertRaisesRegex(SyntaxError, "no visible label 'a'"):
+            compile_stream(b"goto a; local x; ::b::", 'stdin')
+        with self.assertRaisesRegex(SyntaxError, "jumps into the scope of local 'x'"):
+            compile_stream(b"goto b; local x = 1; :: b ::", 'stdin')
+
+    def test_mmap(self):
+        from mmap import mmap
+        source = b"local a = ...\nreturn a + 1\n!"
+        buf = mmap(-1, len(source))
+        buf.write(source)
+        with self.assertRaisesRegex(SyntaxError, "Bad character") as cm:
+            compile_stream(buf, 'stdin')
+        self.assertEqual(cm.exception.lineno, 3)
+        buf.resize(len(source) - 2)
+        self.assertEqual(self.run_chunk(compile_stream(buf, 'stdin'), 1), (2,))
+
+
+class TestStats(unittest.TestCase):
+
+    def test_counts(self):
+        from ..compile import CompileStats
+        source = b"local a = 1; local function f(x) return x + a end; return f(2), 'x'"
+        stats = CompileStats()
+        code = compile(source, 'stdin', stats=stats)
+        inner = [c for c in code.co_consts if isinstance(c, CodeType)]
+        codes = [code] + inner
+        self.assertEqual(stats.tokens, len(list(LuaScanner('stdin').tokenize(source))))
+        self.assertEqual(stats.nodes, 18)
+        self.assertEqual(stats.functions, 2)
+        self.assertEqual(stats.bytecode, sum(len(c.co_code) for c in codes))
+        self.assertEqual(stats.instructions, stats.bytecode // 2)
+        self.assertEqual(stats.constants, sum(len(c.co_consts) for c in codes))
+        self.assertEqual(stats.stacksize, max(c.co_stacksize for c in codes))
+        self.assertEqual(set(stats.times), set(CompileStats.PHASES))
+        self.assertTrue(all(t >= 0 for t in stats.times.values()))
+
+    def test_main(self):
+        import io, os
+        from contextlib import redirect_stdout
+        from tempfile import TemporaryDirectory
+        from ..__main__ import main
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'a.lua')
+            with open(filename, 'wb') as f:
+                f.write(b"return 1")
+            out = io.StringIO()
+            with redirect_stdout(out):
+                main(['--compile-stats', filename])
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], filename)
+        self.assertIn('functions:             1', lines)
+
+
+def count_instructions(code):
+    count = len(code.co_code) // 2
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            count += count_instructions(const)
+    return count
+
+
+class TestPeephole(unittest.TestCase):
+
+    PROGRAMS = [
+        b"local a = 0; if a then a = 1 end; return a",
+        b"local a, b = 1, 0; while a < 10 do a = a + 1; if a == 5 then break end end; return a",
+        b"local a = 1; repeat a = a * 2 until a > 100; return a",
+        b"local function f(x) if x then return 1 else return 2 end end; return f(nil), f(false), f(0), f('')",
+        b"local s = 0; for i = 1, 3 do for j = 1, 3 do s = s + i * j end end; return s",
+    ]
+
+    def run_chunk(self, code):
+        return FunctionType(code, {"__builtins__": BUILTINS, "_ENV": LuaTable()})()
+
+    def test_instruction_count(self):
+        for program in self.PROGRAMS:
+            with self.subTest(program=program):
+                plain = compile(program, 'stdin', optimize=False)
+                optimized = compile(program, 'stdin')
+                self.assertLess(count_instructions(optimized), count_instructions(plain))
+                self.assertEqual(self.run_chunk(optimized), self.run_chunk(plain))
+
+    def test_dead_code(self):
+        code = compile(b"do return 1 end; local a = 2; return a", 'stdin')
+        self.assertNotIn(2, code.co_consts)
+
+    def test_thread_jumps(self):
+        from dis import get_instructions
+        code = compile(b"while true do if 1 < 2 then local a = 1 end end", 'stdin')
+        insts = {inst.offset: inst for inst in get_instructions(code)}
+        for inst in insts.values():
+            if inst.opname in {'JUMP_ABSOLUTE', 'POP_JUMP_IF_FALSE', 'POP_JUMP_IF_TRUE'}:
+                self.assertNotEqual(insts[inst.argval].opname, 'JUMP_ABSOLUTE')
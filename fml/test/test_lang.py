@@ -1,5 +1,7 @@
 import unittest
+from math import isnan
 from ..runtime import LuaState
+from ..lib.base import LuaTable, LuaError
 
 
 class TestLang(unittest.TestCase):
@@ -22,6 +24,60 @@ class TestLang(unittest.TestCase):
         mod = self.state.load(b"return ...")
         self.assertEqual(mod(1, 2, 3), (1, 2, 3))
 
+    def test_call(self):
+        mod = self.state.load(b'local function f(a, b) return a, b end; return f(1), f(1, 2, 3)')
+        self.assertEqual(mod(), (1, 1, 2))
+        mod = self.state.load(b'local function f() return 1, 2 end; local a, b, c = f(); local d = f(); return a, b, c, d')
+        self.assertEqual(mod(), (1, 2, None, 1))
+        mod = self.state.load(b'local function f(...) return ... end; return f(f(1, 2))')
+        self.assertEqual(mod(), (1, 2))
+        mod = self.state.load(b'local function f() end; local a = 1; a = f(); return a')
+        self.assertEqual(mod(), (None,))
+
+    def test_globals(self):
+        self.state._ENV[b"x"] = 1
+        mod = self.state.load(b"y = x + 1; return x, y, 'x', [[y]]")
+        self.assertEqual(mod(), (1, 2, b"x", b"y"))
+        self.assertEqual(self.state._ENV[b"y"], 2)
+
+    def test_global_cache(self):
+        mod = self.state.load(b"local f = function () return x end; local a = f(); x = 2; return a, f()")
+        self.assertEqual(mod(), (None, 2))
+        self.state._ENV[b"x"] = 3
+        self.assertEqual(mod(), (3, 2))
+        mod = self.state.load(b"return load('return x', nil, 't', {x = 4})(), load('return x', nil, 't', {x = 5})(), x")
+        self.assertEqual(mod(), (4, 5, 2))
+        for source in (b"return load('return x', nil, 't', 5)()", b"local _ENV = nil; return x"):
+            with self.assertRaisesRegex(LuaError, 'attempt to index'):
+                self.state.load(source)()
+
+    def test_logical(self):
+        mod = self.state.load(b"local a, b = ...; return a and b, a or b, not a")
+        self.assertEqual(mod(None, 1), (None, 1, True))
+        self.assertEqual(mod(False, 1), (False, 1, True))
+        self.assertEqual(mod(0, 1), (1, 0, False))
+        self.assertEqual(mod(b"", None), (None, b"", False))
+        mod = self.state.load(b"local a, b = ...; return 1 < 2 and a, 2 < 1 or b, not (1 < 2)")
+        self.assertEqual(mod(0, 0), (0, 0, False))
+
+    def test_condition(self):
+        mod = self.state.load(b"""
+local a, b = ...
+local r = 0
+if a and b then r = r + 1 end
+if a or b then r = r + 2 end
+if not a then r = r + 4 end
+if not (a and b) or false then r = r + 8 end
+while a and r < 100 do r = r + 100 end
+return r""")
+        self.assertEqual(mod(0, b""), (103,))
+        self.assertEqual(mod(None, 0), (14,))
+        self.assertEqual(mod(False, None), (12,))
+
+    def test_recursion(self):
+        mod = self.state.load(b'function fib(n) if n < 2 then return n end; return fib(n-1) + fib(n-2) end; return fib(10)')
+        self.assertEqual(mod(), (55,))
+
     def test_assign(self):
         mod = self.state.load(b"a, b = ...; return b, a")
         self.assertEqual(mod(1, 2), (2, 1))
@@ -51,7 +107,243 @@ class TestLang(unittest.TestCase):
     def test_for(self):
         mod = self.state.load(b'local a = 0; for i = 0, 10 do a = a + i end; return a')
         self.assertEqual(mod(), (55,))
+        mod = self.state.load(b'local a = 0; for i = 10, 1, 0 - 3 do a = a * 10 + i end; return a')
+        self.assertEqual(mod(), (10741,))
+        mod = self.state.load(b'local a = 0; for i = 0, 1, 0.25 do a = a + i end; return a')
+        self.assertEqual(mod(), (2.5,))
+        mod = self.state.load(b'local a = 0; for i = 1, 3.5 do a = a + i end; return a')
+        self.assertEqual(mod(), (6,))
+        mod = self.state.load(b'local a = 0; for i = 1, 10 do if i > 3 then break end; a = a + i end; return a')
+        self.assertEqual(mod(), (6,))
+        mod = self.state.load(b'for i = 1, 10, 0 do end')
+        with self.assertRaisesRegex(LuaError, "'for' step is zero"):
+            mod()
 
     def test_foreach(self):
         mod = self.state.load(b'local a = 0; for i in function(s, v) if v < s then return v + 1 end end, 10, 0 do a = a + i end; return a')
         self.assertEqual(mod(), (55,))
+
+    def test_goto(self):
+        # a backward goto brings the shadowed local back into scope
+        mod = self.state.load(b"local n = 0; local a = 1; ::l:: n = n + 1; local first = a; if n == 2 then return n, first end; local a = 2; local b = 3; goto l")
+        self.assertEqual(mod(), (2, 1))
+
+    def test_table(self):
+        mod = self.state.load(b'local t = {1, 2, 3}; return #t')
+        self.assertEqual(mod(), (3,))
+        mod = self.state.load(b'local t = {1, 2, x = 1, ...}; return #t')
+        self.assertEqual(mod(3, 4), (4,))
+        mod = self.state.load(b'local t = {x = 1, y = 2}; return #t')
+        self.assertEqual(mod(), (0,))
+        # true and 1, false and 0 are different keys
+        mod = self.state.load(b'local t = {[1] = "a", [true] = "b", [0] = "c", [false] = "d"}; return t[1], t[true], t[0], t[false]')
+        self.assertEqual(mod(), (b"a", b"b", b"c", b"d"))
+        mod = self.state.load(b'local t = {"a", [true] = "b", [0] = "c", [false] = "d", [2.0] = "e"}; return t[1], t[true], t[0], t[false], t[2]')
+        self.assertEqual(mod(), (b"a", b"b", b"c", b"d", b"e"))
+
+    def test_field(self):
+        mod = self.state.load(b'local t = {x = 1}; t.y = 2; t["z"] = 3; local k = "x"; return t.x, t["y"], t.z, t[k], t.w')
+        self.assertEqual(mod(), (1, 2, 3, 1, None))
+        mod = self.state.load(b'local t = {a = {b = {}}}; t.a.b.c = 1; t.a.b[1] = 2; return t.a.b.c, t.a.b[1]')
+        self.assertEqual(mod(), (1, 2))
+
+    def test_field_cache(self):
+        # one site sees tables of different shapes and without a shape
+        mod = self.state.load(b'local function get(t) return t.x end; return get(...)')
+        for t in ({b"x": 1}, {b"y": 2, b"x": 3}, {b"x": 4, 0.5: 5}, {b"x": 6}, {0.5: 7}, {b"x": 8}):
+            self.assertEqual(mod(LuaTable(None, t)), (t.get(b"x"),))
+        mod = self.state.load(b'local t = {x = 1}; local function get() return t.x end; local a = get(); t.x = 2; local b = get(); t.x = nil; return a, b, get()')
+        self.assertEqual(mod(), (1, 2, None))
+        mod = self.state.load(b'local t = ...; return t.x')
+        with self.assertRaisesRegex(LuaError, 'attempt to index'):
+            mod(1)
+
+    def test_method(self):
+        mod = self.state.load(b"""
+local obj = {n = 1}
+function obj.add(self, k) return self.n + k end
+function obj:sum(...) return self:add(...), self:add(2) end
+local m = {sub = {}}
+function m.sub.f(a) return a end
+return obj:add(1), m.sub.f(4), obj:sum(3)""")
+        self.assertEqual(mod(), (2, 4, 4, 3))
+
+    def test_metatable(self):
+        mod = self.state.load(b"""
+local log = {}
+local mt = {__index = function(t, k) return k end, __newindex = function(t, k, v) log[k] = v end}
+local t = setmetatable({x = 1}, mt)
+t.y = 2
+t.x = 3
+return t.x, t.y, t.z, t[1], log.y, rawget(t, "y"), getmetatable(t) == mt""")
+        self.assertEqual(mod(), (3, b"y", b"z", 1, 2, None, True))
+        # tables without a shape share the cache of a site
+        mod = self.state.load(b'local function get(t) return t.x end; local t = {[0.5] = 1}; local a = get(t); setmetatable(t, {__index = {x = 2}}); return a, get(t)')
+        self.assertEqual(mod(), (None, 2))
+        mod = self.state.load(b'local t = setmetatable({}, {__metatable = false}); return getmetatable(t), setmetatable(t, {})')
+        with self.assertRaisesRegex(LuaError, 'protected metatable'):
+            mod()
+
+    def test_inherit(self):
+        mod = self.state.load(b"""
+local Base = {}
+Base.__index = Base
+function Base:get() return self.x end
+function Base:name() return "base" end
+local Derived = setmetatable({}, {__index = Base})
+Derived.__index = Derived
+function Derived:name() return "derived" end
+local function call(o) return o:get(), o:name() end
+local b, d = setmetatable({x = 1}, Base), setmetatable({x = 2}, Derived)
+local r = {call(b)}
+r[3], r[4] = call(d)
+r[5], r[6] = call(d)
+function Derived:get() return self.x * 10 end
+r[7] = call(d)
+function Base:get() return self.x + 100 end
+r[8] = call(b)
+return r[1], r[2], r[3], r[4], r[5], r[6], r[7], r[8]""")
+        self.assertEqual(mod(), (1, b"base", 2, b"derived", 2, b"derived", 20, 101))
+
+    def test_global_metatable(self):
+        mod = self.state.load(b"""
+local fallback = {x = 1}
+setmetatable(_ENV, {__index = fallback})
+local function get() return x end
+local a = get()
+fallback.x = 2
+local b = get()
+x = 3
+return a, b, get()""")
+        self.assertEqual(mod(), (1, 2, 3))
+
+    def test_arith(self):
+        mod = self.state.load(b'local a, b = ...; return a + b, a - 1, 2 * b, a < b, 1 <= b, a == 1')
+        self.assertEqual(mod(1, 2), (3, 0, 4, True, True, True))
+        self.assertEqual(mod(1.5, 2), (3.5, 0.5, 4, True, True, False))
+        # booleans are not numbers and have no metamethods
+        mod = self.state.load(b'local a, b = ...; return a + b')
+        with self.assertRaisesRegex(LuaError, 'arithmetic on a boolean value'):
+            mod(True, 1)
+        with self.assertRaisesRegex(LuaError, 'arithmetic on a nil value'):
+            mod(1, None)
+
+    def test_integer(self):
+        mod = self.state.load(b'local a, b = ...; return a + b, a - b, a * b, a + 1, 2 * b, -a')
+        self.assertEqual(mod(2 ** 63 - 1, 1), (-2 ** 63, 2 ** 63 - 2, 2 ** 63 - 1, -2 ** 63, 2, 1 - 2 ** 63))
+        self.assertEqual(mod(-2 ** 63, -1), (2 ** 63 - 1, 1 - 2 ** 63, -2 ** 63, 1 - 2 ** 63, -2, -2 ** 63))
+        self.assertEqual(mod(2 ** 62, 4), (2 ** 62 + 4, 2 ** 62 - 4, 0, 2 ** 62 + 1, 8, -2 ** 62))
+        mod = self.state.load(b'return 9223372036854775807 + 1, 1.5 * 2, 2 ^ 2, 7 // 2, -7 // 2, 7 % -3, -7.5 % 2, 7 / 2')
+        self.assertEqual(mod(), (-2 ** 63, 3.0, 4.0, 3, -4, -2, 0.5, 3.5))
+
+    def test_integer_tree(self):
+        # integers wrap once per tree, numbers after each operation and
+        # anything else goes through the events
+        mod = self.state.load(b'local a, b, c = ...; return a * b + c, (a + b) * c - a, a * b * 0.5 + c, c - a * -b')
+        self.assertEqual(mod(2 ** 62, 4, 1), (1, 4, 1.0, 1))
+        self.assertEqual(mod(2 ** 62, 4, 1.5), (1.5, float(2 ** 62 + 4) * 1.5 - 2 ** 62, 1.5, 1.5))
+        self.assertEqual(mod(b"2", 3, 4), (10, 18, 7.0, 10))
+        with self.assertRaisesRegex(LuaError, 'arithmetic on a nil value'):
+            mod(1, 2)
+
+    def test_division(self):
+        mod = self.state.load(b'local a, b = ...; return a / b, a // b, a % b')
+        self.assertEqual(mod(7, 2.0), (3.5, 3.0, 1.0))
+        self.assertEqual(mod(1, 0.0)[:2], (float('inf'), float('inf')))
+        self.assertEqual(mod(-1.0, 0)[:2], (float('-inf'), float('-inf')))
+        self.assertTrue(isnan(mod(1, 0.0)[2]))
+        with self.assertRaisesRegex(LuaError, "'n//0'"):
+            mod(1, 0)
+        with self.assertRaisesRegex(LuaError, "'n%0'"):
+            self.state.load(b'local a, b = ...; return a % b')(1, 0)
+        mod = self.state.load(b'local a, b = ...; return a ^ b')
+        self.assertEqual(mod(2, 0.5), (2 ** 0.5,))
+        self.assertEqual(mod(10, 400), (float('inf'),))
+        self.assertTrue(isnan(mod(-8, 1 / 3)[0]))
+
+    def test_bitwise(self):
+        mod = self.state.load(b'local a, b = ...; return a & b, a | b, a ~ b, a << b, a >> b, ~a')
+        self.assertEqual(mod(12, 3), (0, 15, 15, 96, 1, -13))
+        self.assertEqual(mod(-1, 60), (60, -1, -61, -2 ** 60, 15, 0))
+        self.assertEqual(mod(1, 64)[3:5], (0, 0))
+        self.assertEqual(mod(4, -1)[3:5], (2, 8))
+        self.assertEqual(mod(3.0, b"1")[:2], (1, 3))
+        with self.assertRaisesRegex(LuaError, 'no integer representation'):
+            mod(1.5, 1)
+        with self.assertRaisesRegex(LuaError, 'bitwise operation on a nil value'):
+            mod(1, None)
+
+    def test_concat(self):
+        mod = self.state.load(b'local a, b = ...; return a .. b')
+        self.assertEqual(mod(b"a", b"b"), (b"ab",))
+        self.assertEqual(mod(1, 2), (b"12",))
+        self.assertEqual(mod(b"x", 1.0), (b"x1.0",))
+        self.assertEqual(mod(0.1, b""), (b"0.1",))
+        self.assertEqual(mod(1e100, b""), (b"1e+100",))
+        with self.assertRaisesRegex(LuaError, 'concatenate a table value'):
+            mod(b"a", LuaTable(None, None))
+
+    def test_coercion(self):
+        mod = self.state.load(b'local a, b = ...; return a + b, a * 2, -a, a .. b')
+        self.assertEqual(mod(b"10", b"0x10"), (26, 20, -10, b"100x10"))
+        self.assertEqual(mod(b" 1.5 ", 1), (2.5, 3.0, -1.5, b" 1.5 1"))
+        with self.assertRaisesRegex(LuaError, 'arithmetic on a string value'):
+            mod(b"x", 1)
+        with self.assertRaisesRegex(LuaError, 'arithmetic on a nil value'):
+            mod(b"1", None)
+
+    def test_compare(self):
+        mod = self.state.load(b'local a, b = ...; return a < b, a <= b, a == b, a ~= b')
+        self.assertEqual(mod(1, 1.5), (True, True, False, True))
+        self.assertEqual(mod(b"a", b"b"), (True, True, False, True))
+        self.assertEqual(mod(1, 1.0), (False, True, True, False))
+        self.assertEqual(mod(2 ** 53 + 1, float(2 ** 53)), (False, False, False, True))
+        mod = self.state.load(b'local a, b = ...; return a == b, a ~= b')
+        self.assertEqual(mod(True, 1), (False, True))
+        self.assertEqual(mod(b"1", 1), (False, True))
+        self.assertEqual(mod(None, None), (True, False))
+        self.assertEqual(mod(False, False), (True, False))
+        mod = self.state.load(b'local a, b = ...; return a < b')
+        with self.assertRaisesRegex(LuaError, 'compare number with string'):
+            mod(1, b"2")
+        with self.assertRaisesRegex(LuaError, 'compare two table values'):
+            mod(LuaTable(None, None), LuaTable(None, None))
+
+    def test_arith_metamethods(self):
+        mod = self.state.load(b"""
+local mt = {}
+local function new(v) return setmetatable({v = v}, mt) end
+local function value(o) if getmetatable(o) == mt then return o.v end; return o end
+mt.__add = function(a, b) return new(value(a) + value(b)) end
+mt.__unm = function(a) return new(0 - a.v) end
+mt.__concat = function(a, b) return "cat" end
+mt.__lt = function(a, b) return a.v < b.v end
+mt.__eq = function(a, b) return a.v == b.v end
+local x, y = new(1), new(2)
+return (x + y).v, (1 + x).v, (x + 1.5).v, (-x).v, x .. "s", 1 .. x, x < y, x <= y, y <= x, x == new(1), x ~= y""")
+        self.assertEqual(mod(), (3, 2, 2.5, -1, b"cat", b"cat", True, True, False, True, True))
+
+    def test_extended_jump(self):
+        body = b'a = a + 0; ' * 4000
+        mod = self.state.load(b'local a = 0; while a < 3 do a = a + 1; ' + body + b'end; return a')
+        self.assertGreater(len(mod.__code__.co_code), 0x10000)
+        self.assertEqual(mod(), (3,))
+
+
+class TestLazyLang(TestLang):
+    """the same programs with nested functions generated on first call"""
+
+    def setUp(self):
+        self.state = LuaState(lazy=True)
+        self.state.loadlibs()
+
+    def test_prototype(self):
+        mod = self.state.load(b'local k = 1; local function mk() return function(x) return x + k end end; return mk(), mk()')
+        f, g = mod()
+        stub = f.__code__
+        self.assertIs(g.__code__, stub)
+        self.assertEqual(f(1), (2,))
+        self.assertIsNot(f.__code__, stub)
+        self.assertIs(g.__code__, stub)
+        self.assertEqual(g(2), (3,))
+        self.assertIs(g.__code__, f.__code__)
@@ -0,0 +1,150 @@
+import sys
+import unittest
+from ..lib.base import LuaTable, LuaError, MAXSHAPEKEYS, TM_INDEX, TM_LEN, fasttm
+
+
+def sizeof(t):
+    return sys.getsizeof(t) + sys.getsizeof(t.array) + sys.getsizeof(t.values)
+
+
+class TestLuaTable(unittest.TestCase):
+
+    def test_sequence(self):
+        t = LuaTable()
+        for i in range(1, 101):
+            t[i] = i * 2
+        self.assertEqual(len(t.array), 100)
+        self.assertEqual(t.values, [])
+        self.assertEqual(t[50], 100)
+        self.assertEqual(t[101], None)
+        self.assertEqual(t.length(), 100)
+
+    def test_migrate_to_array(self):
+        t = LuaTable()
+        for i in range(10, 1, -1):
+            t[i] = i
+        self.assertEqual(t.length(), 0)
+        t[1] = 1
+        self.assertEqual(t.array, list(range(1, 11)))
+        self.assertEqual(t.hash, {})
+        self.assertEqual(t.length(), 10)
+
+    def test_rehash(self):
+        t = LuaTable()
+        t[b"x"] = 1
+        for i in range(64, 17, -1):
+            t[i] = i
+        # more than half of the slots 1..64 are in use
+        self.assertEqual(len(t.array), 64)
+        self.assertEqual(t.hash, {b"x": 1})
+        self.assertEqual(t[17], None)
+        self.assertEqual(t[18], 18)
+        self.assertEqual(t.length(), 64)
+
+    def test_length_border(self):
+        t = LuaTable([1, 2, 3, None, None])
+        self.assertEqual(t.length(), 3)
+        t[3] = None
+        self.assertEqual(t.length(), 2)
+        t = LuaTable([1, 2])
+        t.unshape()
+        t.hash.update({3: 3, 4: 4, 5: 5})
+        self.assertEqual(t.length(), 5)
+
+    def test_keys(self):
+        t = LuaTable()
+        t[1] = b"one"
+        t[True] = b"true"
+        t[2.0] = b"two"
+        t[0.5] = b"half"
+        self.assertEqual(t[1], b"one")
+        self.assertEqual(t[1.0], b"one")
+        self.assertEqual(t[True], b"true")
+        self.assertEqual(t[2], b"two")
+        self.assertEqual(t[0.5], b"half")
+        self.assertEqual(sorted(t.items(), key=repr), sorted([(1, b"one"), (True, b"true"), (2, b"two"), (0.5, b"half")], key=repr))
+        t[True] = None
+        self.assertEqual(t[True], None)
+        self.assertEqual(t[1], b"one")
+
+    def test_invalid_key(self):
+        t = LuaTable()
+        with self.assertRaisesRegex(LuaError, 'table index is nil'):
+            t[None] = 1
+        with self.assertRaisesRegex(LuaError, 'table index is NaN'):
+            t[float('nan')] = 1
+        self.assertEqual(t[None], None)
+
+    def test_constructor(self):
+        t = LuaTable([b"a", b"b"], {1: b"x", 3: b"c", b"k": b"v"})
+        self.assertEqual(t.array, [b"a", b"b", b"c"])
+        self.assertEqual(t.shape.keys, (b"k",))
+        self.assertEqual(t.values, [b"v"])
+
+    def test_shape(self):
+        t = LuaTable(None, {b"x": 1, b"y": 2})
+        u = LuaTable()
+        u[b"x"] = 3
+        u[b"y"] = 4
+        self.assertIs(t.shape, u.shape)
+        self.assertEqual(t.values, [1, 2])
+        self.assertEqual(u[b"y"], 4)
+        self.assertEqual(u[b"z"], None)
+        self.assertIsNot(LuaTable(None, {b"y": 1, b"x": 2}).shape, t.shape)
+
+    def test_unshape(self):
+        t = LuaTable(None, {b"x": 1, b"y": 2})
+        t[b"x"] = None
+        self.assertIsNone(t.shape)
+        self.assertEqual(t.hash, {b"y": 2})
+        t = LuaTable(None, {b"x": 1})
+        t[0.5] = 2
+        self.assertEqual(t.hash, {b"x": 1, 0.5: 2})
+        self.assertEqual(t[b"x"], 1)
+        t = LuaTable()
+        for i in range(MAXSHAPEKEYS + 1):
+            t[b"k%d" % i] = i
+        self.assertIsNone(t.shape)
+        self.assertEqual(t[b"k0"], 0)
+        self.assertEqual(len(t.hash), MAXSHAPEKEYS + 1)
+
+    def test_record_memory(self):
+        t = LuaTable(None, {b"x": 1, b"y": 2, b"id": 3})
+        d = {b"x": 1, b"y": 2, b"id": 3}
+        # the empty array part is shared, and the fields take less than
+        # the dict alone that used to hold them
+        self.assertIs(t.array, ())
+        self.assertLess(sys.getsizeof(t) + sys.getsizeof(t.values), sys.getsizeof(d))
+
+    def test_version(self):
+        t, u = LuaTable(), LuaTable()
+        self.assertNotEqual(t.version, u.version)
+        version = t.version
+        t[b"x"] = 1
+        self.assertNotEqual(t.version, version)
+        version = t.version
+        t[b"x"] = None
+        self.assertNotEqual(t.version, version)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(LuaTable(), '__dict__'))
+
+    def test_memory(self):
+        t = LuaTable()
+        d = {}
+        for i in range(1, 1001):
+            t[i] = i
+            d[i] = i
+        self.assertLess(sizeof(t), sys.getsizeof(d) // 2)
+
+    def test_absent_metamethods(self):
+        mt = LuaTable()
+        t = LuaTable()
+        t.setmetatable(mt)
+        self.assertEqual(t[b"x"], None)
+        self.assertEqual(mt.flags, TM_INDEX)
+        self.assertEqual(fasttm(mt, TM_LEN, b"__len"), None)
+        self.assertEqual(mt.flags, TM_INDEX | TM_LEN)
+        mt[b"__index"] = LuaTable(None, {b"x": 1})
+        self.assertEqual(mt.flags, 0)
+        self.assertEqual(t[b"x"], 1)